@@ -0,0 +1,131 @@
+"""
+Category router module for the JusticeAI application.
+Narrows whole-FAQ searches to the categories a question most likely belongs to.
+"""
+
+import numpy as np
+from scipy.sparse import csr_matrix, vstack
+from sklearn.preprocessing import normalize
+
+# Local imports
+from config import FAQ_ROUTER_CATEGORIES, FAQ_ROUTER_MIN_CONFIDENCE
+
+class CategoryRouter:
+    """Nearest-centroid router over the per-category rows of a whole-FAQ index"""
+
+    def __init__(self, index, max_categories=FAQ_ROUTER_CATEGORIES, min_confidence=FAQ_ROUTER_MIN_CONFIDENCE):
+        """
+        Build category centroids from a fitted question index
+
+        Args:
+            index (QuestionIndex): Index fitted over the whole FAQ
+            max_categories (int): Number of categories searched per question
+            min_confidence (float): Router similarity below which the whole
+                                    FAQ is searched instead
+        """
+        self.index = index
+        self.qa_pairs = index.qa_pairs
+        self.max_categories = max_categories
+        self.min_confidence = min_confidence
+
+        row_categories = [qa["category"] for qa in index.qa_pairs]
+        self.categories = list(dict.fromkeys(row_categories))
+        row_categories = np.array(row_categories, dtype=object)
+
+        # Rows are scored in the whole-FAQ vector space, or its latent space
+        # when the index uses LSA, so routed scores are the scores a global
+        # search would give the same rows (up to float32 rounding for LSA)
+        self.lsa_index = index.lsa_index
+        self.category_rows = [np.flatnonzero(row_categories == category) for category in self.categories]
+
+        if self.lsa_index is not None:
+            self.category_matrices = [np.ascontiguousarray(self.lsa_index.embeddings[rows])
+                                      for rows in self.category_rows]
+            centroids = np.array([matrix.mean(axis=0) for matrix in self.category_matrices], dtype=np.float32)
+            self.centroids = normalize(centroids)
+        else:
+            # Stored transposed, terms by rows, so a query row multiplies
+            # straight into it and only touches the postings of its own terms
+            row_matrices = [index.question_matrix[rows] for rows in self.category_rows]
+            self.category_matrices = [matrix.T.tocsr() for matrix in row_matrices]
+            centroids = [csr_matrix(matrix.mean(axis=0)) for matrix in row_matrices]
+            self.centroids = normalize(vstack(centroids).tocsr())
+
+    def __len__(self):
+        return len(self.qa_pairs)
+
+    def route(self, query_matrix):
+        """
+        Pick the most likely categories for each query
+
+        Args:
+            query_matrix (scipy.sparse matrix or numpy.ndarray): L2-normalised
+                query vectors, or query embeddings when the index uses LSA
+
+        Returns:
+            tuple: (categories, confidences) arrays of shape
+                   (num_queries, max_categories), best category first
+        """
+        scores = query_matrix @ self.centroids.T
+        if not isinstance(scores, np.ndarray):
+            scores = scores.toarray()
+        count = min(self.max_categories, len(self.categories))
+        ranked = np.argsort(-scores, axis=1, kind='stable')[:, :count]
+        return ranked, np.take_along_axis(scores, ranked, axis=1)
+
+    def top_k(self, clean_questions, k, min_score=0.0, block_size=4096):
+        """
+        Rank the k most similar questions, searching only the routed categories
+
+        Only questions the router is unsure about are searched against the
+        whole FAQ, so a routed question never pays for two searches.
+
+        Args:
+            clean_questions (list): Questions already passed through text cleaning
+            k (int): Number of candidates to return per query
+            min_score (float): Candidates below this score may be omitted
+            block_size (int): Maximum number of queries scored together
+
+        Returns:
+            tuple: (indices, scores) lists with one array per query, best
+                   candidate first in every row
+        """
+        query_matrix = self.index.vectorizer.transform(clean_questions)
+        queries = self.lsa_index.embed(query_matrix) if self.lsa_index is not None else query_matrix
+        routed_categories, confidences = self.route(queries)
+
+        top_indices = [None] * query_matrix.shape[0]
+        top_scores = [None] * query_matrix.shape[0]
+        fallback = []
+
+        for row in range(query_matrix.shape[0]):
+            if confidences[row, 0] < self.min_confidence:
+                fallback.append(row)
+                continue
+
+            indices = np.concatenate([self.category_rows[c] for c in routed_categories[row]])
+            query = queries[row:row + 1]
+            if self.lsa_index is not None:
+                scores = np.concatenate([(query @ self.category_matrices[c].T).ravel()
+                                         for c in routed_categories[row]]).astype(np.float64)
+            else:
+                scores = np.concatenate([(query @ self.category_matrices[c]).toarray().ravel()
+                                         for c in routed_categories[row]])
+
+            if len(scores) > k:
+                keep = np.argpartition(-scores, k - 1)[:k]
+                indices, scores = indices[keep], scores[keep]
+
+            # Ties are broken by the lower row, as in the whole-FAQ engines
+            ranking = np.lexsort((indices, -scores))
+            top_indices[row] = indices[ranking]
+            top_scores[row] = scores[ranking]
+
+        if fallback:
+            fallback_indices, fallback_scores = self.index.top_k_vectors(
+                query_matrix[fallback], k, min_score, block_size)
+            for position, row in enumerate(fallback):
+                top_indices[row] = fallback_indices[position]
+                top_scores[row] = fallback_scores[position]
+
+        return top_indices, top_scores
@@ -0,0 +1,228 @@
+"""
+Document cache module for the JusticeAI application.
+Remembers the extracted text, summary and risk analysis of documents by
+content hash, so uploading the same agreement again skips the work.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import sys
+import tempfile
+
+# Local imports
+from config import (APP_VERSION, SUMMARIZATION_RATIO, SUMMARY_METHOD, DOCUMENT_CACHE_SIZE,
+                    DOCUMENT_CACHE_TEXT_BYTES, DOCUMENT_CACHE_DIR, DOCUMENT_CACHE_DISK_ENTRIES,
+                    RISK_MATCH_INFLECTIONS, RISK_FUZZY_MAX_EDITS)
+from analysis.summarizer import summarize_text
+from analysis.risk_analyzer import analyze_risks
+from analysis.risk_lexicon import get_risk_lexicon
+from analysis.risk_matcher import RiskMatches
+from utils.cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+# Files are read in blocks of this many bytes while hashing
+_HASH_BLOCK_SIZE = 1 << 20
+
+# Array fields of a RiskMatches payload, stored as base64 on disk
+_PAYLOAD_ARRAYS = ("starts", "ends", "term_ids", "severities")
+
+_document_cache = LRUCache(DOCUMENT_CACHE_SIZE)
+
+# Extracted texts, bounded by their size since one scan can run to megabytes
+_text_cache = LRUCache(DOCUMENT_CACHE_SIZE, max_bytes=DOCUMENT_CACHE_TEXT_BYTES, sizeof=sys.getsizeof)
+
+def extract_document_text(document_processor, file_path):
+    """
+    Extract the text of a document file, reusing the text of identical files
+
+    Extracted text is only kept in memory, never written to the cache
+    directory, so the disk holds analysis results rather than documents.
+    At most DOCUMENT_CACHE_TEXT_BYTES of text are kept.
+
+    Args:
+        document_processor (DocumentProcessor): Processor used on a cache miss
+        file_path (str): Path to the document file
+
+    Returns:
+        str: Extracted text from the document
+    """
+    digest = hashlib.sha256(APP_VERSION.encode('utf-8'))
+    with open(file_path, 'rb') as file:
+        for block in iter(lambda: file.read(_HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    key = "text-" + digest.hexdigest()
+
+    text = _text_cache.get(key)
+    if text is not None:
+        return text
+
+    text = document_processor.extract_text(file_path)
+    if text:
+        _text_cache.put(key, text)
+    return text
+
+def analyze_document(text, ratio=SUMMARIZATION_RATIO, lexicon=None, fuzzy=False, top_clauses=0,
+                     snippet_context=0):
+    """
+    Summarize a document and analyze its risks, reusing earlier results
+
+    Results are keyed on the SHA-256 of the text together with every
+    parameter, the lexicon fingerprint and the application version, so an
+    edited lexicon or a new release never serves stale results.
+
+    Args:
+        text (str): Extracted document text
+        ratio (float): The ratio of sentences to include in the summary
+        lexicon (str or RiskLexicon, optional): Risk lexicon to apply,
+            defaults to DEFAULT_RISK_LEXICON
+        fuzzy (bool or int): Tolerate misspelled risk terms, e.g. in OCR
+            text; True for RISK_FUZZY_MAX_EDITS or the number of edits
+        top_clauses (int): If positive, list this many riskiest clauses
+        snippet_context (int): If positive, return risk snippets with this
+            many characters of context
+
+    Returns:
+        tuple: (summary, risk_result) where risk_result is the compact
+               analyze_risks result; cached results are shared, so callers
+               replace keys of risk_result rather than modify its values
+    """
+    lexicon = get_risk_lexicon(lexicon)
+    max_edits = RISK_FUZZY_MAX_EDITS if fuzzy is True else int(fuzzy or 0)
+    key = document_cache_key(text, ratio, lexicon, fuzzy=max_edits, top_clauses=top_clauses,
+                             snippet_context=snippet_context)
+
+    entry = _get(key)
+    if entry is None:
+        entry = {
+            "summary": summarize_text(text, ratio),
+            "risk_result": analyze_risks(text, compact=True, lexicon=lexicon, top_clauses=top_clauses,
+                                         fuzzy=max_edits, snippet_context=snippet_context)
+        }
+        _put(key, entry)
+
+    return entry["summary"], dict(entry["risk_result"])
+
+def document_cache_key(text, ratio, lexicon, **options):
+    """
+    Build the cache key of a document analysis
+
+    Args:
+        text (str): Extracted document text
+        ratio (float): Summary ratio
+        lexicon (RiskLexicon): Risk lexicon applied
+        **options: Other analysis parameters
+
+    Returns:
+        str: Hex digest identifying the analysis
+    """
+    params = json.dumps({"version": APP_VERSION, "ratio": ratio, "method": SUMMARY_METHOD,
+                         "lexicon": lexicon.fingerprint, "inflections": RISK_MATCH_INFLECTIONS,
+                         "fuzzy_max_edits": RISK_FUZZY_MAX_EDITS, **options}, sort_keys=True)
+    digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+    return "result-" + hashlib.sha256(f"{digest}:{params}".encode('utf-8')).hexdigest()
+
+def get_document_cache_stats():
+    """
+    Get hit, miss and eviction counters of the in-memory document cache
+
+    Returns:
+        dict: Cache statistics of the analysis results, with those of the
+              extracted texts under "text"
+    """
+    return {**_document_cache.stats(), "text": _text_cache.stats()}
+
+def clear_document_cache():
+    """Drop every document kept in memory; files on disk are left alone"""
+    _document_cache.clear()
+    _text_cache.clear()
+
+def _get(key):
+    """Look up an entry in memory, then on disk"""
+    entry = _document_cache.get(key)
+    if entry is not None or not DOCUMENT_CACHE_DIR:
+        return entry
+
+    path = os.path.join(DOCUMENT_CACHE_DIR, key + ".json")
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            entry = _decode(json.load(file))
+        # Mark the file as recently used, so eviction removes colder entries first
+        os.utime(path)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Ignoring cached document {key}: {str(e)}")
+        return None
+
+    _document_cache.put(key, entry)
+    return entry
+
+def _put(key, entry):
+    """Store an entry in memory and, if configured, on disk"""
+    _document_cache.put(key, entry)
+    if not DOCUMENT_CACHE_DIR:
+        return
+
+    # Write to a temporary file first, so a partial file is never read
+    try:
+        os.makedirs(DOCUMENT_CACHE_DIR, exist_ok=True)
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=DOCUMENT_CACHE_DIR,
+                                         suffix=".tmp", delete=False) as file:
+            json.dump(_encode(entry), file, ensure_ascii=False)
+        os.replace(file.name, os.path.join(DOCUMENT_CACHE_DIR, key + ".json"))
+    except OSError as e:
+        logger.warning(f"Could not write cached document {key}: {str(e)}")
+        return
+
+    _evict_disk_entries(DOCUMENT_CACHE_DISK_ENTRIES)
+
+def _evict_disk_entries(max_entries):
+    """Remove the least recently used files once the cache directory holds too many"""
+    try:
+        with os.scandir(DOCUMENT_CACHE_DIR) as entries:
+            files = [(entry.stat().st_mtime, entry.path) for entry in entries if entry.name.endswith(".json")]
+    except OSError as e:
+        logger.warning(f"Could not list cached documents: {str(e)}")
+        return
+
+    if len(files) <= max_entries:
+        return
+
+    files.sort()
+    for _, path in files[:len(files) - max_entries]:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            # Another worker evicted it first
+            pass
+        except OSError as e:
+            logger.warning(f"Could not remove cached document {path}: {str(e)}")
+
+def _encode(entry):
+    """Convert an entry to JSON values, packing risk matches as base64 arrays"""
+    risk_result = entry.get("risk_result")
+    if risk_result is None:
+        return entry
+
+    payload = risk_result["highlight_positions"].to_payload()
+    for name in _PAYLOAD_ARRAYS:
+        payload[name] = base64.b64encode(payload[name]).decode('ascii')
+    return {**entry, "risk_result": {**risk_result, "highlight_positions": payload}}
+
+def _decode(entry):
+    """Reverse _encode()"""
+    risk_result = entry.get("risk_result")
+    if risk_result is None:
+        return entry
+
+    payload = risk_result["highlight_positions"]
+    for name in _PAYLOAD_ARRAYS:
+        payload[name] = base64.b64decode(payload[name])
+    risk_result["highlight_positions"] = RiskMatches.from_payload(payload)
+    for snippet in risk_result.get("snippets", []):
+        snippet["highlights"] = [tuple(highlight) for highlight in snippet["highlights"]]
+    return entry
@@ -0,0 +1,904 @@
+"""
+FAQ index module for the JusticeAI application.
+Holds the fitted TF-IDF retrieval structures used for question answering.
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import logging
+import math
+import os
+import threading
+from collections import Counter
+
+import numpy as np
+from scipy.sparse import csr_matrix, vstack
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.preprocessing import normalize
+
+# Local imports
+from config import (
+    FAQ_SEARCH_ENGINE, FAQ_INVERTED_INDEX_MIN_QUESTIONS, FAQ_INDEX_PATH, FAQ_INDEX_COMPACT_RATIO,
+    FAQ_CATEGORY_ROUTING, FAQ_SEARCH_SHARDS
+)
+from data.legal_faq import LEGAL_FAQ_CATEGORIES
+from analysis.inverted_index import InvertedIndex
+from analysis.lsa_index import LSAIndex
+from analysis.ranking import sparse_top_k
+from analysis.category_router import CategoryRouter
+from analysis.sharded_search import ShardedQuestionIndex
+
+logger = logging.getLogger(__name__)
+
+# Name of the file describing an on-disk FAQ index artifact
+MANIFEST_FILE = "manifest.json"
+
+def build_qa_pairs(faq_categories, category=None):
+    """
+    Flatten FAQ categories into question-answer pairs
+
+    Args:
+        faq_categories (dict): Mapping of category to {question: answer}
+        category (str, optional): Category to filter by
+
+    Returns:
+        list: List of question-answer dictionaries
+    """
+    if category and category in faq_categories:
+        selected = {category: faq_categories[category]}
+    else:
+        selected = faq_categories
+
+    qa_pairs = []
+    for category_name, questions in selected.items():
+        for question, answer in questions.items():
+            qa_pairs.append({
+                "question": question,
+                "answer": answer,
+                "category": category_name
+            })
+
+    return qa_pairs
+
+def faq_fingerprint(faq_categories):
+    """
+    Compute a content hash of FAQ data
+
+    Args:
+        faq_categories (dict): Mapping of category to {question: answer}
+
+    Returns:
+        str: Hex digest that changes whenever any question or answer changes
+    """
+    payload = json.dumps(faq_categories, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+class QuestionIndex:
+    """TF-IDF index fitted over a single set of question-answer pairs"""
+
+    def __init__(self, qa_pairs, engine=FAQ_SEARCH_ENGINE):
+        """
+        Fit the vectorizer and build the question matrix
+
+        Args:
+            qa_pairs (list): List of question-answer dictionaries
+            engine (str): "brute" to score every question, "inverted" to use
+                          pruned posting lists, "lsa" to score in a dense
+                          latent space, or "auto" to pick by corpus size
+        """
+        self.qa_pairs = qa_pairs
+        self.vectorizer = TfidfVectorizer(stop_words='english')
+
+        # TfidfVectorizer L2-normalises every row, so cosine similarity
+        # reduces to a plain sparse dot product at query time
+        questions = [qa["question"] for qa in qa_pairs]
+        self.question_matrix = self.vectorizer.fit_transform(questions).tocsr()
+
+        self.engine = engine
+        if engine == "auto":
+            engine = "inverted" if len(qa_pairs) >= FAQ_INVERTED_INDEX_MIN_QUESTIONS else "brute"
+        self.inverted_index = InvertedIndex(self.question_matrix) if engine == "inverted" else None
+
+        use_lsa = engine == "lsa" and LSAIndex.can_fit(self.question_matrix)
+        self.lsa_index = LSAIndex(self.question_matrix) if use_lsa else None
+
+    def __len__(self):
+        return len(self.qa_pairs)
+
+    @property
+    def vocabulary(self):
+        """dict: Mapping of term to column in the question matrix"""
+        # A vectorizer restored by load() only validates its vocabulary on first use
+        return getattr(self.vectorizer, 'vocabulary_', None) or self.vectorizer.vocabulary
+
+    @classmethod
+    def load(cls, directory, mmap=True):
+        """
+        Load an index written by save() without refitting anything
+
+        With mmap enabled the matrix and posting arrays are mapped read-only,
+        so every process loading the same directory shares one physical copy
+        through the page cache.
+
+        Args:
+            directory (str): Directory holding the index arrays
+            mmap (bool): Map the arrays read-only instead of reading them
+
+        Returns:
+            QuestionIndex: The loaded index
+        """
+        mmap_mode = 'r' if mmap else None
+
+        with open(os.path.join(directory, "qa_pairs.json"), 'r', encoding='utf-8') as file:
+            qa_pairs = json.load(file)
+        with open(os.path.join(directory, "vocabulary.json"), 'r', encoding='utf-8') as file:
+            vocabulary = json.load(file)
+
+        index = cls.__new__(cls)
+        index.qa_pairs = qa_pairs
+
+        index.vectorizer = TfidfVectorizer(stop_words='english', vocabulary=vocabulary)
+        index.vectorizer.idf_ = np.load(os.path.join(directory, "idf.npy"), mmap_mode=mmap_mode)
+
+        index.question_matrix = csr_matrix(
+            (np.load(os.path.join(directory, "data.npy"), mmap_mode=mmap_mode),
+             np.load(os.path.join(directory, "indices.npy"), mmap_mode=mmap_mode),
+             np.load(os.path.join(directory, "indptr.npy"), mmap_mode=mmap_mode)),
+            shape=(len(qa_pairs), len(vocabulary)),
+            copy=False
+        )
+
+        has_postings = os.path.exists(os.path.join(directory, "postings_indptr.npy"))
+        index.inverted_index = InvertedIndex.load(directory, mmap) if has_postings else None
+
+        has_lsa = os.path.exists(os.path.join(directory, "lsa_embeddings.npy"))
+        index.lsa_index = LSAIndex.load(directory, mmap) if has_lsa else None
+        index.engine = "lsa" if has_lsa else "inverted" if has_postings else "brute"
+
+        return index
+
+    def save(self, directory):
+        """
+        Write the fitted vocabulary, IDF weights and CSR arrays to a directory
+
+        Args:
+            directory (str): Directory to write into, created if missing
+        """
+        os.makedirs(directory, exist_ok=True)
+
+        with open(os.path.join(directory, "qa_pairs.json"), 'w', encoding='utf-8') as file:
+            json.dump(self.qa_pairs, file, ensure_ascii=False)
+
+        # Vocabulary ids are numpy integers, which json cannot serialise
+        vocabulary = {term: int(term_id) for term, term_id in self.vocabulary.items()}
+        with open(os.path.join(directory, "vocabulary.json"), 'w', encoding='utf-8') as file:
+            json.dump(vocabulary, file, ensure_ascii=False)
+
+        np.save(os.path.join(directory, "idf.npy"), self.vectorizer.idf_)
+        np.save(os.path.join(directory, "data.npy"), self.question_matrix.data)
+        np.save(os.path.join(directory, "indices.npy"), self.question_matrix.indices)
+        np.save(os.path.join(directory, "indptr.npy"), self.question_matrix.indptr)
+
+        if self.inverted_index is not None:
+            self.inverted_index.save(directory)
+        if self.lsa_index is not None:
+            self.lsa_index.save(directory)
+
+    def similarities(self, clean_question):
+        """
+        Score a cleaned question against every indexed question
+
+        Args:
+            clean_question (str): Question already passed through text cleaning
+
+        Returns:
+            numpy.ndarray: Cosine similarity for each indexed question
+        """
+        query_vector = self.vectorizer.transform([clean_question])
+        return (query_vector @ self.question_matrix.T).toarray()[0]
+
+    def top_k(self, clean_questions, k, min_score=0.0, block_size=4096):
+        """
+        Rank the k most similar indexed questions for each query
+
+        Args:
+            clean_questions (list): Questions already passed through text cleaning
+            k (int): Number of candidates to return per query
+            min_score (float): Candidates below this score may be omitted
+            block_size (int): Maximum number of queries scored together
+
+        Returns:
+            tuple: (indices, scores) with one row per query, best candidate
+                   first in every row
+        """
+        query_matrix = self.vectorizer.transform(clean_questions)
+        return self.top_k_vectors(query_matrix, k, min_score, block_size)
+
+    def top_k_vectors(self, query_matrix, k, min_score=0.0, block_size=4096):
+        """
+        Rank the k most similar indexed questions for each query vector
+
+        The brute-force engine scores the batch with one sparse matrix product
+        per block of queries; blocks keep the dense score buffer bounded for
+        very large batches. The inverted engine only scores questions sharing
+        a term with the query. The LSA engine scores dense embeddings, so
+        paraphrases sharing no terms can still match.
+
+        Args:
+            query_matrix (scipy.sparse matrix): L2-normalised query vectors
+            k (int): Number of candidates to return per query
+            min_score (float): Candidates below this score may be omitted
+            block_size (int): Maximum number of queries scored together
+
+        Returns:
+            tuple: (indices, scores) with one row per query, best candidate
+                   first in every row
+        """
+        k = min(k, len(self))
+
+        if self.lsa_index is not None:
+            return self.lsa_index.search_batch(query_matrix, k, block_size)
+        if self.inverted_index is not None:
+            return self.inverted_index.search_batch(query_matrix, k, min_score)
+
+        return sparse_top_k(query_matrix, self.question_matrix, k, block_size)
+
+class QuestionPairs:
+    """Read-only sequence of question-answer pairs made of a base list and appended pairs"""
+
+    def __init__(self, base_pairs, added_pairs):
+        self.base_pairs = base_pairs
+        self.added_pairs = added_pairs
+
+    def __len__(self):
+        return len(self.base_pairs) + len(self.added_pairs)
+
+    def __getitem__(self, position):
+        if position < len(self.base_pairs):
+            return self.base_pairs[position]
+        return self.added_pairs[position - len(self.base_pairs)]
+
+    def __iter__(self):
+        return itertools.chain(self.base_pairs, self.added_pairs)
+
+class DeltaQuestionIndex:
+    """
+    Question index made of an immutable fitted base plus appended and removed rows
+
+    Snapshots are never modified: every edit returns a new snapshot sharing the
+    base, so it can be swapped in with one assignment while in-flight queries
+    keep the snapshot they started with. New terms are appended to the
+    vocabulary and the IDF of existing terms stays as fitted until the
+    snapshot is compacted into a freshly fitted QuestionIndex.
+    """
+
+    def __init__(self, base):
+        """
+        Start an empty delta over a fitted index
+
+        Args:
+            base (QuestionIndex): The fitted index to extend
+        """
+        self.base = base
+        self.analyzer = base.vectorizer.build_analyzer()
+        self.base_rows = {qa["question"]: row for row, qa in enumerate(base.qa_pairs)}
+        self.base_idf = np.asarray(base.vectorizer.idf_)
+        self.new_terms = {}
+        self.new_idf = []
+        self.added_pairs = []
+        self.added_rows = {}
+        self.added_matrix = csr_matrix((0, len(base.vocabulary)))
+        self.removed = frozenset()
+        self.removed_base_count = 0
+        self.qa_pairs = QuestionPairs(base.qa_pairs, self.added_pairs)
+
+    def __len__(self):
+        return len(self.qa_pairs)
+
+    @property
+    def num_edits(self):
+        """int: Rows appended or removed since the base was fitted"""
+        return len(self.added_pairs) + len(self.removed)
+
+    def needs_compaction(self):
+        """Check whether the delta has grown enough to be worth a refit"""
+        return self.num_edits > FAQ_INDEX_COMPACT_RATIO * len(self.base)
+
+    def compacted(self):
+        """
+        Refit a plain index over the live rows, recomputing every IDF weight
+
+        Returns:
+            QuestionIndex: The refitted index, or None if no rows are left
+        """
+        qa_pairs = [qa for row, qa in enumerate(self.qa_pairs) if row not in self.removed]
+        return QuestionIndex(qa_pairs, self.base.engine) if qa_pairs else None
+
+    def save(self, directory):
+        """Write the compacted index to a directory"""
+        self.compacted().save(directory)
+
+    def row_of(self, question):
+        """
+        Find the live row holding a question
+
+        Args:
+            question (str): Question text
+
+        Returns:
+            int: Row position, or None if the question is not indexed
+        """
+        row = self.added_rows.get(question, self.base_rows.get(question))
+        return None if row is None or row in self.removed else row
+
+    def with_question(self, qa_pair):
+        """
+        Append a question-answer pair
+
+        Args:
+            qa_pair (dict): Question-answer dictionary
+
+        Returns:
+            DeltaQuestionIndex: New snapshot including the pair
+        """
+        snapshot = self._copy()
+        snapshot.new_terms = dict(self.new_terms)
+        snapshot.new_idf = list(self.new_idf)
+
+        # Terms never seen before get the next free column, weighted as if
+        # they occur in this question only
+        live_count = len(self) - len(self.removed) + 1
+        for term in self.analyzer(qa_pair["question"]):
+            if term not in self.base.vocabulary and term not in snapshot.new_terms:
+                snapshot.new_terms[term] = len(self.base.vocabulary) + len(snapshot.new_idf)
+                snapshot.new_idf.append(math.log((1 + live_count) / 2) + 1)
+
+        row_vector = snapshot.transform([qa_pair["question"]])
+        added_matrix = self.added_matrix.copy()
+        added_matrix.resize((added_matrix.shape[0], row_vector.shape[1]))
+
+        snapshot.added_matrix = vstack([added_matrix, row_vector]).tocsr()
+        snapshot.added_pairs = self.added_pairs + [qa_pair]
+        snapshot.added_rows = dict(self.added_rows)
+        snapshot.added_rows[qa_pair["question"]] = len(self)
+        snapshot.qa_pairs = QuestionPairs(self.base.qa_pairs, snapshot.added_pairs)
+        return snapshot
+
+    def without_question(self, question):
+        """
+        Remove a question
+
+        Args:
+            question (str): Question text
+
+        Returns:
+            DeltaQuestionIndex: New snapshot without the question, or this
+                                snapshot if the question is not indexed
+        """
+        row = self.row_of(question)
+        if row is None:
+            return self
+
+        snapshot = self._copy()
+        snapshot.removed = self.removed | {row}
+        if row < len(self.base):
+            snapshot.removed_base_count += 1
+        return snapshot
+
+    def transform(self, clean_questions):
+        """
+        Vectorise questions over the base vocabulary plus appended terms
+
+        This reproduces TfidfVectorizer.transform: raw term counts weighted by
+        IDF, then L2-normalised.
+
+        Args:
+            clean_questions (list): Questions to vectorise
+
+        Returns:
+            scipy.sparse.csr_matrix: One L2-normalised row per question
+        """
+        vocabulary = self.base.vocabulary
+        num_base_terms = len(vocabulary)
+        rows, columns, values = [], [], []
+
+        for row, text in enumerate(clean_questions):
+            for term, count in Counter(self.analyzer(text)).items():
+                column = vocabulary.get(term, self.new_terms.get(term))
+                if column is None:
+                    continue
+                if column < num_base_terms:
+                    idf = self.base_idf[column]
+                else:
+                    idf = self.new_idf[column - num_base_terms]
+                rows.append(row)
+                columns.append(column)
+                values.append(count * idf)
+
+        shape = (len(clean_questions), num_base_terms + len(self.new_idf))
+        return normalize(csr_matrix((values, (rows, columns)), shape=shape))
+
+    def top_k(self, clean_questions, k, min_score=0.0, block_size=4096):
+        """
+        Rank the k most similar live questions for each query
+
+        The base is searched with its own engine, asking for enough extra
+        candidates to cover removed rows, and the appended rows are scored
+        directly.
+
+        Args:
+            clean_questions (list): Questions already passed through text cleaning
+            k (int): Number of candidates to return per query
+            min_score (float): Candidates below this score may be omitted
+            block_size (int): Maximum number of queries scored together
+
+        Returns:
+            tuple: (indices, scores) lists with one array per query, best
+                   candidate first in every row
+        """
+        query_matrix = self.transform(clean_questions)
+        base_queries = query_matrix[:, :len(self.base.vocabulary)]
+        base_indices, base_scores = self.base.top_k_vectors(
+            base_queries, k + self.removed_base_count, min_score, block_size)
+
+        if self.base.lsa_index is not None:
+            # Appended rows are projected with the base decomposition; terms
+            # added since the fit have no latent direction until compaction
+            added_rows = self.added_matrix[:, :len(self.base.vocabulary)]
+            added_scores = self.base.lsa_index.similarities(base_queries, added_rows)
+        else:
+            added_scores = (query_matrix @ self.added_matrix.T).toarray()
+        added_indices = np.arange(len(self.base), len(self))
+        removed = np.fromiter(self.removed, dtype=np.intp, count=len(self.removed))
+
+        top_indices, top_scores = [], []
+        for row in range(query_matrix.shape[0]):
+            indices = np.concatenate((base_indices[row], added_indices))
+            scores = np.concatenate((base_scores[row], added_scores[row]))
+
+            live = ~np.isin(indices, removed)
+            indices, scores = indices[live], scores[live]
+
+            # Ties are broken by the lower row, as in the base engines
+            ranking = np.lexsort((indices, -scores))[:k]
+            top_indices.append(indices[ranking])
+            top_scores.append(scores[ranking])
+
+        return top_indices, top_scores
+
+    def _copy(self):
+        """Shallow copy sharing every container, which callers replace rather than mutate"""
+        snapshot = DeltaQuestionIndex.__new__(DeltaQuestionIndex)
+        snapshot.__dict__.update(self.__dict__)
+        return snapshot
+
+class FAQIndex:
+    """Lazily built collection of question indexes for the whole FAQ and each category"""
+
+    def __init__(self, faq_categories=None):
+        """
+        Initialize the FAQ index
+
+        Args:
+            faq_categories (dict, optional): FAQ data, defaults to LEGAL_FAQ_CATEGORIES
+        """
+        self.faq_categories = LEGAL_FAQ_CATEGORIES if faq_categories is None else faq_categories
+        self.version = faq_fingerprint(self.faq_categories)
+        self._indexes = {}
+        self._router = (None, None)
+        self._sharded = (None, None)
+        self._lock = threading.RLock()
+
+        # Whole-FAQ searchers in use, and the thread rebuilding them after edits
+        self._wanted = {}
+        self._refresher = None
+
+    def resolve_category(self, category):
+        """
+        Map a requested category to the index key used for it
+
+        Args:
+            category (str, optional): Requested category
+
+        Returns:
+            str: The category if it exists, otherwise None for the whole FAQ
+        """
+        return category if category in self.faq_categories else None
+
+    def get(self, category=None):
+        """
+        Get the question index for a category, building it on first use
+
+        Each category gets its own fitted vocabulary so that scores match
+        searching that category on its own.
+
+        Args:
+            category (str, optional): Category to search within
+
+        Returns:
+            QuestionIndex: Index for the category (a DeltaQuestionIndex once
+                           edited), or None if it has no questions
+        """
+        key = self.resolve_category(category)
+
+        index = self._indexes.get(key)
+        if index is None and key not in self._indexes:
+            with self._lock:
+                if key not in self._indexes:
+                    qa_pairs = build_qa_pairs(self.faq_categories, key)
+                    self._indexes[key] = QuestionIndex(qa_pairs) if qa_pairs else None
+                index = self._indexes[key]
+
+        return index
+
+    def get_searcher(self, category=None):
+        """
+        Get the object that answers top-k queries for a category
+
+        Whole-FAQ searches go through the category router or the shard
+        workers when they are enabled; everything else uses the plain index.
+
+        Args:
+            category (str, optional): Category to search within
+
+        Returns:
+            object: Searcher with qa_pairs and top_k(), or None if the category
+                    has no questions
+        """
+        key = self.resolve_category(category)
+
+        if key is None:
+            searcher = None
+            if FAQ_CATEGORY_ROUTING:
+                searcher = self.get_router()
+            if searcher is None and FAQ_SEARCH_SHARDS > 1:
+                searcher = self.get_sharded()
+            if searcher is not None:
+                return searcher
+
+        return self.get(key)
+
+    def get_sharded(self, num_shards=FAQ_SEARCH_SHARDS):
+        """
+        Get the sharded searcher over the whole-FAQ index, starting its workers on first use
+
+        Args:
+            num_shards (int): Number of shards and worker processes
+
+        Returns:
+            ShardedQuestionIndex: The searcher, or None if the FAQ has no
+                                  questions or is being refreshed after an edit
+        """
+        index = self.get(None)
+        sharded_index, sharded = self._sharded
+        if sharded_index is index:
+            return sharded
+
+        with self._lock:
+            self._wanted["sharded"] = num_shards
+            sharded_index, sharded = self._sharded
+            if sharded_index is index:
+                return sharded
+            if sharded is None and isinstance(index, QuestionIndex):
+                # First use of an unedited index: nothing to wait for
+                sharded = ShardedQuestionIndex(index, num_shards)
+                self._sharded = (index, sharded)
+                return sharded
+            self._refresh_in_background()
+            return None
+
+    def get_router(self):
+        """
+        Get the category router over the whole-FAQ index, building it on first use
+
+        Returns:
+            CategoryRouter: The router, or None if the FAQ has no questions or
+                            is being refreshed after an edit
+        """
+        index = self.get(None)
+        routed_index, router = self._router
+        if routed_index is index:
+            return router
+
+        with self._lock:
+            self._wanted["router"] = True
+            routed_index, router = self._router
+            if routed_index is index:
+                return router
+            if router is None and isinstance(index, QuestionIndex):
+                # First use of an unedited index: nothing to wait for
+                router = CategoryRouter(index)
+                self._router = (index, router)
+                return router
+            self._refresh_in_background()
+            return None
+
+    def wait_for_refresh(self, timeout=None):
+        """
+        Wait for a background refresh of the router and shard workers to finish
+
+        Args:
+            timeout (float, optional): Seconds to wait at most
+        """
+        refresher = self._refresher
+        if refresher is not None:
+            refresher.join(timeout)
+
+    def _refresh_in_background(self):
+        """Start the refresh thread unless it is already running; call with the lock held"""
+        if self._refresher is None:
+            self._refresher = threading.Thread(target=self._refresh_searchers, daemon=True,
+                                               name="faq-index-refresh")
+            self._refresher.start()
+
+    def _refresh_searchers(self):
+        """
+        Compact edits to the whole-FAQ index and rebuild its router and shards
+
+        Runs off the query path: until it publishes, whole-FAQ searches use
+        the edited index directly. Edits made meanwhile are picked up by the
+        next round, and the thread stops once everything is current.
+        """
+        try:
+            while True:
+                with self._lock:
+                    index = self._indexes.get(None)
+                    wanted = dict(self._wanted)
+                    if (not isinstance(index, DeltaQuestionIndex)
+                            and ("router" not in wanted or self._router[0] is index)
+                            and ("sharded" not in wanted or self._sharded[0] is index)):
+                        self._refresher = None
+                        return
+
+                fitted = index
+                if isinstance(index, DeltaQuestionIndex):
+                    logger.info(f"Compacting the whole-FAQ index after {index.num_edits} edits")
+                    fitted = index.compacted()
+                router = CategoryRouter(fitted) if fitted is not None and "router" in wanted else None
+                sharded = None
+                if fitted is not None and "sharded" in wanted:
+                    sharded = ShardedQuestionIndex(fitted, wanted["sharded"])
+
+                with self._lock:
+                    if self._indexes.get(None) is not index:
+                        # Edited again meanwhile: start over from the new snapshot
+                        if sharded is not None:
+                            sharded.close()
+                        continue
+
+                    if fitted is not index:
+                        indexes = dict(self._indexes)
+                        indexes[None] = fitted
+                        self._indexes = indexes
+                    if "router" in wanted:
+                        self._router = (fitted, router)
+                    if "sharded" in wanted:
+                        # Workers of the replaced index finish the queries
+                        # already submitted to them before they stop
+                        replaced = self._sharded[1]
+                        self._sharded = (fitted, sharded)
+                        if replaced is not None:
+                            replaced.close()
+        except Exception as e:
+            logger.warning(f"Could not refresh the whole-FAQ searchers: {str(e)}")
+            with self._lock:
+                self._refresher = None
+
+    def add_question(self, category, question, answer):
+        """
+        Add a question to the live index, replacing it if it already exists
+
+        Args:
+            category (str): Category of the question, created if missing
+            question (str): Question text
+            answer (str): Answer text
+        """
+        self._apply_edit(category, question, answer)
+
+    def update_question(self, category, question, answer):
+        """
+        Change the answer of an existing question in the live index
+
+        Args:
+            category (str): Category of the question
+            question (str): Question text
+            answer (str): New answer text
+
+        Raises:
+            KeyError: If the question does not exist in the category
+        """
+        with self._lock:
+            if question not in self.faq_categories.get(category, {}):
+                raise KeyError(f"No question {question!r} in category {category!r}")
+            self._apply_edit(category, question, answer)
+
+    def remove_question(self, category, question):
+        """
+        Remove a question from the live index
+
+        Args:
+            category (str): Category of the question
+            question (str): Question text
+
+        Returns:
+            bool: True if the question existed and was removed
+        """
+        with self._lock:
+            if question not in self.faq_categories.get(category, {}):
+                return False
+            self._apply_edit(category, question, None)
+            return True
+
+    def _apply_edit(self, category, question, answer):
+        """
+        Apply one edit and atomically swap in the updated indexes
+
+        Only the whole-FAQ index and the edited category's index are touched,
+        and only if they were already built; anything else is built lazily
+        from the updated FAQ data.
+
+        Args:
+            category (str): Category of the question
+            question (str): Question text
+            answer (str, optional): New answer, None to remove the question
+        """
+        with self._lock:
+            questions = dict(self.faq_categories.get(category, {}))
+            questions.pop(question, None)
+            if answer is not None:
+                questions[question] = answer
+
+            faq_categories = dict(self.faq_categories)
+            faq_categories[category] = questions
+
+            indexes = dict(self._indexes)
+            for key in (None, category):
+                if key not in indexes:
+                    continue
+                if indexes[key] is None:
+                    # Nothing was indexed yet, so build from the edited data on next use
+                    del indexes[key]
+                    continue
+
+                snapshot = indexes[key]
+                if not isinstance(snapshot, DeltaQuestionIndex):
+                    snapshot = DeltaQuestionIndex(snapshot)
+                snapshot = snapshot.without_question(question)
+                if answer is not None:
+                    snapshot = snapshot.with_question({
+                        "question": question,
+                        "answer": answer,
+                        "category": category
+                    })
+
+                # Refitting costs O(corpus) but only runs once the delta is a
+                # fixed fraction of the base, so edits stay cheap on average
+                indexes[key] = snapshot.compacted() if snapshot.needs_compaction() else snapshot
+
+            edit = json.dumps([self.version, category, question, answer], ensure_ascii=False)
+
+            # Readers fetch the version before the index, so publish the
+            # indexes first: a racing reader may pair an old version with a
+            # new index, but never a new version with an old index
+            self.faq_categories = faq_categories
+            self._indexes = indexes
+            self.version = hashlib.sha256(edit.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def load(cls, directory, faq_categories=None, mmap=True):
+        """
+        Load an FAQ index artifact written by save()
+
+        Args:
+            directory (str): Artifact directory
+            faq_categories (dict, optional): FAQ data, defaults to LEGAL_FAQ_CATEGORIES
+            mmap (bool): Map the arrays read-only instead of reading them
+
+        Returns:
+            FAQIndex: Index with every saved category already loaded
+
+        Raises:
+            ValueError: If the artifact was built from different FAQ data
+        """
+        faq_index = cls(faq_categories)
+
+        with open(os.path.join(directory, MANIFEST_FILE), 'r', encoding='utf-8') as file:
+            manifest = json.load(file)
+
+        if manifest.get("version") != faq_index.version:
+            raise ValueError(f"FAQ index at {directory} was built from different FAQ data")
+
+        for entry in manifest["indexes"]:
+            path = entry["path"]
+            faq_index._indexes[entry["category"]] = (
+                QuestionIndex.load(os.path.join(directory, path), mmap) if path else None)
+
+        return faq_index
+
+    def save(self, directory):
+        """
+        Build every category index and write them all to a directory
+
+        Args:
+            directory (str): Artifact directory, created if missing
+        """
+        os.makedirs(directory, exist_ok=True)
+
+        # Invalidate any previous artifact before overwriting its arrays
+        manifest_path = os.path.join(directory, MANIFEST_FILE)
+        if os.path.exists(manifest_path):
+            os.remove(manifest_path)
+
+        entries = []
+        for number, category in enumerate([None] + list(self.faq_categories)):
+            index = self.get(category)
+            if isinstance(index, DeltaQuestionIndex):
+                index = index.compacted()
+            path = None
+            if index is not None:
+                path = "all" if category is None else f"category_{number}"
+                index.save(os.path.join(directory, path))
+            entries.append({"category": category, "path": path})
+
+        # The manifest is written last, so a partially written artifact is never loaded
+        with open(manifest_path, 'w', encoding='utf-8') as file:
+            json.dump({"version": faq_fingerprint(self.faq_categories), "indexes": entries}, file, ensure_ascii=False, indent=2)
+
+_faq_index = None
+_faq_index_lock = threading.Lock()
+
+def get_faq_index():
+    """
+    Get the shared FAQ index, creating it on first use
+
+    Returns:
+        FAQIndex: The process-wide FAQ index
+    """
+    global _faq_index
+
+    if _faq_index is None:
+        with _faq_index_lock:
+            if _faq_index is None:
+                _faq_index = _load_or_build_faq_index()
+
+    return _faq_index
+
+def _load_or_build_faq_index():
+    """
+    Map the configured FAQ index artifact, falling back to an in-memory build
+
+    Returns:
+        FAQIndex: The loaded or newly created index
+    """
+    if FAQ_INDEX_PATH and os.path.exists(os.path.join(FAQ_INDEX_PATH, MANIFEST_FILE)):
+        try:
+            return FAQIndex.load(FAQ_INDEX_PATH)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring FAQ index artifact: {str(e)}")
+
+    return FAQIndex()
+
+def reset_faq_index():
+    """Discard the shared FAQ index so it is rebuilt from the current FAQ data"""
+    global _faq_index
+
+    with _faq_index_lock:
+        _faq_index = None
+
+def main():
+    """Build the FAQ index artifact from the bundled FAQ data"""
+    parser = argparse.ArgumentParser(description="Build the on-disk FAQ index artifact")
+    parser.add_argument("--output", default=FAQ_INDEX_PATH,
+                        help="Artifact directory (defaults to JUSTICEAI_FAQ_INDEX)")
+    args = parser.parse_args()
+
+    if not args.output:
+        parser.error("--output is required when JUSTICEAI_FAQ_INDEX is not set")
+
+    FAQIndex().save(args.output)
+    print(f"FAQ index written to {args.output}")
+
+if __name__ == "__main__":
+    main()
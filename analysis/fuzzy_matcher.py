@@ -0,0 +1,194 @@
+"""
+Fuzzy matcher module for the JusticeAI application.
+Finds risk terms misread by OCR, such as "terrnination" for "termination"
+or "1iability" for "liability", by undoing common character confusions.
+"""
+
+import re
+
+# Local imports
+from config import RISK_FUZZY_LETTER_CONFUSION_COST
+
+# Same word definition as the proximity rules
+_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Character sequences OCR commonly reads as one another, applied both ways
+OCR_CONFUSIONS = (
+    ("rn", "m"), ("cl", "d"), ("vv", "w"), ("ri", "n"), ("li", "h"),
+    ("l", "1"), ("i", "1"), ("l", "i"), ("o", "0"), ("s", "5")
+)
+
+# (source, target, is a letter-for-letter confusion). A digit inside a word
+# is always a misreading, but "modem" and "modern" are both real words
+_CONFUSION_REPLACEMENTS = [(source, target, (first + second).isalpha()) for first, second in OCR_CONFUSIONS
+                           for source, target in ((first, second), (second, first))]
+
+def allowed_edits(word, max_edits):
+    """
+    Number of OCR confusions tolerated in a lexicon word
+
+    Short words get fewer edits so that, for example, "term" is never
+    corrected: one edit from five letters and two from nine. A
+    letter-for-letter confusion costs RISK_FUZZY_LETTER_CONFUSION_COST
+    edits, so with the default cost of two only words of nine letters or
+    more can be misread that way.
+
+    Args:
+        word (str): Lexicon word
+        max_edits (int): Upper bound on the edits allowed
+
+    Returns:
+        int: Edits tolerated for this word
+    """
+    return min(max_edits, (len(word) - 1) // 4)
+
+def ocr_corrections(token, max_edits, letter_cost=RISK_FUZZY_LETTER_CONFUSION_COST):
+    """
+    Every reading of a token obtained by undoing OCR confusions
+
+    Undoing a confusion that involves a digit costs one edit and undoing a
+    letter-for-letter confusion costs letter_cost edits.
+
+    Args:
+        token (str): Lowercased document word
+        max_edits (int): Largest total cost of the confusions undone
+        letter_cost (int): Cost of a letter-for-letter confusion
+
+    Returns:
+        dict: Corrected string to the lowest cost that produces it,
+              including the token itself at zero
+    """
+    corrections = {token: 0}
+    frontiers = {0: [token]}
+    for cost in range(max_edits + 1):
+        for current in frontiers.pop(cost, ()):
+            if corrections[current] < cost:
+                continue
+            for source, target, letters_only in _CONFUSION_REPLACEMENTS:
+                next_cost = cost + (letter_cost if letters_only else 1)
+                if next_cost > max_edits:
+                    continue
+                position = current.find(source)
+                while position >= 0:
+                    corrected = current[:position] + target + current[position + len(source):]
+                    if corrections.get(corrected, next_cost + 1) > next_cost:
+                        corrections[corrected] = next_cost
+                        frontiers.setdefault(next_cost, []).append(corrected)
+                    position = current.find(source, position + 1)
+    return corrections
+
+class FuzzyTermIndex:
+    """Index of the words of a risk lexicon for OCR-tolerant matching"""
+
+    def __init__(self, surface_forms, max_edits, lookup_cache_size=100000,
+                 letter_cost=RISK_FUZZY_LETTER_CONFUSION_COST):
+        """
+        Index every word of every lexicon term
+
+        A document word matches a lexicon word when undoing at most the
+        tolerated number of OCR confusions turns one into the other. Letter
+        confusions cost more than digit ones because they can turn one real
+        word into another, so "modem" is not read as "modern" while
+        "terrnination" is still read as "termination".
+
+        Args:
+            surface_forms (dict): Lowercased form of a term, such as an
+                inflection, to the lexicon term it is reported as
+            max_edits (int): Most OCR confusions tolerated per word
+            lookup_cache_size (int): Number of document words whose lookups
+                are remembered before the memo is cleared
+            letter_cost (int): Edits charged for a letter-for-letter confusion
+        """
+        self.max_edits = max_edits
+        self.lookup_cache_size = lookup_cache_size
+        self.letter_cost = letter_cost
+
+        # First word of a form to the (term, words) pairs starting with it,
+        # longest first so the longest form wins where several fit
+        self.terms_by_first_word = {}
+        for form, key in surface_forms.items():
+            words = tuple(_WORD_PATTERN.findall(form))
+            if words:
+                self.terms_by_first_word.setdefault(words[0], []).append((key, words))
+        for candidates in self.terms_by_first_word.values():
+            candidates.sort(key=lambda candidate: -len(candidate[1]))
+
+        vocabulary = {word for candidates in self.terms_by_first_word.values()
+                      for _, words in candidates for word in words}
+        self.allowed = {word: allowed_edits(word, max_edits) for word in vocabulary}
+
+        # Document word to the lexicon words it may stand for, filled lazily
+        self._lookups = {}
+
+    def lookup(self, token):
+        """
+        Find the lexicon words a token is, or is an OCR misreading of
+
+        Results are memoised per distinct token, so a document costs one
+        dictionary lookup per word once its vocabulary has been seen.
+
+        Args:
+            token (str): Lowercased document word
+
+        Returns:
+            frozenset: Matching lexicon words
+        """
+        words = self._lookups.get(token)
+        if words is None:
+            if token in self.allowed:
+                words = frozenset((token,))
+            elif not self.max_edits:
+                words = frozenset()
+            else:
+                corrections = ocr_corrections(token, self.max_edits, self.letter_cost)
+                words = frozenset(word for word, edits in corrections.items()
+                                  if word in self.allowed and edits <= self.allowed[word])
+            if len(self._lookups) >= self.lookup_cache_size:
+                self._lookups.clear()
+            self._lookups[token] = words
+        return words
+
+    def find(self, text_lower, exact_spans=()):
+        """
+        Find lexicon terms spelled with small errors
+
+        Args:
+            text_lower (str): Lowercased text
+            exact_spans (list): Sorted (start, end) spans already matched
+                exactly; fuzzy hits overlapping them are not reported
+
+        Returns:
+            list: (term key, start, end) tuples in document order
+        """
+        tokens = [(match.group(), match.start(), match.end()) for match in _WORD_PATTERN.finditer(text_lower)]
+        hits = []
+        exact_index = 0
+        position = 0
+
+        while position < len(tokens):
+            token, start, _ = tokens[position]
+            matched = None
+
+            for word in self.lookup(token):
+                for key, words in self.terms_by_first_word.get(word, ()):
+                    last = position + len(words) - 1
+                    if last < len(tokens) and all(
+                            words[offset] in self.lookup(tokens[position + offset][0])
+                            for offset in range(1, len(words))):
+                        if matched is None or len(words) > len(matched[1]):
+                            matched = (key, words, tokens[last][2])
+                        break
+
+            if matched is None:
+                position += 1
+                continue
+
+            key, words, end = matched
+            while exact_index < len(exact_spans) and exact_spans[exact_index][1] <= start:
+                exact_index += 1
+            overlaps_exact = exact_index < len(exact_spans) and exact_spans[exact_index][0] < end
+            if not overlaps_exact:
+                hits.append((key, start, end))
+            position += len(words)
+
+        return hits
@@ -0,0 +1,91 @@
+"""
+Inflection module for the JusticeAI application.
+Expands risk lexicon terms into their inflected surface forms, such as
+"breach" into "breaches", "breached" and "breaching".
+"""
+
+# Endings that take "es" rather than "s"
+_SIBILANT_ENDINGS = ("ss", "x", "z", "ch", "sh")
+
+# How a term or variant is inflected: plural only, plural and verb forms, or not at all
+INFLECTION_KINDS = ("noun", "verb", "none")
+
+def inflect(word, verb=False):
+    """
+    Generate the regular English inflections of a word
+
+    Nouns get a plural. Verbs also get the third person, past tense and
+    present participle, all built from the spelling alone. Words that
+    already look inflected are left as they are. Irregular forms, such as
+    "paid" or "transferred", are listed as lexicon variants instead.
+
+    Args:
+        word (str): Lowercase word or hyphenated compound
+        verb (bool): Whether the word is a regular verb
+
+    Returns:
+        set: The word and its inflected forms
+    """
+    forms = {word}
+    if len(word) < 3 or not word[-2:].isalpha():
+        return forms
+
+    # Already inflected, e.g. "damages", "legal fees" or "dismissed"
+    if (word.endswith("s") and not word.endswith("ss")) or word.endswith(("ed", "ing")):
+        return forms
+
+    if word[-1] == "y" and word[-2] not in "aeiou":
+        plural = word[:-1] + "ies"
+        past = word[:-1] + "ied"
+    elif word.endswith(_SIBILANT_ENDINGS):
+        plural = word + "es"
+        past = word + "ed"
+    elif word[-1] == "e":
+        plural = word + "s"
+        past = word + "d"
+    else:
+        plural = word + "s"
+        past = word + "ed"
+
+    forms.add(plural)
+    if not verb:
+        return forms
+
+    if word[-1] == "e" and not word.endswith("ee"):
+        participle = word[:-1] + "ing"
+    else:
+        participle = word + "ing"
+    forms.update((past, participle))
+
+    return forms
+
+def expand_term(term, variants=(), inflections=None):
+    """
+    List every surface form of a lexicon term
+
+    The last word of the term is inflected, so "notice period" also covers
+    "notice periods". Terms are inflected as nouns and variants are taken
+    as written, unless the lexicon marks them otherwise.
+
+    Args:
+        term (str): Canonical lexicon term
+        variants (iterable): Derived or irregular forms of the term, such as
+            "terminate" for "termination"
+        inflections (dict, optional): Lowercase term or variant to its
+            inflection kind, "noun", "verb" or "none"
+
+    Returns:
+        set: Lowercase surface forms, including the term itself
+    """
+    inflections = inflections or {}
+    forms = set()
+    for form, default_kind in ((term, "noun"), *((variant, "none") for variant in variants)):
+        form = form.lower()
+        kind = inflections.get(form, default_kind)
+        if kind == "none":
+            forms.add(form)
+            continue
+        head, _, last = form.rpartition(" ")
+        prefix = head + " " if head else ""
+        forms.update(prefix + inflected for inflected in inflect(last, verb=kind == "verb"))
+    return forms
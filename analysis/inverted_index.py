@@ -0,0 +1,173 @@
+"""
+Inverted index module for the JusticeAI application.
+Provides pruned top-k retrieval over large TF-IDF question matrices.
+"""
+
+import os
+
+import numpy as np
+
+# Slack used when comparing accumulated scores against pruning bounds, so
+# floating-point summation order never prunes a document that ties the bound
+SCORE_EPSILON = 1e-9
+
+class InvertedIndex:
+    """Term-at-a-time posting-list index with MaxScore-style pruning"""
+
+    def __init__(self, question_matrix):
+        """
+        Build posting lists from an L2-normalised question matrix
+
+        Args:
+            question_matrix (scipy.sparse matrix): Documents by terms TF-IDF matrix
+        """
+        postings = question_matrix.tocsc()
+        postings.sort_indices()
+
+        self.indptr = postings.indptr
+        self.doc_ids = postings.indices
+        self.weights = postings.data
+
+        # Highest weight of each term in any document, used as its score bound
+        self.max_weights = np.zeros(postings.shape[1], dtype=np.float64)
+        lengths = np.diff(self.indptr)
+        non_empty = lengths > 0
+        self.max_weights[non_empty] = np.maximum.reduceat(self.weights, self.indptr[:-1][non_empty])
+
+    @classmethod
+    def load(cls, directory, mmap=True):
+        """
+        Load posting lists written by save()
+
+        Args:
+            directory (str): Directory holding the posting arrays
+            mmap (bool): Map the arrays read-only instead of reading them
+
+        Returns:
+            InvertedIndex: The loaded index
+        """
+        mmap_mode = 'r' if mmap else None
+        index = cls.__new__(cls)
+        index.indptr = np.load(os.path.join(directory, "postings_indptr.npy"), mmap_mode=mmap_mode)
+        index.doc_ids = np.load(os.path.join(directory, "postings_doc_ids.npy"), mmap_mode=mmap_mode)
+        index.weights = np.load(os.path.join(directory, "postings_weights.npy"), mmap_mode=mmap_mode)
+        index.max_weights = np.load(os.path.join(directory, "postings_max_weights.npy"), mmap_mode=mmap_mode)
+        return index
+
+    def save(self, directory):
+        """
+        Write the posting arrays to a directory
+
+        Args:
+            directory (str): Existing directory to write into
+        """
+        np.save(os.path.join(directory, "postings_indptr.npy"), self.indptr)
+        np.save(os.path.join(directory, "postings_doc_ids.npy"), self.doc_ids)
+        np.save(os.path.join(directory, "postings_weights.npy"), self.weights)
+        np.save(os.path.join(directory, "postings_max_weights.npy"), self.max_weights)
+
+    def search(self, term_ids, term_weights, k, min_score=0.0):
+        """
+        Find the top k documents for one query vector
+
+        Terms are processed in decreasing order of their score bound. Once the
+        bounds of the unprocessed terms cannot lift an unseen document to the
+        current threshold, new documents stop being admitted, and candidates
+        that can no longer reach it are dropped.
+
+        Args:
+            term_ids (array): Term ids present in the query
+            term_weights (array): Query weight of each term
+            k (int): Number of documents to return
+            min_score (float): Documents scoring below this are never returned
+
+        Returns:
+            tuple: (doc_ids, scores) arrays, best document first
+        """
+        empty = (np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float64))
+        if k <= 0 or len(term_ids) == 0:
+            return empty
+
+        bounds = term_weights * self.max_weights[term_ids]
+        order = np.argsort(-bounds, kind='stable')
+        term_ids = term_ids[order]
+        term_weights = term_weights[order]
+
+        # remaining[i] is the best score terms i.. can still add to a document
+        remaining = np.append(np.cumsum(bounds[order][::-1])[::-1], 0.0)
+
+        candidate_ids = np.empty(0, dtype=np.int32)
+        candidate_scores = np.empty(0, dtype=np.float64)
+
+        for position, (term_id, term_weight) in enumerate(zip(term_ids, term_weights)):
+            threshold = self._threshold(candidate_scores, k, min_score)
+            start, end = self.indptr[term_id], self.indptr[term_id + 1]
+            posting_ids = self.doc_ids[start:end]
+            posting_scores = term_weight * self.weights[start:end]
+
+            if len(posting_ids) == 0:
+                continue
+
+            if remaining[position] >= threshold - SCORE_EPSILON:
+                # Unseen documents can still qualify, so merge the whole list
+                merged_ids = np.concatenate((candidate_ids, posting_ids))
+                merged_scores = np.concatenate((candidate_scores, posting_scores))
+                candidate_ids, inverse = np.unique(merged_ids, return_inverse=True)
+                candidate_scores = np.bincount(inverse, weights=merged_scores)
+            elif len(candidate_ids):
+                # Only existing candidates can qualify, so just look them up
+                slots = np.searchsorted(posting_ids, candidate_ids)
+                slots[slots == len(posting_ids)] = 0
+                hits = posting_ids[slots] == candidate_ids
+                candidate_scores[hits] += posting_scores[slots[hits]]
+
+            # Drop candidates that cannot reach the threshold any more
+            threshold = self._threshold(candidate_scores, k, min_score)
+            alive = candidate_scores + remaining[position + 1] >= threshold - SCORE_EPSILON
+            candidate_ids = candidate_ids[alive]
+            candidate_scores = candidate_scores[alive]
+
+        qualified = candidate_scores >= min_score - SCORE_EPSILON
+        candidate_ids = candidate_ids[qualified]
+        candidate_scores = candidate_scores[qualified]
+
+        if len(candidate_ids) > k:
+            keep = np.argpartition(-candidate_scores, k - 1)[:k]
+            candidate_ids = candidate_ids[keep]
+            candidate_scores = candidate_scores[keep]
+
+        # Ties are broken by the lower document id
+        ranking = np.lexsort((candidate_ids, -candidate_scores))
+        return candidate_ids[ranking].astype(np.intp), candidate_scores[ranking]
+
+    def search_batch(self, query_matrix, k, min_score=0.0):
+        """
+        Find the top k documents for every row of a query matrix
+
+        Args:
+            query_matrix (scipy.sparse.csr_matrix): Queries by terms TF-IDF matrix
+            k (int): Number of documents to return per query
+            min_score (float): Documents scoring below this are never returned
+
+        Returns:
+            tuple: (indices, scores) lists with one array per query
+        """
+        query_matrix = query_matrix.tocsr()
+        top_indices, top_scores = [], []
+
+        for row in range(query_matrix.shape[0]):
+            start, end = query_matrix.indptr[row], query_matrix.indptr[row + 1]
+            doc_ids, scores = self.search(
+                query_matrix.indices[start:end], query_matrix.data[start:end], k, min_score)
+            top_indices.append(doc_ids)
+            top_scores.append(scores)
+
+        return top_indices, top_scores
+
+    @staticmethod
+    def _threshold(candidate_scores, k, min_score):
+        """Lower bound on the final k-th best score, never below min_score"""
+        if len(candidate_scores) < k:
+            return min_score
+        kth_score = np.partition(candidate_scores, len(candidate_scores) - k)[len(candidate_scores) - k]
+        return max(min_score, kth_score)
@@ -0,0 +1,109 @@
+"""
+LSA index module for the JusticeAI application.
+Provides dense latent semantic retrieval over TF-IDF question matrices.
+"""
+
+import os
+
+import numpy as np
+from sklearn.decomposition import TruncatedSVD
+
+# Local imports
+from config import FAQ_LSA_COMPONENTS
+from analysis.ranking import dense_top_k
+
+class LSAIndex:
+    """Low-rank dense embedding of a question matrix, scored with BLAS products"""
+
+    def __init__(self, question_matrix, n_components=FAQ_LSA_COMPONENTS, random_state=0):
+        """
+        Fit a truncated SVD of the question matrix
+
+        Args:
+            question_matrix (scipy.sparse matrix): Documents by terms TF-IDF matrix
+            n_components (int): Number of latent dimensions, capped by the matrix rank
+            random_state (int): Seed for the randomized SVD
+        """
+        n_components = max(1, min(n_components, min(question_matrix.shape) - 1))
+        svd = TruncatedSVD(n_components=n_components, random_state=random_state)
+        svd.fit(question_matrix)
+
+        # Stored as terms by components so a query projects with one product
+        self.components = np.ascontiguousarray(svd.components_.T, dtype=np.float32)
+        self.embeddings = self.embed(question_matrix)
+
+    @classmethod
+    def can_fit(cls, question_matrix):
+        """Check whether a matrix has enough rows and terms for a decomposition"""
+        return min(question_matrix.shape) >= 2
+
+    @classmethod
+    def load(cls, directory, mmap=True):
+        """
+        Load the projection and embeddings written by save()
+
+        Args:
+            directory (str): Directory holding the LSA arrays
+            mmap (bool): Map the arrays read-only instead of reading them
+
+        Returns:
+            LSAIndex: The loaded index
+        """
+        mmap_mode = 'r' if mmap else None
+        index = cls.__new__(cls)
+        index.components = np.load(os.path.join(directory, "lsa_components.npy"), mmap_mode=mmap_mode)
+        index.embeddings = np.load(os.path.join(directory, "lsa_embeddings.npy"), mmap_mode=mmap_mode)
+        return index
+
+    def save(self, directory):
+        """
+        Write the projection and embeddings to a directory
+
+        Args:
+            directory (str): Existing directory to write into
+        """
+        np.save(os.path.join(directory, "lsa_components.npy"), self.components)
+        np.save(os.path.join(directory, "lsa_embeddings.npy"), self.embeddings)
+
+    def embed(self, matrix):
+        """
+        Project TF-IDF rows into the latent space
+
+        Args:
+            matrix (scipy.sparse matrix): Rows over the fitted vocabulary
+
+        Returns:
+            numpy.ndarray: C-contiguous float32 rows, L2-normalised
+        """
+        embedded = np.ascontiguousarray(matrix.astype(np.float32) @ self.components, dtype=np.float32)
+        norms = np.linalg.norm(embedded, axis=1, keepdims=True)
+        np.divide(embedded, norms, out=embedded, where=norms > 0)
+        return embedded
+
+    def similarities(self, query_matrix, row_matrix):
+        """
+        Latent-space cosine similarity between queries and arbitrary rows
+
+        Args:
+            query_matrix (scipy.sparse matrix): Query TF-IDF vectors
+            row_matrix (scipy.sparse matrix): Document TF-IDF vectors
+
+        Returns:
+            numpy.ndarray: Array of shape (num_queries, num_rows)
+        """
+        return self.embed(query_matrix) @ self.embed(row_matrix).T
+
+    def search_batch(self, query_matrix, k, block_size=4096):
+        """
+        Find the top k questions for every query vector
+
+        Args:
+            query_matrix (scipy.sparse matrix): Query TF-IDF vectors
+            k (int): Number of questions to return per query
+            block_size (int): Maximum number of queries scored together
+
+        Returns:
+            tuple: (indices, scores) arrays of shape (num_queries, k), best
+                   question first in every row
+        """
+        return dense_top_k(self.embed(query_matrix), self.embeddings, k, block_size)
@@ -0,0 +1,269 @@
+"""
+Proximity module for the JusticeAI application.
+Evaluates risk rules that combine terms appearing close together, such as
+"termination" within a few words of "without notice".
+"""
+
+import heapq
+import re
+from collections import deque
+
+# Same word definition for documents and rule terms
+_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Words plus the punctuation that ends a sentence or clause
+_INDEX_PATTERN = re.compile(r"[a-z0-9]+|[.!?;](?=\s)")
+
+# Positions skipped at the end of a sentence, so no rule spans two sentences
+_SENTENCE_GAP = 1 << 16
+
+def tokenize(text):
+    """Lowercase alphanumeric tokens of a text"""
+    return _WORD_PATTERN.findall(text.lower())
+
+class ProximityRule:
+    """Risk pattern matched when all of its terms occur within a few words"""
+
+    def __init__(self, name, terms, within, level, weight):
+        """
+        Create a rule
+
+        Args:
+            name (str): Rule name shown to reviewers
+            terms (list): Two or more words or phrases that must all occur
+            within (int): Largest distance in words between the first words
+                of the earliest and the latest term
+            level (str): Risk level reported for a hit
+            weight (float): Score added for every hit
+
+        Raises:
+            ValueError: If the rule is malformed
+        """
+        self.name = name
+        self.phrases = [tuple(tokenize(term)) for term in terms]
+        self.within = within
+        self.level = level
+        self.weight = float(weight)
+
+        if len(self.phrases) < 2 or not all(self.phrases):
+            raise ValueError(f"Proximity rule '{name}' needs at least two non-empty terms")
+        if not isinstance(within, int) or not 0 <= within < _SENTENCE_GAP:
+            raise ValueError(f"Proximity rule '{name}' has an invalid distance: {within!r}")
+
+    def to_dict(self):
+        """Plain representation, used for hashing lexicons"""
+        return {
+            "name": self.name,
+            "terms": [" ".join(phrase) for phrase in self.phrases],
+            "within": self.within,
+            "level": self.level,
+            "weight": self.weight
+        }
+
+class PositionalTokenIndex:
+    """Sorted token positions and character offsets for a set of words in one document"""
+
+    def __init__(self, text, vocabulary, keep_last=0):
+        """
+        Index every occurrence of the vocabulary in one scan of the text
+
+        Words are numbered in order, and every sentence end advances the
+        numbering by a large gap so that words of different sentences are
+        never within a rule's distance.
+
+        Args:
+            text (str): Document text
+            vocabulary (set): Lowercase tokens worth indexing
+            keep_last (int): Number of final words whose (token position,
+                start offset) pairs are kept in last_words
+        """
+        # Token to list of (token position, start offset, end offset), sorted
+        self.postings = {token: [] for token in vocabulary}
+        self.last_words = deque(maxlen=keep_last)
+
+        position = 0
+        for match in _INDEX_PATTERN.finditer(text.lower()):
+            token = match.group()
+            if not token[0].isalnum():
+                position += _SENTENCE_GAP
+                continue
+
+            postings = self.postings.get(token)
+            if postings is not None:
+                postings.append((position, match.start(), match.end()))
+            if keep_last:
+                self.last_words.append((position, match.start()))
+            position += 1
+
+        # Position the next word of a longer text would get
+        self.length = position
+
+    def phrase_occurrences(self, phrase):
+        """
+        Find a phrase by merging the position lists of its words
+
+        Each word's sorted list is merged with the running list of phrase
+        prefixes in one linear pass, keeping prefixes followed directly by it.
+
+        Args:
+            phrase (tuple): Tokens of the phrase
+
+        Returns:
+            list: Sorted (token position, start offset, end offset) tuples
+        """
+        occurrences = self.postings.get(phrase[0], [])
+
+        for offset, token in enumerate(phrase[1:], 1):
+            following = self.postings.get(token, [])
+            merged = []
+            i = j = 0
+            while i < len(occurrences) and j < len(following):
+                wanted = occurrences[i][0] + offset
+                if following[j][0] < wanted:
+                    j += 1
+                elif following[j][0] > wanted:
+                    i += 1
+                else:
+                    merged.append((occurrences[i][0], occurrences[i][1], following[j][2]))
+                    i += 1
+                    j += 1
+            occurrences = merged
+
+        return occurrences
+
+def find_rule_matches(text, rules):
+    """
+    Evaluate proximity rules against a document
+
+    The text is tokenized once into a positional index of the words the
+    rules use, so the cost of extra rules does not grow with the document.
+    Every rule merges the sorted occurrence lists of its terms and slides a
+    window over them; once all terms fall inside the window a hit is
+    reported and the window restarts after it.
+
+    Args:
+        text (str): Document text
+        rules (list): ProximityRule objects
+
+    Returns:
+        list: Hit dicts (rule, level, weight, start, end and the matched
+              text), sorted by start
+    """
+    if not rules or not text:
+        return []
+    return RuleStream(rules).feed(text, final=True)
+
+class RuleStream:
+    """
+    Proximity rules evaluated over a document that arrives in pieces
+
+    Each rule's window is carried from one piece to the next, so the hits,
+    their offsets and their order are exactly those find_rule_matches gives
+    for the joined text. Only the words a window or a phrase can still reach
+    are held, however long a sentence runs.
+    """
+
+    def __init__(self, rules):
+        """
+        Start evaluating rules at the beginning of a document
+
+        Args:
+            rules (list): ProximityRule objects
+        """
+        self.rules = rules
+        self.vocabulary = {token for rule in rules for phrase in rule.phrases for token in phrase}
+        self.phrase_length = max((len(phrase) for rule in rules for phrase in rule.phrases), default=1)
+        self.windows = [deque() for _ in rules]
+        self.term_counts = [[0] * len(rule.phrases) for rule in rules]
+
+        # Text not yet released, with the absolute offset and token position
+        # of its first word, and where unscanned occurrences start within it
+        self.buffer = ""
+        self.offset = 0
+        self.position = 0
+        self.resume = 0
+
+        # Hits found but not yet returned, as (start, end, rule number, hit)
+        self.pending = []
+
+    def feed(self, text, final=False):
+        """
+        Add the next piece of the document
+
+        Args:
+            text (str): Next piece, which may end in the middle of a word
+            final (bool): Whether this is the last piece
+
+        Returns:
+            list: Hit dicts with absolute offsets that no later text can
+                  precede, sorted by start
+        """
+        if not self.rules:
+            return []
+        self.buffer += text
+
+        # The last words may be cut off or begin a phrase that continues in
+        # the next piece, so occurrences are only scanned up to them
+        index = PositionalTokenIndex(self.buffer, self.vocabulary, 0 if final else self.phrase_length)
+        if final:
+            split, split_position = len(self.buffer), index.length
+        elif len(index.last_words) == self.phrase_length:
+            split_position, split = index.last_words[0]
+        else:
+            return []
+
+        for number, rule in enumerate(self.rules):
+            term_occurrences = [
+                [(self.position + position, self.offset + start, self.offset + end, term_id)
+                 for position, start, end in index.phrase_occurrences(phrase) if self.resume <= start < split]
+                for term_id, phrase in enumerate(rule.phrases)
+            ]
+            window = self.windows[number]
+            term_counts = self.term_counts[number]
+            for occurrence in heapq.merge(*term_occurrences):
+                position = occurrence[0]
+                while window and window[0][0] < position - rule.within:
+                    term_counts[window.popleft()[3]] -= 1
+
+                window.append(occurrence)
+                term_counts[occurrence[3]] += 1
+
+                if all(term_counts):
+                    start = window[0][1]
+                    end = max(end for _, _, end, _ in window)
+                    self.pending.append((start, end, number, {
+                        "rule": rule.name,
+                        "level": rule.level,
+                        "weight": rule.weight,
+                        "start": start,
+                        "end": end,
+                        "text": self.buffer[start - self.offset:end - self.offset]
+                    }))
+                    window.clear()
+                    term_counts[:] = [0] * len(rule.phrases)
+
+            # Words further back than the rule's distance can never join a
+            # later occurrence, which the next occurrence would confirm
+            while window and window[0][0] < self.position + split_position - rule.within:
+                term_counts[window.popleft()[3]] -= 1
+
+        if final:
+            released, self.pending = self.pending, []
+        else:
+            # Later hits start at a word still in a window, or after the split
+            keep_from, keep_position = split, self.position + split_position
+            for window in self.windows:
+                if window and window[0][1] - self.offset < keep_from:
+                    keep_from, keep_position = window[0][1] - self.offset, window[0][0]
+
+            bound = self.offset + keep_from
+            released = [hit for hit in self.pending if hit[0] < bound]
+            self.pending = [hit for hit in self.pending if hit[0] >= bound]
+
+            self.buffer = self.buffer[keep_from:]
+            self.offset += keep_from
+            self.position = keep_position
+            self.resume = split - keep_from
+
+        released.sort(key=lambda hit: hit[:3])
+        return [hit for _, _, _, hit in released]
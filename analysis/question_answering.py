@@ -4,12 +4,21 @@ Matches user questions to pre-defined legal FAQs.
 """
 
 import re
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 
 # Local imports
-from config import SIMILARITY_THRESHOLD
-from data.legal_faq import LEGAL_FAQ_CATEGORIES
+from config import SIMILARITY_THRESHOLD, ANSWER_CACHE_SIZE, ANSWER_CACHE_TTL
+from analysis.faq_index import get_faq_index
+from utils.cache import LRUCache
+
+# Number of ranked candidates needed to build a result: the best match plus
+# up to three related questions
+TOP_K_CANDIDATES = 4
+
+# Lowest similarity at which a question is still offered as related
+MIN_RELATED_SIMILARITY = 0.3
+
+# Answers keyed on (FAQ version, category, cleaned question)
+_answer_cache = LRUCache(ANSWER_CACHE_SIZE, ANSWER_CACHE_TTL)
 
 def get_answer_for_question(question, category=None):
     """
@@ -22,73 +31,154 @@ def get_answer_for_question(question, category=None):
     Returns:
         dict: Result containing matching answer and related information
     """
-    # Clean the question
-    clean_question = _clean_text(question)
-    
-    # Get all questions and answers
-    all_qa_pairs = _get_qa_pairs(category)
-    
-    if not all_qa_pairs:
-        return {
-            "question": question,
-            "found": False,
-            "similar_questions": []
-        }
+    return get_answers_for_questions([question], category)[0]
+
+def get_answers_for_questions(questions, category=None):
+    """
+    Find the best matching answers for a batch of questions
     
-    # Get all questions for vectorization
-    all_questions = [qa["question"] for qa in all_qa_pairs]
+    The whole batch is vectorised at once and scored against the FAQ
+    matrix with a single sparse matrix product.
     
-    # Create TF-IDF vectorizer
-    vectorizer = TfidfVectorizer(stop_words='english')
+    Args:
+        questions (list): The user's questions
+        category (str, optional): Specific category to search within
+        
+    Returns:
+        list: One result dict per question, in input order
+    """
+    # Clean the questions
+    clean_questions = [_clean_text(question) for question in questions]
     
     try:
-        # Fit and transform the questions
-        question_vectors = vectorizer.fit_transform(all_questions)
+        faq_index = get_faq_index()
+        category_key = faq_index.resolve_category(category)
         
-        # Transform the user's question
-        user_question_vector = vectorizer.transform([clean_question])
+        # Serve repeated questions from the cache and only score the rest
+        results = [None] * len(questions)
+        cache_keys = [(faq_index.version, category_key, clean) for clean in clean_questions]
+        for row, key in enumerate(cache_keys):
+            cached = _answer_cache.get(key)
+            if cached is not None:
+                results[row] = _copy_result(cached, questions[row])
         
-        # Calculate similarity with all questions
-        similarities = cosine_similarity(user_question_vector, question_vectors)[0]
+        pending = [row for row, result in enumerate(results) if result is None]
+        if not pending:
+            return results
         
-        # Find the best match
-        best_match_idx = similarities.argmax()
-        best_match_similarity = similarities[best_match_idx]
+        # Get the prebuilt searcher for the requested category
+        index = faq_index.get_searcher(category_key)
         
-        # Check if similarity is above threshold
-        if best_match_similarity >= SIMILARITY_THRESHOLD:
-            best_qa = all_qa_pairs[best_match_idx]
-            
-            # Get similar questions (excluding the best match)
-            similar_questions = _get_similar_questions(similarities, all_qa_pairs, best_match_idx)
-            
-            return {
-                "question": best_qa["question"],
-                "answer": best_qa["answer"],
-                "category": best_qa.get("category"),
-                "similarity": best_match_similarity,
-                "found": True,
-                "similar_questions": similar_questions
-            }
-        else:
-            # No good match found, return the most similar questions
-            similar_indices = similarities.argsort()[-3:][::-1]  # Top 3 most similar
-            similar_questions = [all_qa_pairs[i]["question"] for i in similar_indices 
-                               if similarities[i] > 0.3]  # Only include somewhat similar questions
-            
-            return {
-                "question": question,
-                "found": False,
-                "similar_questions": similar_questions
-            }
+        if index is None:
+            for row in pending:
+                results[row] = {
+                    "question": questions[row],
+                    "found": False,
+                    "similar_questions": []
+                }
+            return results
+        
+        # Rank the best candidates for every question in one pass
+        top_indices, top_scores = index.top_k(
+            [clean_questions[row] for row in pending], TOP_K_CANDIDATES, MIN_RELATED_SIMILARITY)
+        
+        for position, row in enumerate(pending):
+            result = _build_result(questions[row], index.qa_pairs, top_indices[position], top_scores[position])
+            _answer_cache.put(cache_keys[row], _copy_result(result, questions[row]))
+            results[row] = result
+        
+        return results
             
     except Exception as e:
         # Handle vectorization errors (e.g., empty input)
-        return {
+        return [{
             "question": question,
             "found": False,
             "error": str(e),
             "similar_questions": []
+        } for question in questions]
+
+def get_answer_cache_stats():
+    """
+    Get hit, miss and eviction counters of the answer cache
+    
+    Returns:
+        dict: Cache statistics
+    """
+    return _answer_cache.stats()
+
+def clear_answer_cache():
+    """Drop every cached answer, e.g. after the FAQ data was edited"""
+    _answer_cache.clear()
+
+def _copy_result(result, question):
+    """
+    Copy a result so cached entries are never shared with callers
+    
+    Args:
+        result (dict): Result to copy
+        question (str): The user's question as asked this time
+        
+    Returns:
+        dict: Independent copy of the result
+    """
+    result = dict(result, similar_questions=list(result["similar_questions"]))
+    
+    # Unanswered results echo the user's own wording, which may differ
+    # between questions that clean to the same text
+    if not result["found"]:
+        result["question"] = question
+    
+    return result
+
+def _build_result(question, qa_pairs, ranked_indices, ranked_scores):
+    """
+    Build the answer result for one question from its ranked candidates
+    
+    Args:
+        question (str): The user's question
+        qa_pairs (list): Question-answer dictionaries of the searched index
+        ranked_indices (array): Candidate indices, best first
+        ranked_scores (array): Similarity of each candidate
+        
+    Returns:
+        dict: Result containing matching answer and related information
+    """
+    if len(ranked_indices) == 0:
+        return {
+            "question": question,
+            "found": False,
+            "similar_questions": []
+        }
+    
+    # Find the best match
+    best_match_idx = ranked_indices[0]
+    best_match_similarity = ranked_scores[0]
+    
+    # Check if similarity is above threshold
+    if best_match_similarity >= SIMILARITY_THRESHOLD:
+        best_qa = qa_pairs[best_match_idx]
+        
+        # Get similar questions (excluding the best match)
+        similar_questions = _get_similar_questions(ranked_indices, ranked_scores, qa_pairs, best_match_idx)
+        
+        return {
+            "question": best_qa["question"],
+            "answer": best_qa["answer"],
+            "category": best_qa.get("category"),
+            "similarity": best_match_similarity,
+            "found": True,
+            "similar_questions": similar_questions
+        }
+    else:
+        # No good match found, return the most similar questions
+        similar_questions = [qa_pairs[i]["question"] for i, score in zip(ranked_indices[:3], ranked_scores[:3])
+                             if score > MIN_RELATED_SIMILARITY]  # Only include somewhat similar questions
+        
+        return {
+            "question": question,
+            "found": False,
+            "similar_questions": similar_questions
         }
 
 def _clean_text(text):
@@ -112,45 +202,13 @@ def _clean_text(text):
     
     return text.strip()
 
-def _get_qa_pairs(category=None):
-    """
-    Get question-answer pairs, optionally filtered by category
-    
-    Args:
-        category (str, optional): Category to filter by
-        
-    Returns:
-        list: List of question-answer dictionaries
-    """
-    qa_pairs = []
-    
-    # If category specified, only get Q&A from that category
-    if category and category in LEGAL_FAQ_CATEGORIES:
-        questions = LEGAL_FAQ_CATEGORIES[category]
-        for question, answer in questions.items():
-            qa_pairs.append({
-                "question": question,
-                "answer": answer,
-                "category": category
-            })
-    else:
-        # Get Q&A from all categories
-        for category, questions in LEGAL_FAQ_CATEGORIES.items():
-            for question, answer in questions.items():
-                qa_pairs.append({
-                    "question": question,
-                    "answer": answer,
-                    "category": category
-                })
-    
-    return qa_pairs
-
-def _get_similar_questions(similarities, qa_pairs, best_match_idx, max_questions=3, min_similarity=0.5):
+def _get_similar_questions(ranked_indices, ranked_scores, qa_pairs, best_match_idx, max_questions=3, min_similarity=0.5):
     """
     Get similar questions based on similarity scores
     
     Args:
-        similarities (array): Array of similarity scores
+        ranked_indices (array): Candidate indices, best first
+        ranked_scores (array): Similarity of each candidate
         qa_pairs (list): List of question-answer dictionaries
         best_match_idx (int): Index of the best match to exclude
         max_questions (int): Maximum number of similar questions to return
@@ -159,13 +217,10 @@ def _get_similar_questions(similarities, qa_pairs, best_match_idx, max_questions
     Returns:
         list: List of similar questions
     """
-    # Get indices of top similar questions
-    similar_indices = similarities.argsort()[-(max_questions+1):][::-1]
-    
     # Filter out the best match and questions below the similarity threshold
     similar_questions = []
-    for idx in similar_indices:
-        if idx != best_match_idx and similarities[idx] >= min_similarity:
+    for idx, score in zip(ranked_indices[:max_questions + 1], ranked_scores[:max_questions + 1]):
+        if idx != best_match_idx and score >= min_similarity:
             similar_questions.append(qa_pairs[idx]["question"])
     
     return similar_questions
@@ -0,0 +1,199 @@
+"""
+Question suggester module for the JusticeAI application.
+Autocompletes partially typed questions from the legal FAQ with a token trie.
+"""
+
+import re
+import threading
+
+# Local imports
+from config import MAX_SUGGESTIONS
+from analysis.faq_index import get_faq_index
+from data.legal_faq import LEGAL_FAQ_CATEGORIES
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+class _TrieNode:
+    """One character of a token, with the questions reachable below it"""
+
+    __slots__ = ("children", "question_ids", "word_ids")
+
+    def __init__(self):
+        self.children = {}
+        # Questions with a token starting with this node's prefix
+        self.question_ids = set()
+        # Questions with a token ending exactly at this node
+        self.word_ids = set()
+
+class QuestionTrie:
+    """Token trie over FAQ questions that answers prefix lookups"""
+
+    def __init__(self, faq_categories=None):
+        """
+        Index every token of every FAQ question
+
+        Args:
+            faq_categories (dict, optional): Category to {question: answer}
+                mapping, defaults to the bundled legal FAQ
+        """
+        if faq_categories is None:
+            faq_categories = LEGAL_FAQ_CATEGORIES
+
+        self.questions = []
+        self.categories = []
+        self._question_tokens = []
+        self._root = _TrieNode()
+
+        for category, questions in faq_categories.items():
+            for question in questions:
+                self._insert(question, category)
+
+    def __len__(self):
+        return len(self.questions)
+
+    def _insert(self, question, category):
+        """Add one question under every token it contains"""
+        question_id = len(self.questions)
+        tokens = _tokenize(question)
+
+        self.questions.append(question)
+        self.categories.append(category)
+        self._question_tokens.append(tuple(tokens))
+
+        for token in set(tokens):
+            node = self._root
+            for char in token:
+                node = node.children.setdefault(char, _TrieNode())
+                node.question_ids.add(question_id)
+            node.word_ids.add(question_id)
+
+    def _find(self, prefix):
+        """Walk the trie to the node of a token prefix, or None"""
+        node = self._root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def suggest(self, text, category=None, limit=MAX_SUGGESTIONS):
+        """
+        Complete a partially typed question
+
+        Every word typed so far must appear in a suggestion; the last word
+        only as a prefix unless it is followed by whitespace. Questions that
+        begin with the typed words come first, the rest follow, each group in
+        FAQ order.
+
+        Args:
+            text (str): What the user has typed so far
+            category (str, optional): Only suggest questions of this category
+            limit (int): Maximum number of suggestions
+
+        Returns:
+            list: Matching FAQ questions
+        """
+        tokens = _tokenize(text)
+        if not tokens or limit <= 0:
+            return []
+
+        last_is_prefix = not text[-1:].isspace()
+
+        id_sets = []
+        for position, token in enumerate(tokens):
+            node = self._find(token)
+            if node is None:
+                return []
+            if last_is_prefix and position == len(tokens) - 1:
+                id_sets.append(node.question_ids)
+            else:
+                id_sets.append(node.word_ids)
+
+        # Intersect starting from the rarest token to keep the work small
+        id_sets.sort(key=len)
+        candidates = set(id_sets[0])
+        for ids in id_sets[1:]:
+            candidates &= ids
+            if not candidates:
+                return []
+
+        leading, others = [], []
+        for question_id in sorted(candidates):
+            if category is not None and self.categories[question_id] != category:
+                continue
+            if self._starts_with(question_id, tokens, last_is_prefix):
+                leading.append(question_id)
+                if len(leading) >= limit:
+                    break
+            elif len(others) < limit:
+                others.append(question_id)
+
+        return [self.questions[question_id] for question_id in (leading + others)[:limit]]
+
+    def _starts_with(self, question_id, tokens, last_is_prefix):
+        """Check whether a question begins with the typed tokens"""
+        question_tokens = self._question_tokens[question_id]
+        if len(question_tokens) < len(tokens):
+            return False
+
+        head = list(question_tokens[:len(tokens)])
+        if last_is_prefix:
+            return head[:-1] == tokens[:-1] and head[-1].startswith(tokens[-1])
+        return head == tokens
+
+def _tokenize(text):
+    """Lowercase alphanumeric tokens of a question"""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+# (FAQ index, version, trie) of the last trie built
+_question_trie = (None, None, None)
+_question_trie_lock = threading.Lock()
+
+def get_question_trie(faq_index=None):
+    """
+    Get the question trie of the live FAQ, rebuilding it after edits
+
+    The trie is rebuilt once whenever the FAQ index's version changes, so
+    questions added, updated or removed through the index are suggested
+    from the next request on.
+
+    Args:
+        faq_index (FAQIndex, optional): FAQ to suggest from, defaults to the
+            shared index
+
+    Returns:
+        QuestionTrie: Trie over the current questions of the FAQ
+    """
+    global _question_trie
+
+    if faq_index is None:
+        faq_index = get_faq_index()
+
+    # The version is read before the data, so a racing edit at worst pairs
+    # an old version with new data and the next call rebuilds once more
+    version = faq_index.version
+    built_for, built_version, trie = _question_trie
+    if built_for is faq_index and built_version == version:
+        return trie
+
+    with _question_trie_lock:
+        built_for, built_version, trie = _question_trie
+        if built_for is not faq_index or built_version != version:
+            trie = QuestionTrie(faq_index.faq_categories)
+            _question_trie = (faq_index, version, trie)
+
+    return trie
+
+def suggest_questions(text, category=None, limit=MAX_SUGGESTIONS):
+    """
+    Suggest FAQ questions that complete a partially typed question
+
+    Args:
+        text (str): What the user has typed so far
+        category (str, optional): Only suggest questions of this category
+        limit (int): Maximum number of suggestions
+
+    Returns:
+        list: Matching FAQ questions
+    """
+    return get_question_trie().suggest(text, category, limit)
@@ -0,0 +1,112 @@
+"""
+Ranking module for the JusticeAI application.
+Selects the top-scoring rows of dense score blocks.
+"""
+
+import numpy as np
+
+# Largest dense score block built at once (float64 elements, about 128 MB)
+MAX_BLOCK_ELEMENTS = 1 << 24
+
+def rank_top_k(scores, k):
+    """
+    Pick the k best columns of every row of a dense score block
+
+    Uses argpartition so only k candidates per row are sorted. Ties are always
+    broken by the lower column, including ties at the k-th place, so results
+    are deterministic and agree with numpy's argmax and with any search that
+    splits the columns into contiguous ranges.
+
+    Args:
+        scores (numpy.ndarray): Array of shape (num_rows, num_columns)
+        k (int): Number of columns to keep, at most num_columns
+
+    Returns:
+        tuple: (indices, scores) arrays of shape (num_rows, k), best first
+    """
+    num_rows, num_columns = scores.shape
+    rows = np.arange(num_rows)[:, None]
+
+    if k == 0:
+        return np.empty((num_rows, 0), dtype=np.intp), np.empty((num_rows, 0), dtype=scores.dtype)
+
+    if k < num_columns:
+        candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    else:
+        candidates = np.broadcast_to(np.arange(num_columns), scores.shape)
+    candidates = np.array(candidates, dtype=np.intp)
+
+    candidate_scores = scores[rows, candidates]
+
+    if k < num_columns:
+        # argpartition cuts ties at the k-th place arbitrarily; re-pick those
+        # rows so the lowest columns win
+        kth_scores = candidate_scores.min(axis=1)
+        overflowing = np.flatnonzero((scores >= kth_scores[:, None]).sum(axis=1) > k)
+        for row in overflowing:
+            above = np.flatnonzero(scores[row] > kth_scores[row])
+            tied = np.flatnonzero(scores[row] == kth_scores[row])[:k - len(above)]
+            candidates[row] = np.concatenate((above, tied))
+            candidate_scores[row] = scores[row, candidates[row]]
+
+    order = np.lexsort((candidates, -candidate_scores), axis=1)
+    return candidates[rows, order], candidate_scores[rows, order]
+
+def sparse_top_k(query_matrix, question_matrix, k, block_size=4096):
+    """
+    Rank the k most similar rows of a question matrix for every query
+
+    The batch is scored with one sparse matrix product per block of queries;
+    blocks keep the dense score buffer bounded for very large batches, and
+    shrink further on large corpora so a block never exceeds
+    MAX_BLOCK_ELEMENTS scores.
+
+    Args:
+        query_matrix (scipy.sparse matrix): L2-normalised query vectors
+        question_matrix (scipy.sparse matrix): L2-normalised question vectors
+        k (int): Number of rows to return per query
+        block_size (int): Maximum number of queries scored together
+
+    Returns:
+        tuple: (indices, scores) arrays of shape (num_queries, k), best first
+    """
+    num_queries = query_matrix.shape[0]
+    k = min(k, question_matrix.shape[0])
+    block_size = max(1, min(block_size, MAX_BLOCK_ELEMENTS // max(1, question_matrix.shape[0])))
+    top_indices = np.empty((num_queries, k), dtype=np.intp)
+    top_scores = np.empty((num_queries, k), dtype=np.float64)
+
+    for start in range(0, num_queries, block_size):
+        block = query_matrix[start:start + block_size]
+        scores = (block @ question_matrix.T).toarray()
+        top_indices[start:start + block_size], top_scores[start:start + block_size] = rank_top_k(scores, k)
+
+    return top_indices, top_scores
+
+def dense_top_k(query_embeddings, embeddings, k, block_size=4096):
+    """
+    Rank the k most similar rows of a dense embedding matrix for every query
+
+    Each block of queries is scored with a single matrix product against the
+    embedding matrix (a matrix-vector product for one query).
+
+    Args:
+        query_embeddings (numpy.ndarray): L2-normalised query embeddings
+        embeddings (numpy.ndarray): L2-normalised row embeddings
+        k (int): Number of rows to return per query
+        block_size (int): Maximum number of queries scored together
+
+    Returns:
+        tuple: (indices, scores) arrays of shape (num_queries, k), best first
+    """
+    num_queries = query_embeddings.shape[0]
+    k = min(k, embeddings.shape[0])
+    block_size = max(1, min(block_size, MAX_BLOCK_ELEMENTS // max(1, embeddings.shape[0])))
+    top_indices = np.empty((num_queries, k), dtype=np.intp)
+    top_scores = np.empty((num_queries, k), dtype=np.float64)
+
+    for start in range(0, num_queries, block_size):
+        scores = query_embeddings[start:start + block_size] @ embeddings.T
+        top_indices[start:start + block_size], top_scores[start:start + block_size] = rank_top_k(scores, k)
+
+    return top_indices, top_scores
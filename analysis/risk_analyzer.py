@@ -3,128 +3,453 @@ Risk analyzer module for the JusticeAI application.
 Identifies risky clauses and terms in legal documents.
 """
 
+import heapq
 import re
 from collections import defaultdict
 
+import numpy as np
+
 # Local imports
-from config import HIGH_RISK_TERMS, MEDIUM_RISK_TERMS
+from config import RISK_FUZZY_MAX_EDITS, RISK_SNIPPET_CONTEXT, RISK_SNIPPET_MAX_LENGTH
+from analysis.proximity import RuleStream, find_rule_matches
+from analysis.ranking import rank_top_k
+from analysis.risk_lexicon import get_risk_lexicon
+from analysis.risk_matcher import get_risk_matcher
+
+# End of a sentence or clause: terminal punctuation or a semicolon before
+# whitespace, or a blank line; a dot after a lone character such as the
+# "1." or "a." of a clause number does not end the clause
+_CLAUSE_BOUNDARY = re.compile(r'[.!?;](?<!\b\w.)(?=\s)|\n\s*\n')
+
+# Run of whitespace, where a snippet may start without cutting a word
+_WHITESPACE = re.compile(r'\s+')
 
-def analyze_risks(text):
+def analyze_risks(text, compact=False, lexicon=None, top_clauses=0, fuzzy=False, snippet_context=0):
     """
     Analyze risks in the given text
     
     Args:
         text (str): The text to analyze
+        compact (bool): Return highlight positions as a RiskMatches object
+            backed by compact arrays instead of lists of tuples; it reads
+            like the dict and builds a level's list only when accessed
+        lexicon (str or RiskLexicon, optional): Risk lexicon to apply,
+            defaults to DEFAULT_RISK_LEXICON
+        top_clauses (int): If positive, also list up to this many of the
+            riskiest clauses under "risky_clauses", scored from the same
+            matches
+        fuzzy (bool or int): Also match risk terms misread by OCR, such as
+            "terrnination"; True corrects up to RISK_FUZZY_MAX_EDITS
+            character confusions per word, a number sets the limit
+        snippet_context (int): If positive, return "snippets" with this many
+            characters of context around the hits instead of the full text,
+            which is then left out of "highlighted_text"
         
     Returns:
         dict: Information about risks identified in the text
     """
+    lexicon = get_risk_lexicon(lexicon)
+    
     if not text or not text.strip():
-        return {
+        result = {
             "risk_scores": {
                 "overall": "Low",
                 "high_risk_count": 0,
-                "medium_risk_count": 0
+                "medium_risk_count": 0,
+                "rule_match_count": 0,
+                "score": 0.0,
+                "lexicon": lexicon.name
             },
             "highlighted_text": "No text available to analyze for risks.",
-            "highlight_positions": {}
+            "highlight_positions": {},
+            "rule_matches": []
         }
+        if top_clauses > 0:
+            result["risky_clauses"] = []
+        if snippet_context > 0:
+            result["snippets"] = []
+        return result
     
-    # Find high and medium risk terms
-    high_risk_matches = _find_risk_terms(text, HIGH_RISK_TERMS)
-    medium_risk_matches = _find_risk_terms(text, MEDIUM_RISK_TERMS)
+    # Find high and medium risk terms in a single pass
+    max_edits = RISK_FUZZY_MAX_EDITS if fuzzy is True else int(fuzzy or 0)
+    risk_matches = _find_risk_terms(text, lexicon, max_edits)
     
     # Count occurrences
-    high_risk_count = len(high_risk_matches)
-    medium_risk_count = len(medium_risk_matches)
+    high_risk_count = risk_matches.count("high")
+    medium_risk_count = risk_matches.count("medium")
     
-    # Calculate overall risk level
-    overall_risk = _calculate_overall_risk(high_risk_count, medium_risk_count)
+    # Evaluate the lexicon's proximity rules on one positional index of the text
+    rule_matches = find_rule_matches(text, lexicon.rules)
+    score = risk_matches.score + sum(hit["weight"] for hit in rule_matches)
     
-    # Prepare highlighted text
-    highlight_positions = {
-        "high": high_risk_matches,
-        "medium": medium_risk_matches
-    }
+    # Calculate overall risk level from the weighted score
+    overall_risk = _calculate_overall_risk(score, lexicon)
     
-    return {
+    result = {
         "risk_scores": {
             "overall": overall_risk,
             "high_risk_count": high_risk_count,
-            "medium_risk_count": medium_risk_count
+            "medium_risk_count": medium_risk_count,
+            "rule_match_count": len(rule_matches),
+            "score": score,
+            "lexicon": lexicon.name
         },
         "highlighted_text": text,
-        "highlight_positions": _get_highlight_positions(text, high_risk_matches, medium_risk_matches)
+        "highlight_positions": risk_matches if compact else _get_highlight_positions(risk_matches),
+        "rule_matches": rule_matches
     }
+    
+    if top_clauses > 0:
+        clause_risks = score_clauses(text, risk_matches, rule_matches)
+        result["risky_clauses"] = top_risky_clauses(text, clause_risks, top_clauses)
+    
+    if snippet_context > 0:
+        result["snippets"] = risk_snippets(text, risk_matches, rule_matches, snippet_context)
+        result["highlighted_text"] = ""
+    
+    return result
 
-def _find_risk_terms(text, risk_terms):
+def score_clauses(text, risk_matches, rule_matches=()):
     """
-    Find occurrences of risk terms in the text
+    Aggregate risk matches into a risk vector for every clause
+    
+    Clause boundaries are found in one pass over the text. Each match is
+    assigned to its clause by binary search of the sorted clause offsets,
+    and the per-clause counts and weighted scores are summed with bincount,
+    so no clause text is searched again.
     
     Args:
-        text (str): Text to search
-        risk_terms (list): List of risk terms to find
+        text (str): The analyzed text
+        risk_matches (RiskMatches): Matches found in the text by analyze_risks
+        rule_matches (list): Proximity rule hits, added to the score and
+            counts of the clause they start in
         
     Returns:
-        list: List of (term, match) tuples
+        dict: "bounds" (array of (start, end) offsets per clause), "counts"
+              (clauses by risk levels array of hit counts, columns in the
+              order of "levels"), "scores" (weighted score per clause) and
+              "levels"
     """
-    matches = []
+    clause_starts = _split_into_clauses(text)
+    num_clauses = len(clause_starts)
+    num_levels = len(risk_matches.levels)
+    
+    bounds = np.column_stack((clause_starts, np.append(clause_starts[1:], len(text))))
     
-    # Convert text to lowercase for case-insensitive matching
-    text_lower = text.lower()
+    starts = np.frombuffer(risk_matches.starts, dtype=np.uintc).astype(np.int64)
+    severities = np.frombuffer(risk_matches.severities, dtype=np.uint8).astype(np.intp)
+    weights = risk_matches.hit_weights()
     
-    for term in risk_terms:
-        # Create pattern for matching the term with word boundaries
-        pattern = r'\b' + re.escape(term.lower()) + r'\b'
+    if rule_matches:
+        starts = np.append(starts, [hit["start"] for hit in rule_matches])
+        severities = np.append(severities, [risk_matches.levels.index(hit["level"]) for hit in rule_matches])
+        weights = np.append(weights, [hit["weight"] for hit in rule_matches])
+    
+    clause_ids = np.searchsorted(clause_starts, starts, side='right') - 1
+    
+    scores = np.bincount(clause_ids, weights=weights, minlength=num_clauses)
+    counts = np.bincount(clause_ids * num_levels + severities, minlength=num_clauses * num_levels)
+    
+    return {
+        "bounds": bounds,
+        "counts": counts.reshape(num_clauses, num_levels),
+        "scores": scores,
+        "levels": list(risk_matches.levels)
+    }
+
+def top_risky_clauses(text, clause_risks, top_n):
+    """
+    Pick the highest-scoring clauses from score_clauses output
+    
+    Args:
+        text (str): The analyzed text
+        clause_risks (dict): Result of score_clauses
+        top_n (int): Maximum number of clauses to return
         
-        # Find all matches
-        for match in re.finditer(pattern, text_lower):
-            matches.append((term, match))
+    Returns:
+        list: Clause dicts (text, start, end, score and a count per risk
+              level), riskiest first; clauses without risk terms are left out
+    """
+    scores = clause_risks["scores"]
+    k = min(top_n, len(scores))
+    if k <= 0:
+        return []
     
-    return matches
+    top_indices, top_scores = rank_top_k(scores[None, :], k)
+    
+    clauses = []
+    for index, score in zip(top_indices[0], top_scores[0]):
+        if score <= 0:
+            break
+        start, end = (int(offset) for offset in clause_risks["bounds"][index])
+        clause = {
+            "text": text[start:end].strip(),
+            "start": start,
+            "end": end,
+            "score": float(score)
+        }
+        for level, count in zip(clause_risks["levels"], clause_risks["counts"][index]):
+            clause[f"{level}_risk_count"] = int(count)
+        clauses.append(clause)
+    
+    return clauses
 
-def _calculate_overall_risk(high_count, medium_count):
+def risk_snippets(text, risk_matches, rule_matches=(), context=RISK_SNIPPET_CONTEXT,
+                  max_length=RISK_SNIPPET_MAX_LENGTH):
     """
-    Calculate overall risk level based on term counts
+    Cut bounded context windows around the risk hits of a text
+    
+    Every term and rule hit is widened by the context on both sides. The
+    hits are sorted by start once and swept in order; a window that overlaps
+    the current snippet is merged into it unless the snippet would grow past
+    max_length, in which case the two split their shared context. Snippet
+    edges are then moved inward to the nearest whitespace so that no word
+    is cut.
     
     Args:
-        high_count (int): Count of high risk terms
-        medium_count (int): Count of medium risk terms
+        text (str): The analyzed text
+        risk_matches (RiskMatches): Matches found in the text by analyze_risks
+        rule_matches (list): Proximity rule hits found in the text
+        context (int): Characters of context on each side of a hit
+        max_length (int): Longest snippet that several hits are merged into
         
     Returns:
-        str: Overall risk level (Low, Medium, or High)
+        list: Snippet dicts in document order, holding the "start" and "end"
+              offsets of the snippet in the document, its "text", the term
+              "highlights" as (start, end, level) tuples relative to the
+              snippet, and the names of the "rules" it contains
     """
-    # Thresholds for risk levels
-    if high_count >= 5 or (high_count >= 3 and medium_count >= 5):
-        return "High"
-    elif high_count >= 2 or medium_count >= 3:
-        return "Medium"
-    else:
-        return "Low"
+    starts = np.frombuffer(risk_matches.starts, dtype=np.uintc)
+    ends = np.frombuffer(risk_matches.ends, dtype=np.uintc)
+    severities = np.frombuffer(risk_matches.severities, dtype=np.uint8)
+    
+    # By start, and the most severe level first for a term in several levels
+    order = np.lexsort((severities, starts))
+    term_hits = ((start, end, risk_matches.levels[severity], None) for start, end, severity
+                 in zip(starts[order].tolist(), ends[order].tolist(), severities[order].tolist()))
+    rule_hits = ((hit["start"], hit["end"], hit["level"], hit["rule"]) for hit in rule_matches)
+    
+    snippets = []
+    current = None
+    for start, end, level, rule in heapq.merge(term_hits, rule_hits, key=lambda hit: hit[0]):
+        window_start = max(0, start - context)
+        window_end = min(len(text), end + context)
+        
+        split = current is not None and window_start <= current["end"] and start >= current["last"] and \
+            max(window_end, current["end"]) - current["start"] > max_length
+        if split:
+            # Too long to merge: the two snippets share out the context between them
+            current["end"] = max(current["last"], window_start)
+            window_start = current["end"]
+        
+        if current is None or split or window_start > current["end"]:
+            current = {"start": window_start, "end": window_end, "first": start, "last": end,
+                       "highlights": [], "rules": []}
+            snippets.append(current)
+        else:
+            current["end"] = max(current["end"], window_end)
+            current["last"] = max(current["last"], end)
+        
+        if rule is not None:
+            if rule not in current["rules"]:
+                current["rules"].append(rule)
+        elif not current["highlights"] or start >= current["highlights"][-1][1]:
+            current["highlights"].append((start, end, level))
+    
+    for snippet in snippets:
+        start = _word_start(text, snippet.pop("start"), snippet.pop("first"))
+        end = _word_end(text, snippet.pop("end"), snippet.pop("last"))
+        snippet["start"] = start
+        snippet["end"] = end
+        snippet["text"] = text[start:end]
+        snippet["highlights"] = [(hit_start - start, hit_end - start, level)
+                                 for hit_start, hit_end, level in snippet["highlights"]]
+    
+    return snippets
 
-def _get_highlight_positions(text, high_risk_matches, medium_risk_matches):
+def _word_start(text, start, limit):
+    """Move a snippet start forward past a partial word, but not beyond limit"""
+    if start == 0 or text[start - 1].isspace():
+        return start
+    space = _WHITESPACE.search(text, start, limit)
+    return space.end() if space else start
+
+def _word_end(text, end, limit):
+    """Move a snippet end back before a partial word, but not below limit"""
+    if end == len(text) or text[end].isspace():
+        return end
+    cut = max(text.rfind(" ", limit, end), text.rfind("\n", limit, end))
+    return cut if cut >= 0 else end
+
+def analyze_risks_stream(chunks, lexicon=None):
     """
-    Get positions for highlighting risk terms
+    Analyze risks in a document supplied as an iterator of text chunks
+    
+    Only the current chunk, a short overlap window and the last few words
+    a proximity rule can still reach are held in memory, even for text
+    without sentence ends such as OCR output. The window is as long as the
+    longest risk term, so terms spanning a chunk boundary are still found,
+    and the rules carry their state from chunk to chunk. Matches, rule
+    hits, offsets and counts are the same as analyze_risks would report
+    for the joined text.
+    
+    Args:
+        chunks (iterable): Text chunks in document order, such as pages
+        lexicon (str or RiskLexicon, optional): Risk lexicon to apply,
+            defaults to DEFAULT_RISK_LEXICON
+        
+    Yields:
+        dict: One update per chunk and a final one after the last chunk,
+              holding the matches newly found ("matches", with absolute
+              (term, start, end) tuples per risk level, and "rule_matches"),
+              the running "risk_scores" and whether this is the final
+              update ("done")
+    """
+    lexicon = get_risk_lexicon(lexicon)
+    matcher = get_risk_matcher(lexicon)
+    overlap = matcher.max_term_length + 1
+    totals = {"high": 0, "medium": 0, "rules": 0, "term_score": 0.0, "rule_score": 0.0}
+    
+    # Unfinished tail of the text seen so far, the absolute offset of its
+    # first character, and where matching resumes within it
+    window = ""
+    window_offset = 0
+    resume = 0
+    
+    # Proximity rules, carrying their windows from chunk to chunk
+    rule_stream = RuleStream(lexicon.rules)
+    
+    for chunk in chunks:
+        window += chunk.lower()
+        
+        # Matches starting before the cut are complete: the window holds
+        # enough text after them to see the whole term and its boundary
+        cut = len(window) - overlap
+        matches = {"high": [], "medium": []}
+        
+        if cut > resume:
+            for term, hits, start, end in matcher.scan(window, resume):
+                if start >= cut:
+                    break
+                for level, weight in hits:
+                    matches[level].append((term, window_offset + start, window_offset + end))
+                    totals["term_score"] += weight
+                resume = end
+            resume = max(resume, cut)
+            
+            # Keep one character before the resume point for the word boundary check
+            keep_from = resume - 1
+            window = window[keep_from:]
+            window_offset += keep_from
+            resume = 1
+        
+        rule_matches = rule_stream.feed(chunk)
+        
+        yield _stream_update(matches, rule_matches, totals, lexicon, done=False)
+    
+    # Flush whatever is left once no more text can follow it
+    matches = {"high": [], "medium": []}
+    for term, hits, start, end in matcher.scan(window, resume):
+        for level, weight in hits:
+            matches[level].append((term, window_offset + start, window_offset + end))
+            totals["term_score"] += weight
+    
+    rule_matches = rule_stream.feed("", final=True)
+    
+    yield _stream_update(matches, rule_matches, totals, lexicon, done=True)
+
+def _stream_update(matches, rule_matches, totals, lexicon, done):
+    """
+    Fold a chunk's matches into the running counts of a stream
     
     Args:
-        text (str): Original text
-        high_risk_matches (list): List of high risk matches
-        medium_risk_matches (list): List of medium risk matches
+        matches (dict): Risk level to list of new (term, start, end) tuples
+        rule_matches (list): New proximity rule hits
+        totals (dict): Running count per risk level and of rule hits, and
+            the weighted scores of terms and of rules, updated in place
+        lexicon (RiskLexicon): Lexicon being applied
+        done (bool): Whether the stream has ended
         
     Returns:
-        dict: Dictionary of positions for each risk level
+        dict: Update yielded by analyze_risks_stream
     """
-    positions = {
-        "high": [],
-        "medium": []
+    totals["high"] += len(matches["high"])
+    totals["medium"] += len(matches["medium"])
+    totals["rules"] += len(rule_matches)
+    # Term and rule weights are summed apart, in the order analyze_risks
+    # adds them, so the final score is exactly the same
+    for hit in rule_matches:
+        totals["rule_score"] += hit["weight"]
+    score = totals["term_score"] + totals["rule_score"]
+    
+    return {
+        "matches": matches,
+        "rule_matches": rule_matches,
+        "risk_scores": {
+            "overall": _calculate_overall_risk(score, lexicon),
+            "high_risk_count": totals["high"],
+            "medium_risk_count": totals["medium"],
+            "rule_match_count": totals["rules"],
+            "score": score,
+            "lexicon": lexicon.name
+        },
+        "done": done
     }
+
+def _find_risk_terms(text, lexicon, max_edits=0):
+    """
+    Find occurrences of high and medium risk terms in the text
+    
+    Args:
+        text (str): Text to search
+        lexicon (RiskLexicon): Lexicon to match
+        max_edits (int): OCR confusions corrected per word, 0 for exact matching
+        
+    Returns:
+        RiskMatches: Hits of both risk levels in compact arrays
+    """
+    return get_risk_matcher(lexicon).find_compact(text, max_edits)
+
+def _split_into_clauses(text):
+    """
+    Find where every sentence or clause of the text starts
     
-    # Extract positions for high risk terms
-    for _, match in high_risk_matches:
-        positions["high"].append((match.start(), match.end()))
+    Args:
+        text (str): Text to split
+        
+    Returns:
+        numpy.ndarray: Sorted start offsets, beginning with 0
+    """
+    boundaries = [match.end() for match in _CLAUSE_BOUNDARY.finditer(text)]
+    starts = np.array([0] + boundaries, dtype=np.int64)
     
-    # Extract positions for medium risk terms
-    for _, match in medium_risk_matches:
-        positions["medium"].append((match.start(), match.end()))
+    # Drop empty clauses left by a boundary at the very end of the text
+    return starts[starts < max(len(text), 1)]
+
+def _calculate_overall_risk(score, lexicon):
+    """
+    Calculate overall risk level from the weighted sum of risk hits
     
-    return positions
+    Args:
+        score (float): Sum of the weights of all risk terms found
+        lexicon (RiskLexicon): Lexicon whose thresholds apply
+        
+    Returns:
+        str: Overall risk level (Low, Medium, or High)
+    """
+    return lexicon.overall_risk(score)
+
+def _get_highlight_positions(risk_matches):
+    """
+    Get positions for highlighting risk terms
+    
+    Args:
+        risk_matches (RiskMatches): Hits of both risk levels
+        
+    Returns:
+        dict: Dictionary of positions for each risk level
+    """
+    return {
+        "high": risk_matches["high"],
+        "medium": risk_matches["medium"]
+    }
@@ -0,0 +1,274 @@
+"""
+Risk batch module for the JusticeAI application.
+Screens many contracts for risks across worker processes that share one
+compiled lexicon matcher, streaming results back as documents complete.
+"""
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+# Local imports
+from config import RISK_BATCH_WORKERS, RISK_FUZZY_MAX_EDITS
+from analysis.risk_analyzer import analyze_risks
+from analysis.risk_lexicon import get_risk_lexicon
+from analysis.risk_matcher import get_risk_matcher, install_risk_matcher
+from utils.document_processor import DocumentProcessor
+
+def _load_matcher(lexicon, matcher):
+    """
+    Worker initializer that adopts the coordinator's compiled matcher
+
+    With the fork start method the matcher is inherited copy-on-write and
+    never pickled; otherwise it arrives pickled once per worker.
+
+    Args:
+        lexicon (RiskLexicon): Lexicon being applied
+        matcher (RiskMatcher): Matcher compiled from it
+    """
+    install_risk_matcher(lexicon, matcher)
+
+def _analyze_item(index, item, lexicon, fuzzy, top_clauses):
+    """
+    Analyze one document of a batch
+
+    Args:
+        index (int): Position of the document in the batch
+        item (str or os.PathLike): Path of a document file, or its text
+        lexicon (RiskLexicon): Lexicon to apply
+        fuzzy (bool or None): Fuzzy matching; None enables it for OCR documents
+        top_clauses (int): Number of riskiest clauses to list
+
+    Returns:
+        dict: The analyze_risks result without the document text and
+              highlight positions, plus "index", "document", per-term
+              "term_counts", "seconds" and an "error" message if the
+              document could not be read or analyzed
+    """
+    start = time.perf_counter()
+    document_processor = DocumentProcessor()
+    is_path = _is_path(item)
+    document = os.fspath(item) if is_path else f"text {index + 1}"
+
+    try:
+        if is_path:
+            text = document_processor.extract_text(document)
+            if fuzzy is None:
+                fuzzy = document_processor.is_ocr_document(document)
+        else:
+            text = item
+
+        result = analyze_risks(text, compact=True, lexicon=lexicon, top_clauses=top_clauses, fuzzy=bool(fuzzy))
+    except Exception as e:
+        return _error_result(index, document, e, start)
+
+    matches = result.pop("highlight_positions")
+    del result["highlighted_text"]
+
+    result["index"] = index
+    result["document"] = document
+    result["term_counts"] = _term_counts(matches) if matches else {}
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+def _error_result(index, document, error, start):
+    """Result of a document that could not be read or analyzed"""
+    return {"index": index, "document": document, "error": str(error),
+            "seconds": time.perf_counter() - start}
+
+def _is_path(item):
+    """A path object, or a one-line string naming an existing file"""
+    if isinstance(item, os.PathLike):
+        return True
+    if not isinstance(item, str) or "\n" in item or len(item) >= 4096:
+        return False
+    return os.path.isfile(item)
+
+def _term_counts(matches):
+    """
+    Count the occurrences of every term in a set of matches
+
+    A term listed under several risk levels is recorded once per level at
+    the same offset, so hits are counted by distinct start.
+
+    Args:
+        matches (RiskMatches): Matches of one document
+
+    Returns:
+        dict: Term to number of occurrences, for terms that occur
+    """
+    starts = np.frombuffer(matches.starts, dtype=np.uintc)
+    term_ids = np.frombuffer(matches.term_ids, dtype=np.uintc)
+    if len(starts) == 0:
+        return {}
+
+    distinct = np.ones(len(starts), dtype=bool)
+    distinct[1:] = starts[1:] != starts[:-1]
+    counts = np.bincount(term_ids[distinct], minlength=len(matches.term_names))
+    return {matches.term_names[term_id]: int(counts[term_id]) for term_id in np.flatnonzero(counts)}
+
+class RiskBatch:
+    """Results of a batch risk analysis, streamed as documents complete"""
+
+    def __init__(self, items, workers, lexicon, fuzzy, top_clauses):
+        """
+        Prepare a batch; documents are analyzed once it is iterated
+
+        Args:
+            items (list): Document paths or texts
+            workers (int): Worker processes, 1 to analyze in this process
+            lexicon (RiskLexicon): Lexicon to apply
+            fuzzy (bool or None): Fuzzy matching; None enables it for OCR documents
+            top_clauses (int): Number of riskiest clauses to list per document
+        """
+        self.items = items
+        self.workers = workers
+        self.lexicon = lexicon
+        self.fuzzy = fuzzy
+        self.top_clauses = top_clauses
+        self.results = []
+        self.seconds = 0.0
+        self._done = False
+
+    def __iter__(self):
+        """
+        Yield one result per document in completion order
+
+        Iterating again after the batch has finished replays the results;
+        a batch abandoned part way starts over.
+
+        Yields:
+            dict: Result of one document, see _analyze_item
+        """
+        if self._done:
+            yield from self.results
+            return
+
+        # Compile once in the coordinator; workers inherit or unpickle it
+        matcher = get_risk_matcher(self.lexicon)
+        if self.fuzzy is not False:
+            matcher.fuzzy_index(RISK_FUZZY_MAX_EDITS)
+
+        self.results = []
+        started = time.perf_counter()
+        args = (self.lexicon, self.fuzzy, self.top_clauses)
+
+        if self.workers <= 1 or len(self.items) <= 1:
+            completed = (_analyze_item(index, item, *args) for index, item in enumerate(self.items))
+            for result in completed:
+                self._record(result, started)
+                yield result
+        else:
+            context = multiprocessing.get_context("fork") \
+                if "fork" in multiprocessing.get_all_start_methods() else None
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(self.items)), mp_context=context,
+                                     initializer=_load_matcher, initargs=(self.lexicon, matcher)) as executor:
+                futures = {executor.submit(_analyze_item, index, item, *args): index
+                           for index, item in enumerate(self.items)}
+                for future in as_completed(futures):
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        # The item or its result could not cross to or from
+                        # the worker, or the worker died
+                        index = futures[future]
+                        item = self.items[index]
+                        document = os.fspath(item) if _is_path(item) else f"text {index + 1}"
+                        result = _error_result(index, document, e, started)
+                    self._record(result, started)
+                    yield result
+
+        self._done = True
+
+    def _record(self, result, started):
+        """Keep a finished result and the time elapsed so far"""
+        self.results.append(result)
+        self.seconds = time.perf_counter() - started
+
+    def wait(self):
+        """
+        Run the batch to completion without streaming
+
+        Returns:
+            RiskBatch: This batch, for chaining
+        """
+        for _ in self:
+            pass
+        return self
+
+    @property
+    def docs_per_second(self):
+        """Throughput of the batch so far"""
+        return len(self.results) / self.seconds if self.seconds else 0.0
+
+    def term_totals(self):
+        """
+        Total occurrences of every term across the batch
+
+        Returns:
+            dict: Term to count, most frequent first
+        """
+        totals = {}
+        for result in self.results:
+            for term, count in result.get("term_counts", {}).items():
+                totals[term] = totals.get(term, 0) + count
+        return dict(sorted(totals.items(), key=lambda item: (-item[1], item[0])))
+
+    def table(self):
+        """
+        Aggregate table of counts per document and per term
+
+        Returns:
+            tuple: (columns, rows) where columns are "document", "overall",
+                   "score", "high", "medium", "rules" and then every term
+                   found, most frequent first, and rows hold one list of
+                   values per document in input order
+        """
+        terms = list(self.term_totals())
+        columns = ["document", "overall", "score", "high", "medium", "rules"] + terms
+
+        rows = []
+        for result in sorted(self.results, key=lambda result: result["index"]):
+            if "error" in result:
+                rows.append([result["document"], "Error", 0.0, 0, 0, 0] + [0] * len(terms))
+                continue
+            scores = result["risk_scores"]
+            counts = result["term_counts"]
+            rows.append([result["document"], scores["overall"], scores["score"], scores["high_risk_count"],
+                         scores["medium_risk_count"], scores["rule_match_count"]] +
+                        [counts.get(term, 0) for term in terms])
+
+        return columns, rows
+
+def analyze_risks_batch(paths_or_texts, workers=RISK_BATCH_WORKERS, lexicon=None, fuzzy=None, top_clauses=0):
+    """
+    Analyze risks in many documents across worker processes
+
+    The lexicon matcher is compiled once and shared by every worker, so
+    each document costs only its own scan. Results stream back in the
+    order documents finish, and the returned batch aggregates them.
+
+    Args:
+        paths_or_texts (iterable): Document file paths (str or os.PathLike)
+            or document texts; a one-line string naming an existing file is
+            read as a document and any other string is analyzed as text, so
+            pass missing files as os.PathLike to have them reported
+        workers (int): Worker processes, 0 for one per CPU and 1 to analyze
+            in this process
+        lexicon (str or RiskLexicon, optional): Risk lexicon to apply,
+            defaults to DEFAULT_RISK_LEXICON
+        fuzzy (bool, optional): Fuzzy term matching; by default enabled
+            only for documents read by OCR
+        top_clauses (int): If positive, list this many riskiest clauses
+            per document
+
+    Returns:
+        RiskBatch: Iterate it for per-document results as they complete,
+                   then read table(), term_totals() and docs_per_second
+    """
+    lexicon = get_risk_lexicon(lexicon)
+    workers = workers or os.cpu_count() or 1
+    return RiskBatch(list(paths_or_texts), workers, lexicon, fuzzy, top_clauses)
@@ -0,0 +1,227 @@
+"""
+Risk lexicon module for the JusticeAI application.
+Loads weighted risk vocabularies, one per contract type, from data files.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+
+# Local imports
+from config import (HIGH_RISK_TERMS, MEDIUM_RISK_TERMS, RISK_TERM_VARIANTS, RISK_TERM_INFLECTIONS,
+                    RISK_PROXIMITY_RULES, RISK_LEVEL_WEIGHTS, RISK_SCORE_THRESHOLDS, RISK_LEXICON_DIR,
+                    DEFAULT_RISK_LEXICON)
+from analysis.inflection import INFLECTION_KINDS
+from analysis.proximity import ProximityRule
+
+# Lexicon names double as file names, so only allow plain identifiers
+_NAME_PATTERN = re.compile(r"[A-Za-z0-9_-]+")
+
+class RiskLexicon:
+    """Weighted risk terms grouped by risk level"""
+
+    def __init__(self, name, terms, thresholds=None, description="", rules=None, variants=None,
+                 inflections=None):
+        """
+        Create a lexicon
+
+        Args:
+            name (str): Lexicon name
+            terms (dict): Risk level to either a {term: weight} mapping or a
+                list of terms, which get the level's default weight
+            thresholds (dict, optional): Weighted score at which a document
+                becomes "High" and "Medium" risk
+            description (str): Human-readable description
+            rules (list, optional): Proximity rules as dicts with "name",
+                "terms", "within", "level" and an optional "weight", which
+                defaults to the level's weight
+            variants (dict, optional): Term to a list of derived or irregular
+                forms that count as the term, such as "terminate"
+            inflections (dict, optional): Term or variant to how it is
+                inflected: "noun" for a plural only, the default for terms,
+                "verb" for a plural and verb forms, or "none" to match it as
+                written, the default for variants
+
+        Raises:
+            ValueError: If a risk level, weight, rule, variant or inflection
+                is invalid
+        """
+        self.name = name
+        self.description = description
+        self.thresholds = dict(RISK_SCORE_THRESHOLDS)
+        self.thresholds.update(thresholds or {})
+
+        self.terms = {}
+        for level, default_weight in RISK_LEVEL_WEIGHTS.items():
+            level_terms = terms.get(level, {})
+            if isinstance(level_terms, dict):
+                weighted = level_terms.items()
+            else:
+                weighted = ((term, default_weight) for term in level_terms)
+
+            self.terms[level] = {}
+            for term, weight in weighted:
+                if not isinstance(weight, (int, float)) or weight < 0:
+                    raise ValueError(f"Invalid weight for risk term '{term}': {weight!r}")
+                # The first weight given for a term wins
+                self.terms[level].setdefault(term, float(weight))
+
+        unknown = set(terms) - set(RISK_LEVEL_WEIGHTS)
+        if unknown:
+            raise ValueError(f"Unknown risk levels in lexicon '{name}': {', '.join(sorted(unknown))}")
+
+        self.rules = []
+        for rule in rules or []:
+            level = rule.get("level", "high")
+            if level not in RISK_LEVEL_WEIGHTS:
+                raise ValueError(f"Unknown risk level in rule '{rule.get('name')}': {level}")
+            self.rules.append(ProximityRule(rule.get("name", ""), rule.get("terms", []), rule.get("within"),
+                                            level, rule.get("weight", RISK_LEVEL_WEIGHTS[level])))
+
+        self.variants = {}
+        for term, forms in (variants or {}).items():
+            if isinstance(forms, str) or not all(isinstance(form, str) for form in forms):
+                raise ValueError(f"Variants of risk term '{term}' must be a list of strings")
+            self.variants[term] = list(forms)
+
+        self.inflections = {}
+        for form, kind in (inflections or {}).items():
+            if kind not in INFLECTION_KINDS:
+                raise ValueError(f"Inflection of risk term '{form}' must be one of "
+                                 f"{', '.join(INFLECTION_KINDS)}: {kind!r}")
+            self.inflections[form.lower()] = kind
+
+        # Content hash, so equal lexicons share one compiled matcher
+        content = json.dumps({"terms": self.terms, "thresholds": self.thresholds,
+                              "rules": [rule.to_dict() for rule in self.rules],
+                              "variants": self.variants, "inflections": self.inflections}, sort_keys=True)
+        self.fingerprint = hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    def __len__(self):
+        return sum(len(level_terms) for level_terms in self.terms.values())
+
+    @classmethod
+    def from_config(cls):
+        """
+        Build the default lexicon from the term lists in config
+
+        Returns:
+            RiskLexicon: Lexicon of HIGH_RISK_TERMS and MEDIUM_RISK_TERMS
+        """
+        return cls(DEFAULT_RISK_LEXICON, {"high": HIGH_RISK_TERMS, "medium": MEDIUM_RISK_TERMS},
+                   description="Built-in general contract terms", rules=RISK_PROXIMITY_RULES,
+                   variants=RISK_TERM_VARIANTS, inflections=RISK_TERM_INFLECTIONS)
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        Load a lexicon from a JSON file
+
+        The file holds a "terms" object mapping each risk level to a list of
+        terms or to a {term: weight} object, and optionally "description",
+        "thresholds", a list of proximity "rules", a "variants" object of
+        derived forms per term and an "inflections" object marking terms and
+        variants as "noun", "verb" or "none". The lexicon is named after the
+        file.
+
+        Args:
+            path (str): Path to the JSON file
+
+        Returns:
+            RiskLexicon: The loaded lexicon
+
+        Raises:
+            ValueError: If the file is not a valid lexicon
+        """
+        name = os.path.splitext(os.path.basename(path))[0]
+
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid risk lexicon file {path}: {str(e)}")
+
+        if not isinstance(data, dict) or not isinstance(data.get("terms"), dict):
+            raise ValueError(f"Risk lexicon file {path} has no 'terms' object")
+
+        return cls(name, data["terms"], data.get("thresholds"), data.get("description", ""),
+                   data.get("rules"), data.get("variants"), data.get("inflections"))
+
+    def overall_risk(self, score):
+        """
+        Map a weighted risk score to an overall level
+
+        Args:
+            score (float): Sum of the weights of all risk hits
+
+        Returns:
+            str: Overall risk level (Low, Medium, or High)
+        """
+        if score >= self.thresholds["High"]:
+            return "High"
+        elif score >= self.thresholds["Medium"]:
+            return "Medium"
+        else:
+            return "Low"
+
+_default_lexicon = RiskLexicon.from_config()
+
+# Lexicons loaded from files, keyed on path: (modification time, size, lexicon)
+_loaded_lexicons = {}
+_loaded_lexicons_lock = threading.Lock()
+
+def get_risk_lexicon(name=None):
+    """
+    Get a risk lexicon by name, reloading its file only when it changes
+
+    Args:
+        name (str, optional): Lexicon name, defaults to DEFAULT_RISK_LEXICON
+
+    Returns:
+        RiskLexicon: The lexicon
+
+    Raises:
+        ValueError: If no lexicon of that name exists or its file is invalid
+    """
+    if isinstance(name, RiskLexicon):
+        return name
+
+    name = name or DEFAULT_RISK_LEXICON
+    if not _NAME_PATTERN.fullmatch(name):
+        raise ValueError(f"Invalid risk lexicon name: {name}")
+
+    path = os.path.join(RISK_LEXICON_DIR, name + ".json")
+    try:
+        stat = os.stat(path)
+    except OSError:
+        if name == DEFAULT_RISK_LEXICON:
+            return _default_lexicon
+        raise ValueError(f"Unknown risk lexicon: {name}")
+
+    with _loaded_lexicons_lock:
+        cached = _loaded_lexicons.get(path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+
+    lexicon = RiskLexicon.from_file(path)
+
+    with _loaded_lexicons_lock:
+        _loaded_lexicons[path] = (stat.st_mtime_ns, stat.st_size, lexicon)
+
+    return lexicon
+
+def list_risk_lexicons():
+    """
+    List the names of the available risk lexicons
+
+    Returns:
+        list: Lexicon names, the default lexicon first
+    """
+    names = set()
+    if os.path.isdir(RISK_LEXICON_DIR):
+        names = {os.path.splitext(entry)[0] for entry in os.listdir(RISK_LEXICON_DIR)
+                 if entry.endswith(".json") and _NAME_PATTERN.fullmatch(os.path.splitext(entry)[0])}
+    names.discard(DEFAULT_RISK_LEXICON)
+    return [DEFAULT_RISK_LEXICON] + sorted(names)
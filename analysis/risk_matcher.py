@@ -0,0 +1,397 @@
+"""
+Risk matcher module for the JusticeAI application.
+Finds every risk lexicon term in a document with one compiled pattern.
+"""
+
+import re
+import threading
+from array import array
+from collections.abc import Mapping
+
+import numpy as np
+
+# Local imports
+from config import RISK_MATCHER_CACHE_SIZE, RISK_MATCH_INFLECTIONS, RISK_FUZZY_LOOKUP_CACHE_SIZE
+from analysis.fuzzy_matcher import FuzzyTermIndex
+from analysis.inflection import expand_term
+from analysis.risk_lexicon import get_risk_lexicon
+from utils.cache import LRUCache
+
+class RiskMatcher:
+    """Single-pass matcher for a set of risk lexicons"""
+
+    def __init__(self, lexicons, variants=None, inflect=False, inflections=None):
+        """
+        Compile all lexicon terms and their forms into one pattern
+
+        Args:
+            lexicons (dict): Risk level ("high", "medium", ...) to a
+                {term: weight} mapping, or to a list of terms weighted 1.0
+            variants (dict, optional): Term to derived or irregular forms
+                that are matched and reported as the term
+            inflect (bool): Also match the regular inflections of the terms
+                and variants, plurals for nouns and also verb forms for verbs
+            inflections (dict, optional): Lowercase term or variant to its
+                inflection kind, see expand_term
+        """
+        self.levels = list(lexicons)
+
+        # Lowercased term to the canonical term and its (level, weight) hits;
+        # a term listed twice in a level is only counted once
+        self.terms = {}
+        for level, terms in lexicons.items():
+            if not isinstance(terms, Mapping):
+                terms = dict.fromkeys(terms, 1.0)
+            for term, weight in terms.items():
+                key = term.lower()
+                _, hits = self.terms.setdefault(key, (term, []))
+                if all(hit_level != level for hit_level, _ in hits):
+                    hits.append((level, float(weight)))
+
+        # Every matched form to the lowercased term it is reported as; a
+        # form that is itself a lexicon term always stands for that term
+        self.surface_forms = {key: key for key in self.terms}
+        term_variants = {term.lower(): forms for term, forms in (variants or {}).items()}
+        for key in self.terms:
+            forms = term_variants.get(key, ())
+            if inflect:
+                forms = sorted(expand_term(key, forms, inflections))
+            for form in forms:
+                self.surface_forms.setdefault(form.lower(), key)
+
+        # Compact ids: position in term_names and in levels
+        self.term_names = [term for term, _ in self.terms.values()]
+        self._ids = {
+            key: (term_id, tuple((self.levels.index(level), weight) for level, weight in hits))
+            for term_id, (key, (_, hits)) in enumerate(self.terms.items())
+        }
+
+        # Weight of every (term id, severity) pair, at term_id * len(levels) + severity
+        self.weight_table = array('d', bytes(8 * len(self.term_names) * len(self.levels)))
+        for term_id, hits in self._ids.values():
+            for severity, weight in hits:
+                self.weight_table[term_id * len(self.levels) + severity] = weight
+
+        # Longest text a single match can span
+        self.max_term_length = max(map(len, self.surface_forms), default=0)
+
+        # Forms merged into a character trie, so the cost of a match depends
+        # on the length of the text matched and not on the number of forms
+        if self.surface_forms:
+            self.pattern = re.compile(r'\b' + _trie_pattern(self.surface_forms) + r'\b')
+        else:
+            self.pattern = None
+
+        # OCR-tolerant indexes for fuzzy matching, built on first use
+        self._fuzzy_indexes = {}
+        self._fuzzy_lock = threading.Lock()
+
+    def __getstate__(self):
+        # Locks cannot be pickled; a worker process gets a fresh one
+        state = self.__dict__.copy()
+        del state["_fuzzy_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._fuzzy_lock = threading.Lock()
+
+    def find_all(self, text):
+        """
+        Find the risk terms of every level in one scan of the text
+
+        Args:
+            text (str): Text to search, matched case-insensitively
+
+        Returns:
+            dict: Risk level to list of (term, start, end) tuples in document order
+        """
+        matches = {level: [] for level in self.levels}
+
+        for term, hits, start, end in self.scan(text.lower()):
+            for level, _ in hits:
+                matches[level].append((term, start, end))
+
+        return matches
+
+    def find_compact(self, text, max_edits=0):
+        """
+        Find the risk terms of every level into compact parallel arrays
+
+        Args:
+            text (str): Text to search, matched case-insensitively
+            max_edits (int): If positive, also report terms misread by OCR
+                in up to this many places per word; exact matches take
+                precedence where the two overlap
+
+        Returns:
+            RiskMatches: Hits of every level in document order
+        """
+        matches = RiskMatches(self.term_names, self.levels, self.weight_table)
+        if self.pattern is None:
+            return matches
+
+        text_lower = text.lower()
+        found = [(match.start(), match.end(), self.surface_forms[match.group()])
+                 for match in self.pattern.finditer(text_lower)]
+
+        if max_edits > 0:
+            exact_spans = [(start, end) for start, end, _ in found]
+            fuzzy = self.fuzzy_index(max_edits).find(text_lower, exact_spans)
+            found = sorted(found + [(start, end, key) for key, start, end in fuzzy])
+
+        for start, end, key in found:
+            term_id, hits = self._ids[key]
+            for severity, weight in hits:
+                matches.append(term_id, severity, start, end, weight)
+
+        return matches
+
+    def fuzzy_index(self, max_edits):
+        """
+        Get the OCR-tolerant index of the terms, building it on first use
+
+        Args:
+            max_edits (int): Most OCR confusions corrected per word
+
+        Returns:
+            FuzzyTermIndex: Index shared by every search with this limit
+        """
+        with self._fuzzy_lock:
+            index = self._fuzzy_indexes.get(max_edits)
+            if index is None:
+                index = FuzzyTermIndex(self.surface_forms, max_edits, RISK_FUZZY_LOOKUP_CACHE_SIZE)
+                self._fuzzy_indexes[max_edits] = index
+        return index
+
+    def scan(self, text_lower, pos=0):
+        """
+        Iterate over the risk terms of already lowercased text
+
+        Args:
+            text_lower (str): Lowercased text to search
+            pos (int): Offset to start matching at; earlier characters are
+                only used to check the word boundary
+
+        Yields:
+            tuple: (term, hits, start, end) for every term found in document
+                   order, where hits lists the term's (level, weight) pairs
+        """
+        if self.pattern is None:
+            return
+
+        for match in self.pattern.finditer(text_lower, pos):
+            term, hits = self.terms[self.surface_forms[match.group()]]
+            yield term, hits, match.start(), match.end()
+
+def _trie_pattern(forms):
+    """
+    Build a regular expression matching any of a set of strings
+
+    The strings are merged into a character trie and the pattern follows
+    its branches, trying longer continuations before stopping, so the
+    longest string present at a position wins as in a longest-first
+    alternation.
+
+    Args:
+        forms (iterable): Non-empty strings to match
+
+    Returns:
+        str: Pattern without anchors or word boundaries
+    """
+    trie = {}
+    for form in forms:
+        node = trie
+        for char in form:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if len(branches) > 1:
+            group = "(?:" + "|".join(branches) + ")"
+        elif "" in node and len(branches[0]) > 1:
+            group = "(?:" + branches[0] + ")"
+        else:
+            group = branches[0]
+        return group + "?" if "" in node else group
+
+    return build(trie)
+
+class RiskMatches(Mapping):
+    """
+    Risk hits stored as parallel arrays of start, end, term id and severity
+
+    Each hit costs 13 bytes instead of a tuple per position, and the summed
+    weight of all hits is kept in score. The object reads
+    as the highlight_positions dict of analyze_risks (risk level to list of
+    (start, end) tuples); the lists are only built when a level is accessed.
+    """
+
+    def __init__(self, term_names, levels, weight_table=None):
+        """
+        Create an empty match set
+
+        Args:
+            term_names (list): Term of every term id
+            levels (list): Risk level of every severity id
+            weight_table (array, optional): Weight of every (term id,
+                severity) pair, laid out as RiskMatcher.weight_table
+        """
+        self.term_names = list(term_names)
+        self.levels = list(levels)
+        self.weight_table = weight_table
+        self.starts = array('I')
+        self.ends = array('I')
+        self.term_ids = array('I')
+        self.severities = array('B')
+        self.score = 0.0
+
+    def append(self, term_id, severity, start, end, weight=1.0):
+        """Record one hit"""
+        self.starts.append(start)
+        self.ends.append(end)
+        self.term_ids.append(term_id)
+        self.severities.append(severity)
+        self.score += weight
+
+    def __getitem__(self, level):
+        try:
+            severity = self.levels.index(level)
+        except ValueError:
+            raise KeyError(level)
+        return [(start, end) for start, end, hit_severity
+                in zip(self.starts, self.ends, self.severities) if hit_severity == severity]
+
+    def __iter__(self):
+        return iter(self.levels)
+
+    def __len__(self):
+        return len(self.levels)
+
+    def count(self, level):
+        """
+        Count the hits of one risk level
+
+        Args:
+            level (str): Risk level
+
+        Returns:
+            int: Number of hits
+        """
+        return self.severities.count(self.levels.index(level))
+
+    def terms(self, level):
+        """
+        List the hits of one risk level with their terms
+
+        Args:
+            level (str): Risk level
+
+        Returns:
+            list: (term, start, end) tuples in document order
+        """
+        severity = self.levels.index(level)
+        return [(self.term_names[term_id], start, end) for start, end, term_id, hit_severity
+                in zip(self.starts, self.ends, self.term_ids, self.severities) if hit_severity == severity]
+
+    def hit_weights(self):
+        """
+        Weight of every hit, in hit order
+
+        Returns:
+            numpy.ndarray: float64 array with one weight per hit
+
+        Raises:
+            ValueError: If the matches carry no weight table
+        """
+        if self.weight_table is None:
+            raise ValueError("Risk matches have no weight table")
+        table = np.frombuffer(self.weight_table, dtype=np.float64)
+        term_ids = np.frombuffer(self.term_ids, dtype=np.uintc).astype(np.intp)
+        severities = np.frombuffer(self.severities, dtype=np.uint8)
+        return table[term_ids * len(self.levels) + severities]
+
+    @property
+    def nbytes(self):
+        """Bytes held by the match arrays"""
+        return sum(len(column) * column.itemsize
+                   for column in (self.starts, self.ends, self.term_ids, self.severities))
+
+    def to_payload(self):
+        """
+        Serialize the matches into plain values, e.g. for a session
+
+        Returns:
+            dict: Term names, levels, score and the raw bytes of every array
+        """
+        return {
+            "term_names": self.term_names,
+            "levels": self.levels,
+            "score": self.score,
+            "starts": self.starts.tobytes(),
+            "ends": self.ends.tobytes(),
+            "term_ids": self.term_ids.tobytes(),
+            "severities": self.severities.tobytes()
+        }
+
+    @classmethod
+    def from_payload(cls, payload):
+        """
+        Rebuild matches serialized by to_payload() in the same process type
+
+        Args:
+            payload (dict): Value returned by to_payload()
+
+        Returns:
+            RiskMatches: The restored matches
+        """
+        matches = cls(payload["term_names"], payload["levels"])
+        matches.score = payload["score"]
+        for name in ("starts", "ends", "term_ids", "severities"):
+            getattr(matches, name).frombytes(payload[name])
+        return matches
+
+    @staticmethod
+    def is_payload(value):
+        """Check whether a value was produced by to_payload()"""
+        return isinstance(value, dict) and "severities" in value
+
+# Compiled matchers keyed on the content hash of their lexicon
+_matcher_cache = LRUCache(RISK_MATCHER_CACHE_SIZE)
+
+def get_risk_matcher(lexicon=None):
+    """
+    Get the compiled matcher for a lexicon, building it on first use
+
+    Matchers are cached by the lexicon's content hash, so switching between
+    lexicons costs nothing once each has been compiled, and a reloaded file
+    with unchanged terms keeps its matcher.
+
+    Args:
+        lexicon (str or RiskLexicon, optional): Lexicon or lexicon name,
+            defaults to DEFAULT_RISK_LEXICON
+
+    Returns:
+        RiskMatcher: Matcher shared by every lexicon with the same content
+    """
+    lexicon = get_risk_lexicon(lexicon)
+
+    matcher = _matcher_cache.get(lexicon.fingerprint)
+    if matcher is None:
+        matcher = RiskMatcher(lexicon.terms, lexicon.variants, RISK_MATCH_INFLECTIONS, lexicon.inflections)
+        _matcher_cache.put(lexicon.fingerprint, matcher)
+
+    return matcher
+
+def install_risk_matcher(lexicon, matcher):
+    """
+    Cache a matcher compiled elsewhere, such as one handed to a worker process
+
+    Args:
+        lexicon (RiskLexicon): Lexicon the matcher was compiled from
+        matcher (RiskMatcher): The compiled matcher
+    """
+    _matcher_cache.put(lexicon.fingerprint, matcher)
@@ -0,0 +1,177 @@
+"""
+Sharded search module for the JusticeAI application.
+Scatters FAQ queries across worker processes that each own a slice of the
+question matrix or of its LSA embeddings, and gathers their local top-k with
+a heap merge.
+"""
+
+import heapq
+import itertools
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Local imports
+from config import FAQ_SEARCH_SHARDS
+from analysis.inverted_index import InvertedIndex
+from analysis.ranking import sparse_top_k, dense_top_k
+
+# Shard owned by the current worker process:
+# (question matrix, first row, inverted index, LSA embeddings)
+_shard = None
+
+def _load_shard(question_matrix, first_row, use_inverted, embeddings=None):
+    """
+    Worker initializer that takes ownership of one shard
+
+    Args:
+        question_matrix (scipy.sparse.csr_matrix): Rows of this shard, None
+            when the shard is searched by its LSA embeddings
+        first_row (int): Global row of the shard's first question
+        use_inverted (bool): Whether to search the shard with posting lists
+        embeddings (numpy.ndarray, optional): LSA embeddings of the rows
+    """
+    global _shard
+    inverted_index = InvertedIndex(question_matrix) if use_inverted else None
+    _shard = (question_matrix, first_row, inverted_index, embeddings)
+
+def _search_shard(query_matrix, k, min_score, block_size):
+    """
+    Find the local top k of the worker's shard for every query
+
+    Args:
+        query_matrix (scipy.sparse.csr_matrix or numpy.ndarray): L2-normalised
+            query vectors, or query embeddings for an LSA shard
+        k (int): Number of candidates to return per query
+        min_score (float): Candidates below this score may be omitted
+        block_size (int): Maximum number of queries scored together
+
+    Returns:
+        list: One list of (-score, global row) pairs per query, best first
+    """
+    question_matrix, first_row, inverted_index, embeddings = _shard
+
+    if embeddings is not None:
+        top_indices, top_scores = dense_top_k(query_matrix, embeddings, k, block_size)
+    elif inverted_index is not None:
+        top_indices, top_scores = inverted_index.search_batch(query_matrix, k, min_score)
+    else:
+        top_indices, top_scores = sparse_top_k(query_matrix, question_matrix, k, block_size)
+
+    return [
+        [(-float(score), int(row) + first_row) for row, score in zip(indices, scores)]
+        for indices, scores in zip(top_indices, top_scores)
+    ]
+
+class ShardedQuestionIndex:
+    """Scatter-gather search over question matrix shards owned by persistent workers"""
+
+    def __init__(self, index, num_shards=FAQ_SEARCH_SHARDS):
+        """
+        Split a fitted question index into contiguous shards and start one
+        single-process pool per shard
+
+        Args:
+            index (QuestionIndex): Index fitted over the whole corpus
+            num_shards (int): Number of shards and worker processes
+        """
+        self.index = index
+        self.qa_pairs = index.qa_pairs
+
+        num_shards = max(1, min(num_shards, len(index)))
+        bounds = np.linspace(0, len(index), num_shards + 1).astype(int)
+        use_inverted = index.inverted_index is not None
+        self.lsa_index = index.lsa_index
+
+        # Queries in flight, and whether close() was called; the workers are
+        # only shut down once the last query submitted to them has finished
+        self._lock = threading.Lock()
+        self._active = 0
+        self._closed = False
+
+        # A dedicated one-worker pool per shard pins each shard to one
+        # process, so every worker keeps only its own slice in memory
+        self.executors = []
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            if self.lsa_index is not None:
+                # Copied out of any memory map so the slice pickles as a plain array
+                initargs = (None, int(start), False, np.array(self.lsa_index.embeddings[start:end]))
+            else:
+                initargs = (index.question_matrix[start:end], int(start), use_inverted)
+            self.executors.append(ProcessPoolExecutor(max_workers=1, initializer=_load_shard, initargs=initargs))
+
+    def __len__(self):
+        return len(self.qa_pairs)
+
+    def top_k(self, clean_questions, k, min_score=0.0, block_size=4096):
+        """
+        Rank the k most similar questions across all shards
+
+        Queries are vectorised once in the coordinator, and projected into
+        the latent space there when the index uses LSA. Each shard returns its
+        local top k, ordered by descending score then ascending row, and the
+        sorted shard lists are merged with a heap. Shards are contiguous row
+        ranges and use the same tie-breaking as a single-process search, so
+        the merged ranking is identical to it.
+
+        Args:
+            clean_questions (list): Questions already passed through text cleaning
+            k (int): Number of candidates to return per query
+            min_score (float): Candidates below this score may be omitted
+            block_size (int): Maximum number of queries scored together
+
+        Returns:
+            tuple: (indices, scores) lists with one array per query, best
+                   candidate first in every row
+        """
+        with self._lock:
+            closed = self._closed
+            if not closed:
+                self._active += 1
+        if closed:
+            # Replaced while this query was on its way: the unsharded index
+            # gives the same ranking
+            return self.index.top_k(clean_questions, k, min_score, block_size)
+
+        try:
+            query_matrix = self.index.vectorizer.transform(clean_questions)
+            if self.lsa_index is not None:
+                query_matrix = self.lsa_index.embed(query_matrix)
+
+            futures = [executor.submit(_search_shard, query_matrix, k, min_score, block_size)
+                       for executor in self.executors]
+            shard_results = [future.result() for future in futures]
+        finally:
+            with self._lock:
+                self._active -= 1
+                shut_down = self._closed and self._active == 0
+            if shut_down:
+                self._shutdown()
+
+        top_indices, top_scores = [], []
+        for row in range(query_matrix.shape[0]):
+            merged = list(itertools.islice(heapq.merge(*(result[row] for result in shard_results)), k))
+            top_indices.append(np.array([candidate for _, candidate in merged], dtype=np.intp))
+            top_scores.append(np.array([-negated for negated, _ in merged], dtype=np.float64))
+
+        return top_indices, top_scores
+
+    def close(self):
+        """
+        Shut down the shard workers once their queries in flight have finished
+
+        Queries already started still complete on the workers, and later
+        ones are answered by the unsharded index, so a searcher replaced
+        during an FAQ edit keeps serving the requests that still hold it.
+        """
+        with self._lock:
+            self._closed = True
+            shut_down = self._active == 0
+        if shut_down:
+            self._shutdown()
+
+    def _shutdown(self):
+        """Stop the shard workers without waiting for them"""
+        for executor in self.executors:
+            executor.shutdown(wait=False)
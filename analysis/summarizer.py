@@ -3,25 +3,54 @@ Summarizer module for the JusticeAI application.
 Handles text summarization using frequency-based and extractive methods.
 """
 
+import math
+import multiprocessing
+import os
 import re
-import heapq
 import string
-from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+import numpy as np
+from scipy.sparse import csr_matrix, diags
 
 # Local imports
-from config import SUMMARIZATION_RATIO
+from config import (SUMMARIZATION_RATIO, SUMMARY_CHUNK_SIZE, SUMMARY_CHUNK_OVERSAMPLE, SUMMARY_WORKERS,
+                    SUMMARY_METHOD, TEXTRANK_NEIGHBORS, TEXTRANK_MIN_SIMILARITY, TEXTRANK_MAX_DF,
+                    TEXTRANK_DAMPING, TEXTRANK_MAX_ITERATIONS, TEXTRANK_TOLERANCE)
+from analysis.ranking import rank_top_k
+
+# Decimal places sentence scores are compared at when picking sentences
+SCORE_DECIMALS = 9
+
+# Words in fewer sentences than this always link sentences in TextRank,
+# however large a share of a short document they cover
+_TEXTRANK_MIN_DF_CUTOFF = 100
+
+# Rows of the TextRank similarity product computed at once
+_TEXTRANK_BLOCK_ROWS = 2048
 
-def summarize_text(text, ratio=SUMMARIZATION_RATIO):
+# Sentence end, as used by _split_into_sentences
+_SENTENCE_END = re.compile(r'[.!?][\s\n]')
+
+def summarize_text(text, ratio=SUMMARIZATION_RATIO, method=SUMMARY_METHOD):
     """
     Generate an extractive summary of the given text
     
     Args:
         text (str): The text to summarize
         ratio (float): The ratio of sentences to include in the summary
+        method (str): Sentence scoring, "frequency" for normalised word
+            frequencies or "textrank" for centrality in a graph of similar
+            sentences
         
     Returns:
         str: The generated summary
+        
+    Raises:
+        ValueError: If the method is unknown
     """
+    score_sentences = _get_scorer(method)
+    
     if not text or not text.strip():
         return "No text available to summarize."
     
@@ -34,23 +63,190 @@ def summarize_text(text, ratio=SUMMARIZATION_RATIO):
     if len(sentences) <= 3:
         return text  # Text is already short, return as is
     
-    # Calculate sentence scores
-    sentence_scores = _score_sentences(sentences)
+    # Calculate sentence scores, one per sentence position
+    sentence_scores = score_sentences(sentences)
     
     # Determine how many sentences to include in the summary
     summary_size = max(3, int(len(sentences) * ratio))
     
-    # Get the highest scoring sentences
-    best_sentences = heapq.nlargest(summary_size, sentence_scores, key=sentence_scores.get)
+    # Get the highest scoring sentences, earlier ones first on equal scores
+    best_indices = _select_sentences(sentence_scores, summary_size)
     
-    # Sort sentences by their original order
-    best_sentences.sort(key=lambda s: sentences.index(s))
-    
-    # Combine the sentences into a summary
-    summary = " ".join(best_sentences)
+    # Combine the sentences into a summary in their original order
+    summary = " ".join(sentences[index] for index in best_indices)
     
     return summary
 
+def summarize_hierarchical(text, ratio=SUMMARIZATION_RATIO, chunk_size=SUMMARY_CHUNK_SIZE,
+                           workers=SUMMARY_WORKERS, method=SUMMARY_METHOD):
+    """
+    Summarize a long document chunk by chunk on a process pool
+    
+    The document is cut into chunks at sentence ends, or taken as given,
+    such as the pages of DocumentProcessor.iter_text_chunks. Every chunk is
+    summarized on its own, keeping SUMMARY_CHUNK_OVERSAMPLE times the ratio
+    of its sentences. A final pass scores the combined chunk summaries and
+    keeps as many sentences as summarize_text would for the whole document.
+    Only a few chunks are in flight at a time, so memory depends on the
+    chunk size rather than the document size. Word frequencies are taken
+    per chunk and then over the candidates, so the summary can differ from
+    summarize_text on the same text.
+    
+    Args:
+        text (str or iterable): The text to summarize, or its chunks in
+            document order
+        ratio (float): The ratio of sentences to include in the summary
+        chunk_size (int): Approximate characters per chunk when text is a
+            string
+        workers (int): Worker processes, 0 for one per CPU and 1 to
+            summarize in this process
+        method (str): Sentence scoring, as for summarize_text
+        
+    Returns:
+        str: The generated summary
+        
+    Raises:
+        ValueError: If the method is unknown
+    """
+    score_sentences = _get_scorer(method)
+    
+    if isinstance(text, str):
+        if len(text) <= chunk_size:
+            return summarize_text(text, ratio, method)
+        chunks = _iter_sections(text, chunk_size)
+    else:
+        chunks = iter(text)
+    
+    chunk_ratio = min(1.0, ratio * SUMMARY_CHUNK_OVERSAMPLE)
+    workers = workers or os.cpu_count() or 1
+    
+    # Candidate sentences of every chunk by chunk position, and the total
+    # number of sentences in the document
+    candidates = {}
+    num_sentences = 0
+    
+    for position, (chunk_candidates, chunk_sentences) in _map_chunks(chunks, chunk_ratio, workers, method):
+        candidates[position] = chunk_candidates
+        num_sentences += chunk_sentences
+    
+    if num_sentences == 0:
+        return "No text available to summarize."
+    sentences = [sentence for position in sorted(candidates) for sentence in candidates[position]]
+    
+    # Final pass over the combined chunk summaries
+    summary_size = max(3, int(num_sentences * ratio))
+    if len(sentences) <= summary_size:
+        return " ".join(sentences)
+    
+    best_indices = _select_sentences(score_sentences(sentences), summary_size)
+    return " ".join(sentences[index] for index in best_indices)
+
+def _map_chunks(chunks, chunk_ratio, workers, method):
+    """
+    Summarize chunks, in worker processes when there is more than one
+    
+    At most two chunks per worker are submitted ahead, so a lazy chunk
+    iterator is never read far ahead of the workers.
+    
+    Args:
+        chunks (iterator): Chunk texts in document order
+        chunk_ratio (float): Ratio of sentences kept per chunk
+        workers (int): Worker processes
+        method (str): Sentence scoring
+        
+    Yields:
+        tuple: (chunk position, (candidate sentences, number of sentences))
+               in completion order
+    """
+    if workers <= 1:
+        for position, chunk in enumerate(chunks):
+            yield position, _summarize_chunk(chunk, chunk_ratio, method)
+        return
+    
+    context = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() else None
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        pending = {}
+        chunks = enumerate(chunks)
+        exhausted = False
+        
+        while pending or not exhausted:
+            while not exhausted and len(pending) < 2 * workers:
+                try:
+                    position, chunk = next(chunks)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending[executor.submit(_summarize_chunk, chunk, chunk_ratio, method)] = position
+            
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future.result()
+
+def _summarize_chunk(chunk, chunk_ratio, method):
+    """
+    Pick the candidate sentences of one chunk
+    
+    Args:
+        chunk (str): Chunk text
+        chunk_ratio (float): Ratio of sentences to keep
+        method (str): Sentence scoring
+        
+    Returns:
+        tuple: (list of picked sentences in order, number of sentences in
+               the chunk)
+    """
+    sentences = _split_into_sentences(_clean_text(chunk))
+    if not sentences:
+        return [], 0
+    
+    keep = max(1, math.ceil(len(sentences) * chunk_ratio))
+    best_indices = _select_sentences(_get_scorer(method)(sentences), keep)
+    return [sentences[index] for index in best_indices], len(sentences)
+
+def _iter_sections(text, chunk_size):
+    """
+    Cut text into chunks of about chunk_size characters at sentence ends
+    
+    Args:
+        text (str): Text to cut
+        chunk_size (int): Characters after which the next sentence end
+            closes a chunk
+        
+    Yields:
+        str: Consecutive chunks of the text
+    """
+    start = 0
+    while start < len(text):
+        end = len(text)
+        if start + chunk_size < len(text):
+            match = _SENTENCE_END.search(text, start + chunk_size)
+            if match:
+                end = match.end()
+        yield text[start:end]
+        start = end
+
+def _select_sentences(sentence_scores, summary_size):
+    """
+    Pick the highest scoring sentences
+    
+    Args:
+        sentence_scores (numpy.ndarray): Score per sentence, -inf for
+            sentences that may not be picked
+        summary_size (int): Maximum number of sentences to pick
+        
+    Returns:
+        numpy.ndarray: Indices of the picked sentences in ascending order
+    """
+    candidates = np.flatnonzero(np.isfinite(sentence_scores))
+    k = min(summary_size, len(candidates))
+    
+    # Scores equal up to rounding error are ties, which the earlier sentence wins
+    scores = np.round(sentence_scores[candidates], SCORE_DECIMALS)
+    top_indices, _ = rank_top_k(scores[None, :], k)
+    return np.sort(candidates[top_indices[0]])
+
 def _clean_text(text):
     """
     Clean the text for better summarization
@@ -87,53 +283,189 @@ def _split_into_sentences(text):
     # Filter out empty sentences and clean them
     return [s.strip() for s in sentences if s.strip()]
 
+def _sentence_term_matrix(sentences):
+    """
+    Tokenize sentences once into a sparse sentence-by-term count matrix
+    
+    Punctuation is stripped and the text lowercased in one pass over the
+    joined sentences, which must not contain newlines, as produced by
+    _split_into_sentences.
+    
+    Args:
+        sentences (list): List of sentences
+        
+    Returns:
+        tuple: (scipy.sparse.csr_matrix of term counts per sentence, array
+               of the number of tokens in every sentence)
+    """
+    translator = str.maketrans('', '', string.punctuation)
+    lines = "\n".join(sentences).translate(translator).lower().split("\n")
+    sentence_tokens = [line.split() for line in lines]
+    
+    lengths = np.fromiter(map(len, sentence_tokens), dtype=np.intp, count=len(sentence_tokens))
+    indptr = np.zeros(len(sentence_tokens) + 1, dtype=np.intp)
+    np.cumsum(lengths, out=indptr[1:])
+    
+    vocabulary = {}
+    term_ids = np.fromiter((vocabulary.setdefault(word, len(vocabulary))
+                            for tokens in sentence_tokens for word in tokens),
+                           dtype=np.intp, count=indptr[-1])
+    
+    counts = csr_matrix((np.ones(len(term_ids)), term_ids, indptr),
+                        shape=(len(sentence_tokens), len(vocabulary)))
+    counts.sum_duplicates()
+    
+    return counts, lengths
+
 def _score_sentences(sentences):
     """
     Score sentences based on word frequency
     
+    The document is tokenized once into a count matrix; the score of every
+    sentence is its row times the normalised word frequencies, dampened by
+    the square root of its length.
+    
     Args:
         sentences (list): List of sentences
         
     Returns:
-        dict: Dictionary of sentences and their scores
+        numpy.ndarray: Score of every sentence by position, -inf for
+                       sentences too short to be scored
     """
-    # Flatten all sentences into a single string for word frequency analysis
-    all_text = ' '.join(sentences)
+    counts, lengths = _sentence_term_matrix(sentences)
     
-    # Remove punctuation and convert to lowercase
-    translator = str.maketrans('', '', string.punctuation)
-    all_text = all_text.translate(translator).lower()
+    # Normalized word frequencies over the whole document
+    word_frequencies = np.asarray(counts.sum(axis=0), dtype=np.float64).ravel()
+    if len(word_frequencies):
+        word_frequencies /= word_frequencies.max()
+    
+    # Sum of word frequencies, normalized by sentence length to avoid bias
+    # towards longer sentences (but with a dampening factor to still give
+    # some weight to longer sentences)
+    sentence_scores = (counts @ word_frequencies) / np.sqrt(np.maximum(lengths, 1))
+    
+    # Skip very short sentences; sentences are single-spaced, so the word
+    # count is the number of spaces plus one
+    word_counts = np.fromiter((sentence.count(" ") + 1 for sentence in sentences),
+                              dtype=np.intp, count=len(sentences))
+    sentence_scores[word_counts <= 3] = -np.inf
+    
+    return sentence_scores
+
+def _textrank_scores(sentences):
+    """
+    Score sentences by their centrality in a sparse similarity graph
+    
+    Sentences are TF-IDF vectors over the same count matrix as the
+    frequency scores. Words found in more than TEXTRANK_MAX_DF of the
+    sentences are left out of the similarities, which keeps the product
+    sparse. Each sentence is linked to at most TEXTRANK_NEIGHBORS others
+    with a cosine similarity of at least TEXTRANK_MIN_SIMILARITY. The
+    product is built a block of rows at a time, so no dense all-pairs matrix
+    is ever formed. Sentences are then ranked by PageRank power iteration
+    over the symmetric, weighted graph.
     
-    # Get word frequencies
-    words = all_text.split()
-    word_frequencies = Counter(words)
+    Args:
+        sentences (list): List of sentences
+        
+    Returns:
+        numpy.ndarray: Rank of every sentence by position, -inf for
+                       sentences too short to be scored
+    """
+    counts, _ = _sentence_term_matrix(sentences)
+    num_sentences = len(sentences)
     
-    # Calculate the maximum frequency for normalization
-    max_frequency = max(word_frequencies.values()) if word_frequencies else 1
+    # Smoothed IDF as in scikit-learn, without the words too common to link sentences
+    document_frequency = np.bincount(counts.indices, minlength=counts.shape[1])
+    idf = np.log((1 + num_sentences) / (1 + document_frequency)) + 1
+    idf[document_frequency > max(TEXTRANK_MAX_DF * num_sentences, _TEXTRANK_MIN_DF_CUTOFF)] = 0
     
-    # Normalize word frequencies
-    for word in word_frequencies:
-        word_frequencies[word] /= max_frequency
+    vectors = (counts @ diags(idf)).tocsr()
+    norms = np.sqrt(np.asarray(vectors.multiply(vectors).sum(axis=1)).ravel())
+    vectors = (diags(1 / np.maximum(norms, 1e-12)) @ vectors).tocsr()
+    vectors_t = vectors.T.tocsr()
     
-    # Score each sentence based on word frequencies
-    sentence_scores = {}
-    for sentence in sentences:
-        # Skip very short sentences
-        if len(sentence.split()) <= 3:
-            continue
+    # k nearest neighbours of every sentence above the similarity threshold
+    graph_rows, graph_columns, graph_weights = [], [], []
+    for start in range(0, num_sentences, _TEXTRANK_BLOCK_ROWS):
+        block = (vectors[start:start + _TEXTRANK_BLOCK_ROWS] @ vectors_t).tocsr()
+        for row in range(block.shape[0]):
+            low, high = block.indptr[row], block.indptr[row + 1]
+            columns = block.indices[low:high]
+            similarities = block.data[low:high]
+            
+            keep = (similarities >= TEXTRANK_MIN_SIMILARITY) & (columns != start + row)
+            columns, similarities = columns[keep], similarities[keep]
+            if len(similarities) > TEXTRANK_NEIGHBORS:
+                nearest = np.argpartition(-similarities, TEXTRANK_NEIGHBORS - 1)[:TEXTRANK_NEIGHBORS]
+                columns, similarities = columns[nearest], similarities[nearest]
             
-        # Remove punctuation and convert to lowercase for scoring
-        clean_sentence = sentence.translate(translator).lower()
-        words = clean_sentence.split()
+            graph_rows.append(np.full(len(columns), start + row))
+            graph_columns.append(columns)
+            graph_weights.append(similarities)
+    
+    graph = csr_matrix((np.concatenate(graph_weights) if graph_weights else [],
+                        (np.concatenate(graph_rows) if graph_rows else [],
+                         np.concatenate(graph_columns) if graph_columns else [])),
+                       shape=(num_sentences, num_sentences))
+    graph = graph.maximum(graph.T).tocsr()
+    
+    scores = _power_iteration(graph)
+    
+    # Skip very short sentences, as the frequency scores do
+    word_counts = np.fromiter((sentence.count(" ") + 1 for sentence in sentences),
+                              dtype=np.intp, count=num_sentences)
+    scores[word_counts <= 3] = -np.inf
+    
+    return scores
+
+def _power_iteration(graph):
+    """
+    Rank the nodes of a weighted graph with PageRank
+    
+    Args:
+        graph (scipy.sparse.csr_matrix): Symmetric matrix of edge weights
         
-        # Calculate sentence score as the sum of word frequencies
-        score = sum(word_frequencies.get(word, 0) for word in words)
+    Returns:
+        numpy.ndarray: Rank of every node, summing to one
+    """
+    num_nodes = graph.shape[0]
+    out_weights = np.asarray(graph.sum(axis=1)).ravel()
+    dangling = out_weights == 0
+    transition_t = (diags(1 / np.where(dangling, 1, out_weights)) @ graph).T.tocsr()
+    
+    ranks = np.full(num_nodes, 1 / num_nodes)
+    for _ in range(TEXTRANK_MAX_ITERATIONS):
+        # Rank of nodes without links is spread evenly, like the random jumps
+        spread = (1 - TEXTRANK_DAMPING + TEXTRANK_DAMPING * ranks[dangling].sum()) / num_nodes
+        updated = TEXTRANK_DAMPING * (transition_t @ ranks) + spread
+        change = np.abs(updated - ranks).sum()
+        ranks = updated
+        if change < TEXTRANK_TOLERANCE:
+            break
+    
+    return ranks
+
+# Sentence scoring functions by summarization method
+_SCORERS = {
+    "frequency": _score_sentences,
+    "textrank": _textrank_scores
+}
+
+def _get_scorer(method):
+    """
+    Look up the sentence scoring function of a summarization method
+    
+    Args:
+        method (str): Summarization method
         
-        # Normalize by sentence length to avoid bias towards longer sentences
-        # (but with a dampening factor to still give some weight to longer sentences)
-        sentence_length = max(1, len(words))
-        score = score / (sentence_length ** 0.5)  # Square root dampening
+    Returns:
+        function: Scoring function taking a list of sentences
         
-        sentence_scores[sentence] = score
-    
-    return sentence_scores
+    Raises:
+        ValueError: If the method is unknown
+    """
+    try:
+        return _SCORERS[method]
+    except KeyError:
+        raise ValueError(f"Unknown summarization method: {method}")
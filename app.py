@@ -14,11 +14,13 @@ from werkzeug.utils import secure_filename
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Local imports
-from config import APP_NAME, APP_VERSION
+from config import (APP_NAME, APP_VERSION, MAX_BATCH_QUESTIONS, MAX_SUGGESTIONS, RISK_TOP_CLAUSES,
+                    RISK_SNIPPET_CONTEXT)
 from utils.document_processor import DocumentProcessor
-from analysis.summarizer import summarize_text
-from analysis.risk_analyzer import analyze_risks
-from analysis.question_answering import get_answer_for_question
+from analysis.document_cache import extract_document_text, analyze_document, get_document_cache_stats
+from analysis.risk_lexicon import list_risk_lexicons
+from analysis.question_answering import get_answer_for_question, get_answers_for_questions, get_answer_cache_stats
+from analysis.question_suggester import get_question_trie, suggest_questions
 from data.legal_terms import LEGAL_TERMS, TERM_CATEGORIES
 from data.legal_faq import LEGAL_FAQ_CATEGORIES
 
@@ -28,6 +30,9 @@ app.secret_key = os.urandom(24)
 app.config['UPLOAD_FOLDER'] = tempfile.gettempdir()
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max upload size
 
+# Build the question autocomplete trie at startup; edits to the FAQ rebuild it
+get_question_trie()
+
 # Custom Jinja2 filter to convert newlines to HTML breaks
 @app.template_filter('nl2br')
 def nl2br(value):
@@ -74,19 +79,24 @@ def document_analysis():
             
             try:
                 # Process the document
-                extracted_text = document_processor.extract_text(file_path)
+                extracted_text = extract_document_text(document_processor, file_path)
                 
                 if not extracted_text:
                     flash('Failed to extract text from document')
                     return redirect(request.url)
                 
-                # Generate summary
-                summary = summarize_text(extracted_text)
+                # Summarize and analyze risks, tolerating OCR misspellings in scanned
+                # images; a document analyzed before is served from the cache
+                summary, risk_result = analyze_document(extracted_text,
+                                                        lexicon=request.form.get('lexicon') or None,
+                                                        fuzzy=document_processor.is_ocr_document(file_path),
+                                                        top_clauses=RISK_TOP_CLAUSES,
+                                                        snippet_context=RISK_SNIPPET_CONTEXT)
                 
-                # Perform risk analysis
-                risk_result = analyze_risks(extracted_text)
+                # Store results in session; the page shows snippets, so the
+                # positions of every risk hit are left out
+                risk_result.pop('highlight_positions', None)
                 
-                # Store results in session
                 session['extracted_text'] = extracted_text
                 session['summary'] = summary
                 session['risk_result'] = risk_result
@@ -101,7 +111,7 @@ def document_analysis():
                 if os.path.exists(file_path):
                     os.remove(file_path)
         
-    return render_template('document_analysis.html')
+    return render_template('document_analysis.html', risk_lexicons=list_risk_lexicons())
 
 @app.route('/document_analysis_result')
 def document_analysis_result():
@@ -160,6 +170,47 @@ def ask_question():
         selected_category=selected_category
     )
 
+@app.route('/api/ask_batch', methods=['POST'])
+def api_ask_batch():
+    """Answer a batch of legal questions in a single JSON request"""
+    payload = request.get_json(silent=True) or {}
+    questions = payload.get('questions')
+    
+    if not isinstance(questions, list) or not all(isinstance(q, str) for q in questions):
+        return jsonify({'error': "'questions' must be a list of strings"}), 400
+    
+    if len(questions) > MAX_BATCH_QUESTIONS:
+        return jsonify({'error': f'At most {MAX_BATCH_QUESTIONS} questions are allowed per request'}), 400
+    
+    category = payload.get('category')
+    if category is not None and not isinstance(category, str):
+        return jsonify({'error': "'category' must be a string"}), 400
+    
+    if category == "All Categories":
+        category = None
+    
+    results = get_answers_for_questions(questions, category)
+    
+    return jsonify({'results': results})
+
+@app.route('/api/suggest')
+def api_suggest():
+    """Suggest FAQ questions completing a partially typed question"""
+    text = request.args.get('q', '')
+    category = request.args.get('category')
+    if category == "All Categories":
+        category = None
+    
+    limit = request.args.get('limit', MAX_SUGGESTIONS, type=int)
+    limit = max(0, min(limit, MAX_SUGGESTIONS))
+    
+    return jsonify({'suggestions': suggest_questions(text, category, limit)})
+
+@app.route('/api/cache_stats')
+def api_cache_stats():
+    """Report question answering cache counters"""
+    return jsonify({'answer_cache': get_answer_cache_stats(), 'document_cache': get_document_cache_stats()})
+
 @app.route('/learn_terms')
 def learn_terms():
     """Learn legal terms page route"""
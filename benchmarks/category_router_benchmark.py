@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark for category routing in the JusticeAI application.
+Compares whole-FAQ search with nearest-centroid routed search for latency and
+top-1 accuracy, on the bundled FAQ and on larger synthetic FAQ sets.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Add the project root to path to ensure imports work
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Local imports
+from analysis.category_router import CategoryRouter
+from analysis.faq_index import QuestionIndex, build_qa_pairs
+from analysis.question_answering import TOP_K_CANDIDATES, MIN_RELATED_SIMILARITY, _clean_text
+from data.legal_faq import LEGAL_FAQ_CATEGORIES
+
+def build_synthetic_corpus(size, seed=0):
+    """
+    Build a multi-category synthetic FAQ whose questions mostly reuse the
+    vocabulary of their bundled category
+
+    Args:
+        size (int): Number of question-answer pairs to generate
+        seed (int): Random seed
+
+    Returns:
+        list: List of question-answer dictionaries
+    """
+    rng = random.Random(seed)
+    category_words = {
+        category: _clean_text(" ".join(questions)).replace("?", "").split()
+        for category, questions in LEGAL_FAQ_CATEGORIES.items()
+    }
+    all_words = [word for words in category_words.values() for word in words]
+    categories = list(category_words)
+
+    qa_pairs = []
+    for number in range(size):
+        category = categories[number % len(categories)]
+        tokens = rng.sample(category_words[category], rng.randint(4, 8))
+        tokens += rng.sample(all_words, rng.randint(1, 3))
+        tokens.append(f"{category.split()[0].lower()}{rng.randint(0, size // 20)}")
+        qa_pairs.append({
+            "question": " ".join(tokens) + "?",
+            "answer": f"Answer {number}",
+            "category": category
+        })
+
+    return qa_pairs
+
+def build_queries(qa_pairs, count, seed=1):
+    """Build (query, source row) pairs by dropping words from corpus questions"""
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(count):
+        row = rng.randrange(len(qa_pairs))
+        tokens = _clean_text(qa_pairs[row]["question"]).split()
+        keep = max(2, len(tokens) - rng.randint(0, 3))
+        queries.append((" ".join(rng.sample(tokens, keep)), row))
+    return queries
+
+def run(engine, queries):
+    """Answer queries one at a time and return (seconds, top-1 rows)"""
+    top_rows = []
+    start = time.perf_counter()
+    for query, _ in queries:
+        indices, _ = engine.top_k([query], TOP_K_CANDIDATES, MIN_RELATED_SIMILARITY)
+        top_rows.append(indices[0][0] if len(indices[0]) else None)
+    return time.perf_counter() - start, top_rows
+
+def report(label, qa_pairs, queries, engine="brute"):
+    """Print latency and accuracy of whole-FAQ and routed search"""
+    index = QuestionIndex(qa_pairs, engine=engine)
+    router = CategoryRouter(index)
+
+    global_time, global_rows = run(index, queries)
+    routed_time, routed_rows = run(router, queries)
+
+    sources = [row for _, row in queries]
+    global_accuracy = sum(g == s for g, s in zip(global_rows, sources)) / len(queries)
+    routed_accuracy = sum(r == s for r, s in zip(routed_rows, sources)) / len(queries)
+    agreement = sum(g == r for g, r in zip(global_rows, routed_rows)) / len(queries)
+
+    print(f"{label:>12} {global_time / len(queries) * 1000:>10.3f} {routed_time / len(queries) * 1000:>10.3f} "
+          f"{global_accuracy:>9.1%} {routed_accuracy:>9.1%} {agreement:>9.1%}")
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark category routing")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--engine", choices=["brute", "inverted", "lsa"], default="brute")
+    args = parser.parse_args()
+
+    print(f"{'questions':>12} {'global ms':>10} {'routed ms':>10} {'global@1':>9} {'routed@1':>9} {'agree@1':>9}")
+
+    bundled = build_qa_pairs(LEGAL_FAQ_CATEGORIES)
+    report("bundled", bundled, build_queries(bundled, args.queries), args.engine)
+
+    for size in args.sizes:
+        qa_pairs = build_synthetic_corpus(size)
+        report(str(size), qa_pairs, build_queries(qa_pairs, args.queries), args.engine)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark for FAQ retrieval engines in the JusticeAI application.
+Compares brute-force scoring with the pruned inverted index on a synthetic
+FAQ corpus built from the bundled questions' vocabulary.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+# Add the project root to path to ensure imports work
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Local imports
+from analysis.faq_index import QuestionIndex
+from analysis.question_answering import TOP_K_CANDIDATES, MIN_RELATED_SIMILARITY, _clean_text
+from data.legal_faq import LEGAL_FAQ_CATEGORIES
+
+def build_synthetic_corpus(size, seed=0):
+    """
+    Build a synthetic FAQ corpus by recombining words from the bundled questions
+
+    Args:
+        size (int): Number of question-answer pairs to generate
+        seed (int): Random seed
+
+    Returns:
+        list: List of question-answer dictionaries
+    """
+    rng = random.Random(seed)
+    bundled = [q for questions in LEGAL_FAQ_CATEGORIES.values() for q in questions]
+    words = _clean_text(" ".join(bundled)).replace("?", "").split()
+
+    # Extra jurisdiction-specific tokens with a long-tailed frequency, as in
+    # state-level FAQ sets
+    extra_vocabulary = [f"state{n}" for n in range(2000)]
+
+    qa_pairs = []
+    for number in range(size):
+        length = rng.randint(5, 12)
+        tokens = rng.sample(words, length)
+        tokens.append(extra_vocabulary[int(rng.paretovariate(1.2)) % len(extra_vocabulary)])
+        qa_pairs.append({
+            "question": " ".join(tokens) + "?",
+            "answer": f"Answer {number}",
+            "category": "Synthetic"
+        })
+
+    return qa_pairs
+
+def build_queries(qa_pairs, count, seed=1):
+    """Build queries by dropping words from randomly chosen corpus questions"""
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(count):
+        tokens = rng.choice(qa_pairs)["question"].split()
+        keep = max(2, len(tokens) - rng.randint(0, 3))
+        queries.append(_clean_text(" ".join(rng.sample(tokens, keep))))
+    return queries
+
+def time_engine(index, queries):
+    """Run every query one at a time and return (seconds, results)"""
+    results = []
+    start = time.perf_counter()
+    for query in queries:
+        indices, scores = index.top_k([query], TOP_K_CANDIDATES, MIN_RELATED_SIMILARITY)
+        results.append((indices[0], scores[0]))
+    return time.perf_counter() - start, results
+
+def same_results(brute_result, inverted_result):
+    """
+    Check that both engines agree on every candidate at or above the score floor
+
+    Questions tied with the last returned score may legitimately differ, since
+    either engine can cut the tie at a different question.
+    """
+    brute_indices, brute_scores = brute_result
+    keep = brute_scores >= MIN_RELATED_SIMILARITY
+    brute_indices, brute_scores = brute_indices[keep], brute_scores[keep]
+    inverted_indices, inverted_scores = inverted_result
+
+    if len(brute_scores) != len(inverted_scores) or not np.allclose(brute_scores, inverted_scores):
+        return False
+    if len(brute_scores) == 0:
+        return True
+
+    untied = ~np.isclose(brute_scores, brute_scores[-1])
+    return np.array_equal(brute_indices[untied], inverted_indices[untied])
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark FAQ retrieval engines")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--queries", type=int, default=500)
+    args = parser.parse_args()
+
+    print(f"{'questions':>10} {'brute ms/q':>12} {'inverted ms/q':>14} {'speedup':>8} {'identical':>10}")
+    for size in args.sizes:
+        qa_pairs = build_synthetic_corpus(size)
+        queries = build_queries(qa_pairs, args.queries)
+
+        brute = QuestionIndex(qa_pairs, engine="brute")
+        inverted = QuestionIndex(qa_pairs, engine="inverted")
+
+        brute_time, brute_results = time_engine(brute, queries)
+        inverted_time, inverted_results = time_engine(inverted, queries)
+
+        identical = all(same_results(b, i) for b, i in zip(brute_results, inverted_results))
+        print(f"{size:>10} {brute_time / len(queries) * 1000:>12.3f} "
+              f"{inverted_time / len(queries) * 1000:>14.3f} "
+              f"{brute_time / inverted_time:>7.1f}x {str(identical):>10}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the LSA retrieval engine in the JusticeAI application.
+Compares sparse TF-IDF scoring with dense latent semantic scoring for
+paraphrase accuracy on the bundled FAQ, and for latency and memory on
+larger synthetic FAQ sets.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add the project root to path to ensure imports work
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Local imports
+from analysis.faq_index import QuestionIndex, build_qa_pairs
+from analysis.question_answering import TOP_K_CANDIDATES, _clean_text
+from data.legal_faq import LEGAL_FAQ_CATEGORIES
+from faq_search_benchmark import build_synthetic_corpus, build_queries
+
+# Reworded versions of bundled questions, paired with the question they mean
+PARAPHRASES = [
+    ("Can the owner throw me out of my rented flat suddenly?", "Can a landlord evict me without notice?"),
+    ("How many months of rent can the owner take as deposit?", "How much security deposit can a landlord legally ask for?"),
+    ("Is a lease the same thing as a rent agreement?", "What is the difference between lease and rental agreement?"),
+    ("Where do I complain about a bad purchase as a consumer?", "How do I file a consumer complaint in India?"),
+    ("The item I bought is faulty, what can I do?", "What rights do I have if a product is defective?"),
+    ("How many days until the company must refund me?", "How long should a company take to process my refund?"),
+    ("Can my boss make me work extra hours?", "Can my employer force me to work overtime?"),
+    ("How much notice must I give before quitting my job?", "What is the legal notice period for resigning from a job?"),
+    ("Who gets the kids after a divorce?", "How is child custody determined in Indian divorce cases?"),
+    ("How do we adopt a child?", "What is the legal process for adoption in India?"),
+    ("The police arrested me for nothing, what now?", "What should I do if I'm wrongfully arrested?"),
+    ("How to lodge a police report?", "How do I file an FIR (First Information Report)?"),
+    ("Can we settle a criminal matter without going to court?", "Can a criminal case be settled outside court?"),
+    ("What is the jail term for online fraud and hacking?", "What is the punishment for cybercrime in India?"),
+    ("Steps to incorporate a private company", "How do I register a private limited company in India?"),
+    ("Which taxes must my small shop pay?", "What taxes does a small business need to pay in India?"),
+    ("How can I patent my invention?", "How do I protect my business idea or invention in India?"),
+    ("Is a non compete in my job contract enforceable?", "Is it legal to have a non-compete clause in my contract?"),
+]
+
+def paraphrase_accuracy(index, qa_pairs):
+    """Fraction of paraphrases whose top-ranked question is the intended one"""
+    queries = [_clean_text(paraphrase) for paraphrase, _ in PARAPHRASES]
+    top_indices, _ = index.top_k(queries, 1)
+    correct = sum(qa_pairs[indices[0]]["question"] == expected
+                  for indices, (_, expected) in zip(top_indices, PARAPHRASES))
+    return correct / len(PARAPHRASES)
+
+def matrix_bytes(index):
+    """Bytes held by the arrays the engine scores against"""
+    if index.lsa_index is not None:
+        return index.lsa_index.embeddings.nbytes + index.lsa_index.components.nbytes
+    matrix = index.question_matrix
+    return matrix.data.nbytes + matrix.indices.nbytes + matrix.indptr.nbytes
+
+def time_queries(index, queries, batch):
+    """Seconds per query, answering one at a time or as a single batch"""
+    start = time.perf_counter()
+    if batch:
+        index.top_k(queries, TOP_K_CANDIDATES)
+    else:
+        for query in queries:
+            index.top_k([query], TOP_K_CANDIDATES)
+    return (time.perf_counter() - start) / len(queries)
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark the LSA retrieval engine")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--queries", type=int, default=500)
+    args = parser.parse_args()
+
+    bundled = build_qa_pairs(LEGAL_FAQ_CATEGORIES)
+    sparse = QuestionIndex(bundled, engine="brute")
+    dense = QuestionIndex(bundled, engine="lsa")
+    print("Paraphrase top-1 accuracy on the bundled FAQ")
+    print(f"  sparse TF-IDF: {paraphrase_accuracy(sparse, bundled):.1%}")
+    print(f"  LSA:           {paraphrase_accuracy(dense, bundled):.1%}")
+    print()
+
+    print(f"{'questions':>10} {'engine':>7} {'fit s':>7} {'MB':>7} {'single ms/q':>12} {'batch ms/q':>11}")
+    for size in args.sizes:
+        qa_pairs = build_synthetic_corpus(size)
+        queries = build_queries(qa_pairs, args.queries)
+
+        for engine in ("brute", "lsa"):
+            start = time.perf_counter()
+            index = QuestionIndex(qa_pairs, engine=engine)
+            fit_seconds = time.perf_counter() - start
+
+            single = time_queries(index, queries, batch=False)
+            batched = time_queries(index, queries, batch=True)
+            print(f"{size:>10} {engine:>7} {fit_seconds:>7.1f} {matrix_bytes(index) / 1e6:>7.1f} "
+                  f"{single * 1000:>12.3f} {batched * 1000:>11.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Benchmark for batch risk analysis in the JusticeAI application.
+Screens a set of synthetic contracts with different numbers of worker
+processes and reports the throughput of each, then prints the aggregate
+table of the last run.
+"""
+
+import argparse
+import os
+import sys
+
+# Add the project root to path to ensure imports work
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Local imports
+from analysis.risk_batch import analyze_risks_batch
+from benchmarks.risk_matches_benchmark import build_document
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark batch risk analysis")
+    parser.add_argument("--documents", type=int, default=200)
+    parser.add_argument("--words", type=int, default=20000, help="Words per document")
+    parser.add_argument("--risk-ratio", type=float, default=0.05)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--rows", type=int, default=10, help="Table rows to print")
+    args = parser.parse_args()
+
+    documents = [build_document(args.words, args.risk_ratio, seed=seed) for seed in range(args.documents)]
+    print(f"{args.documents} documents of {args.words} words, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8} {'seconds':>8} {'docs/s':>8}")
+
+    batch = None
+    for workers in args.workers:
+        batch = analyze_risks_batch(documents, workers=workers).wait()
+        print(f"{workers:>8} {batch.seconds:>8.2f} {batch.docs_per_second:>8.1f}")
+
+    columns, rows = batch.table()
+    columns = columns[:9]
+    print()
+    print(" ".join(f"{column[:12]:>12}" for column in columns))
+    for row in rows[:args.rows]:
+        print(" ".join(f"{value:>12.1f}" if isinstance(value, float) else f"{str(value)[:12]:>12}"
+                       for value in row[:len(columns)]))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark for risk match storage in the JusticeAI application.
+Measures the memory held by risk highlight positions as lists of tuples
+and as compact arrays on a large synthetic contract, and the size of each
+once serialized into the session.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+# Add the project root to path to ensure imports work
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Local imports
+from config import HIGH_RISK_TERMS, MEDIUM_RISK_TERMS
+from analysis.risk_analyzer import analyze_risks
+
+FILLER_WORDS = [
+    "the", "party", "shall", "agreement", "hereby", "provided", "that", "any",
+    "such", "notice", "in", "writing", "to", "of", "and", "or", "by", "with"
+]
+
+def build_document(num_words, risk_ratio, seed=0):
+    """Synthetic contract text where about risk_ratio of the words are risk terms"""
+    rng = random.Random(seed)
+    risk_words = HIGH_RISK_TERMS + MEDIUM_RISK_TERMS
+    words = [rng.choice(risk_words) if rng.random() < risk_ratio else rng.choice(FILLER_WORDS)
+             for _ in range(num_words)]
+    return " ".join(words)
+
+def measure(text, compact):
+    """Seconds taken and bytes still allocated for the highlight positions"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    positions = analyze_risks(text, compact=compact)["highlight_positions"]
+    seconds = time.perf_counter() - start
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, held, positions
+
+def session_bytes(positions):
+    """Approximate size of the positions once serialized into the session"""
+    if hasattr(positions, "to_payload"):
+        payload = positions.to_payload()
+        return sum(len(value) for value in payload.values() if isinstance(value, bytes)) * 4 // 3 + \
+            len(json.dumps([payload["term_names"], payload["levels"]]))
+    return len(json.dumps(positions))
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark risk match storage")
+    parser.add_argument("--words", type=int, default=2000000)
+    parser.add_argument("--risk-ratio", type=float, default=0.1)
+    args = parser.parse_args()
+
+    text = build_document(args.words, args.risk_ratio)
+    print(f"{len(text) / 1e6:.1f} MB document, {args.words} words, {args.risk_ratio:.0%} risk terms")
+    print(f"{'storage':>8} {'matches':>9} {'seconds':>8} {'held MB':>8} {'session MB':>11}")
+
+    for label, compact in (("tuples", False), ("arrays", True)):
+        seconds, held, positions = measure(text, compact)
+        matches = sum(len(positions[level]) for level in ("high", "medium"))
+        print(f"{label:>8} {matches:>9} {seconds:>8.2f} {held / 1e6:>8.1f} {session_bytes(positions) / 1e6:>11.1f}")
+        del positions
+
+if __name__ == "__main__":
+    main()
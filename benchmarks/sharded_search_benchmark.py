@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Benchmark for sharded FAQ search in the JusticeAI application.
+Measures batch throughput of scatter-gather search with 1 to N shard workers
+against single-process search, and checks the results are identical.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# Add the project root to path to ensure imports work
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Local imports
+from analysis.faq_index import QuestionIndex
+from analysis.question_answering import TOP_K_CANDIDATES, MIN_RELATED_SIMILARITY
+from analysis.sharded_search import ShardedQuestionIndex
+from faq_search_benchmark import build_synthetic_corpus, build_queries
+
+def timed_top_k(searcher, queries, repeats):
+    """Best wall-clock seconds over several runs, and the last run's results"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        results = searcher.top_k(queries, TOP_K_CANDIDATES, MIN_RELATED_SIMILARITY)
+        best = min(best, time.perf_counter() - start)
+    return best, results
+
+def identical(expected, actual):
+    """Check two (indices, scores) results match row by row"""
+    return all(np.array_equal(e, a) for e, a in zip(expected[0], actual[0])) and \
+        all(np.array_equal(e, a) for e, a in zip(expected[1], actual[1]))
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark sharded FAQ search")
+    parser.add_argument("--size", type=int, default=300000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--engine", choices=["brute", "inverted", "lsa"], default="brute")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    qa_pairs = build_synthetic_corpus(args.size)
+    queries = build_queries(qa_pairs, args.queries)
+    index = QuestionIndex(qa_pairs, engine=args.engine)
+
+    baseline_time, baseline = timed_top_k(index, queries, args.repeats)
+    print(f"{args.size} questions, {args.queries} queries per batch, {args.engine} engine")
+    print(f"{'workers':>8} {'seconds':>9} {'queries/s':>10} {'speedup':>8} {'identical':>10}")
+    print(f"{'single':>8} {baseline_time:>9.3f} {args.queries / baseline_time:>10.0f} {1.0:>7.2f}x {'-':>10}")
+
+    for workers in range(1, args.max_workers + 1):
+        sharded = ShardedQuestionIndex(index, workers)
+        try:
+            # The first call starts the workers and hands them their shards
+            sharded.top_k(queries[:1], TOP_K_CANDIDATES)
+            seconds, results = timed_top_k(sharded, queries, args.repeats)
+        finally:
+            sharded.close()
+
+        print(f"{workers:>8} {seconds:>9.3f} {args.queries / seconds:>10.0f} "
+              f"{baseline_time / seconds:>7.2f}x {str(identical(baseline, results)):>10}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark for summarization methods in the JusticeAI application.
+Measures the latency and peak memory of frequency and TextRank sentence
+scoring on synthetic contracts of growing length.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+# Add the project root to path to ensure imports work
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Local imports
+from analysis.summarizer import summarize_text
+
+CONTRACT_WORDS = [
+    "the", "party", "shall", "agreement", "tenant", "landlord", "payment", "notice",
+    "term", "rent", "deposit", "liability", "breach", "clause", "court", "of", "and",
+    "in", "to", "any", "such", "provided", "that", "hereby", "writing", "premises"
+]
+
+def build_document(num_sentences, vocabulary_size, seed=0):
+    """Synthetic contract of sentences mixing common contract words with rarer ones"""
+    rng = random.Random(seed)
+    rare_words = [f"term{number}" for number in range(vocabulary_size)]
+    sentences = []
+    for _ in range(num_sentences):
+        words = [rng.choice(CONTRACT_WORDS) if rng.random() < 0.5 else rng.choice(rare_words)
+                 for _ in range(rng.randint(4, 30))]
+        sentences.append(" ".join(words).capitalize() + ".")
+    return " ".join(sentences)
+
+def measure(text, method):
+    """Seconds taken, and peak traced megabytes in a second run"""
+    start = time.perf_counter()
+    summarize_text(text, method=method)
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    summarize_text(text, method=method)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak / 1e6
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark summarization methods")
+    parser.add_argument("--sentences", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--vocabulary", type=int, default=5000, help="Number of distinct rare words")
+    parser.add_argument("--methods", nargs="+", default=["frequency", "textrank"])
+    args = parser.parse_args()
+
+    print(f"{'sentences':>10} {'method':>10} {'seconds':>8} {'peak MB':>8}")
+    for num_sentences in args.sentences:
+        text = build_document(num_sentences, args.vocabulary)
+        for method in args.methods:
+            seconds, peak = measure(text, method)
+            print(f"{num_sentences:>10} {method:>10} {seconds:>8.2f} {peak:>8.1f}")
+
+if __name__ == "__main__":
+    main()
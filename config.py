@@ -2,6 +2,8 @@
 Configuration settings for the JusticeAI application.
 """
 
+import os
+
 # Application metadata
 APP_NAME = "JusticeAI"
 APP_VERSION = "1.0.0"
@@ -15,14 +17,37 @@ SUPPORTED_FILE_TYPES = (
 
 # NLP related configurations
 SUMMARIZATION_RATIO = 0.3  # Extract 30% of original text for summaries
+SUMMARY_CHUNK_SIZE = 50000  # Characters per chunk in hierarchical summarization
+SUMMARY_CHUNK_OVERSAMPLE = 2.0  # Chunk summaries keep this multiple of the ratio for the final pass
+SUMMARY_WORKERS = 0  # Worker processes for hierarchical summarization (0 for one per CPU)
+SUMMARY_METHOD = "frequency"  # Sentence scoring for summaries: "frequency" or "textrank"
+TEXTRANK_NEIGHBORS = 10  # Most similar sentences each sentence is linked to in the TextRank graph
+TEXTRANK_MIN_SIMILARITY = 0.1  # Cosine similarity below which two sentences are not linked
+TEXTRANK_MAX_DF = 0.05  # Share of sentences above which a word is too common to link sentences
+TEXTRANK_DAMPING = 0.85  # Probability of following a link rather than jumping to a random sentence
+TEXTRANK_MAX_ITERATIONS = 100  # Most power iterations when ranking sentences
+TEXTRANK_TOLERANCE = 1e-8  # Total rank change at which power iteration stops
 SIMILARITY_THRESHOLD = 0.6  # Minimum similarity score for question matching
+FAQ_SEARCH_ENGINE = "auto"  # "brute", "inverted", "lsa", or "auto" to pick by corpus size
+FAQ_INVERTED_INDEX_MIN_QUESTIONS = 5000  # Corpus size at which "auto" switches to the inverted index
+FAQ_LSA_COMPONENTS = 100  # Latent dimensions of the "lsa" engine, capped by the corpus size
+FAQ_CATEGORY_ROUTING = False  # Search only the most likely categories when no category is selected
+FAQ_ROUTER_CATEGORIES = 2  # Number of categories the router searches per question
+FAQ_ROUTER_MIN_CONFIDENCE = 0.2  # Router similarity below which the whole FAQ is searched
+FAQ_SEARCH_SHARDS = 0  # Worker processes to shard whole-FAQ search across (0 or 1 to disable)
+FAQ_INDEX_COMPACT_RATIO = 0.1  # Edited fraction of an FAQ index that triggers a full refit
+FAQ_INDEX_PATH = os.environ.get("JUSTICEAI_FAQ_INDEX")  # Prebuilt FAQ index artifact to memory-map
+MAX_BATCH_QUESTIONS = 1000  # Maximum number of questions accepted per batch request
+ANSWER_CACHE_SIZE = 1024  # Maximum number of cached question answers
+ANSWER_CACHE_TTL = 3600  # Seconds a cached answer stays valid (None to disable expiry)
+MAX_SUGGESTIONS = 8  # Maximum number of autocomplete suggestions returned per prefix
 
 # High-risk legal terms to highlight
 HIGH_RISK_TERMS = [
     "termination", "penalty", "arbitration", "jurisdiction", "indemnity", 
     "liability", "disclaimer", "waiver", "compensation", "breach", "damages",
     "non-disclosure", "confidentiality", "severability", "prejudice",
-    "forfeit", "default", "non-compete", "governing law", "damages",
+    "forfeit", "default", "non-compete", "governing law",
     "dispute resolution", "legal fees", "suit"
 ]
 
@@ -33,6 +58,73 @@ MEDIUM_RISK_TERMS = [
     "representation", "warranty", "compliance", "obligation", "responsibility"
 ]
 
+# Derived and irregular forms of risk terms, matched as the term itself;
+# regular inflections such as plurals and past tenses are generated
+RISK_TERM_VARIANTS = {
+    "termination": ["terminate"],
+    "indemnity": ["indemnify", "indemnification"],
+    "penalty": ["penalize", "penalise"],
+    "arbitration": ["arbitrate"],
+    "liability": ["liable"],
+    "waiver": ["waive"],
+    "compensation": ["compensate"],
+    "forfeit": ["forfeiture"],
+    "payment": ["pay", "pays", "paying", "paid"],
+    "renewal": ["renew"],
+    "assignment": ["assign"],
+    "modification": ["modify"],
+    "amendment": ["amend"],
+    "warranty": ["warrant"],
+    "obligation": ["obligate"],
+    "compliance": ["comply"]
+}
+
+# How risk terms and variants are inflected when RISK_MATCH_INFLECTIONS is on: terms
+# default to "noun" (plural only) and variants to "none" (matched as written)
+RISK_TERM_INFLECTIONS = {
+    "breach": "verb", "forfeit": "verb", "default": "verb",
+    "terminate": "verb", "indemnify": "verb", "penalize": "verb", "penalise": "verb",
+    "arbitrate": "verb", "waive": "verb", "compensate": "verb", "renew": "verb",
+    "assign": "verb", "modify": "verb", "amend": "verb", "warrant": "verb",
+    "obligate": "verb", "comply": "verb",
+    "term": "none", "force majeure": "none"
+}
+
+# Risk patterns made of terms that occur within a few words of each other
+RISK_PROXIMITY_RULES = [
+    {"name": "Termination without notice", "terms": ["termination", "without", "notice"], "within": 6, "level": "high", "weight": 2.0},
+    {"name": "Unlimited indemnity", "terms": ["indemnity", "unlimited"], "within": 6, "level": "high", "weight": 2.0},
+    {"name": "Unlimited liability", "terms": ["liability", "unlimited"], "within": 4, "level": "high", "weight": 2.0},
+    {"name": "Non-refundable deposit", "terms": ["deposit", "non-refundable"], "within": 5, "level": "high", "weight": 1.5},
+    {"name": "Waiver of rights", "terms": ["waive", "rights"], "within": 4, "level": "high", "weight": 1.5},
+    {"name": "Unilateral amendment", "terms": ["amend", "sole discretion"], "within": 10, "level": "medium", "weight": 1.0},
+    {"name": "Automatic renewal", "terms": ["renew", "automatically"], "within": 4, "level": "medium", "weight": 0.8}
+]
+
+# Risk scoring
+RISK_LEVEL_WEIGHTS = {"high": 1.0, "medium": 0.4}  # Weight of a risk term that has no weight of its own
+RISK_SCORE_THRESHOLDS = {"High": 5.0, "Medium": 1.2}  # Weighted score at which a document reaches each overall level
+RISK_LEXICON_DIR = os.environ.get(
+    "JUSTICEAI_RISK_LEXICONS",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "risk_lexicons")
+)  # Directory of JSON risk lexicons, one per contract type
+DEFAULT_RISK_LEXICON = "default"  # Lexicon built from HIGH_RISK_TERMS and MEDIUM_RISK_TERMS
+RISK_MATCHER_CACHE_SIZE = 32  # Maximum number of compiled risk matchers kept in memory
+RISK_TOP_CLAUSES = 5  # Number of riskiest clauses listed in document analysis results
+RISK_SNIPPET_CONTEXT = 120  # Characters of context kept on each side of a risk hit in snippet mode
+RISK_SNIPPET_MAX_LENGTH = 1000  # Longest snippet that nearby risk hits are merged into
+RISK_BATCH_WORKERS = 0  # Worker processes for batch risk analysis (0 for one per CPU)
+RISK_MATCH_INFLECTIONS = True  # Also match plurals of risk terms and verb forms of those marked as verbs
+RISK_FUZZY_MAX_EDITS = 2  # Largest cost of the OCR character confusions corrected per word when fuzzy matching
+RISK_FUZZY_LOOKUP_CACHE_SIZE = 200000  # Maximum number of document words whose fuzzy lookups are remembered
+RISK_FUZZY_LETTER_CONFUSION_COST = 2  # Edits charged for a letter-for-letter OCR confusion such as rn/m; a digit confusion such as l/1 costs one
+
+# Document result cache
+DOCUMENT_CACHE_SIZE = 64  # Maximum number of analyzed documents and extracted texts kept in memory
+DOCUMENT_CACHE_TEXT_BYTES = 64 * 1024 * 1024  # Largest total size in bytes of the extracted texts kept in memory
+DOCUMENT_CACHE_DIR = os.environ.get("JUSTICEAI_DOCUMENT_CACHE")  # Directory for on-disk cached results (None for memory only)
+DOCUMENT_CACHE_DISK_ENTRIES = 1000  # Maximum number of analyses kept on disk, least recently used removed first
+
 # GUI related configurations
 PADDING = {
     "small": 5,
@@ -10,11 +10,10 @@ import os
 import time
 
 # Local imports
-from config import SUPPORTED_FILE_TYPES, COLORS, FONTS, PADDING
+from config import SUPPORTED_FILE_TYPES, COLORS, FONTS, PADDING, RISK_TOP_CLAUSES, RISK_SNIPPET_CONTEXT
 from utils.document_processor import DocumentProcessor
 from utils.ocr import extract_text_from_image
-from analysis.summarizer import summarize_text
-from analysis.risk_analyzer import analyze_risks
+from analysis.document_cache import extract_document_text, analyze_document
 
 class DocumentTab(ttk.Frame):
     """Tab for document upload and analysis"""
@@ -165,7 +164,7 @@ class DocumentTab(ttk.Frame):
             self.progress_var.set(10)
             
             # Extract text from document
-            self.extracted_text = self.document_processor.extract_text(self.current_file)
+            self.extracted_text = extract_document_text(self.document_processor, self.current_file)
             self.progress_var.set(40)
             
             if not self.extracted_text:
@@ -176,14 +175,15 @@ class DocumentTab(ttk.Frame):
             self.update_text_widget(self.extracted_text_widget, self.extracted_text)
             self.progress_var.set(60)
             
-            # Generate summary
-            summary = summarize_text(self.extracted_text)
+            # Summarize and analyze risks, tolerating OCR misspellings in scanned
+            # images; a document analyzed before is served from the cache
+            summary, risk_result = analyze_document(
+                self.extracted_text, top_clauses=RISK_TOP_CLAUSES,
+                fuzzy=self.document_processor.is_ocr_document(self.current_file),
+                snippet_context=RISK_SNIPPET_CONTEXT)
             self.update_text_widget(self.summary_text_widget, summary)
             self.progress_var.set(80)
             
-            # Perform risk analysis
-            risk_result = analyze_risks(self.extracted_text)
-            
             # Update risk analysis view
             self.update_risk_analysis(risk_result)
             self.progress_var.set(100)
@@ -229,6 +229,18 @@ class DocumentTab(ttk.Frame):
             overview_text += f"High Risk Terms: {risk_scores.get('high_risk_count', 0)}\n"
             overview_text += f"Medium Risk Terms: {risk_scores.get('medium_risk_count', 0)}\n"
             
+            rule_matches = risk_result.get("rule_matches", [])
+            if rule_matches:
+                overview_text += "\nRisky Patterns:\n"
+                for hit in rule_matches:
+                    overview_text += f"• {hit['rule']}: \"{hit['text']}\"\n"
+            
+            risky_clauses = risk_result.get("risky_clauses", [])
+            if risky_clauses:
+                overview_text += "\nRiskiest Clauses:\n"
+                for number, clause in enumerate(risky_clauses, 1):
+                    overview_text += f"{number}. {clause['text']}\n"
+            
             self.risk_overview_text.insert(tk.END, overview_text)
             self.risk_overview_text.config(state=tk.DISABLED)
             
@@ -236,16 +248,18 @@ class DocumentTab(ttk.Frame):
             self.risk_detail_text.config(state=tk.NORMAL)
             self.risk_detail_text.delete(1.0, tk.END)
             
-            # Add highlighted text with risky terms
-            highlighted_text = risk_result.get("highlighted_text", "")
-            if highlighted_text:
-                self.risk_detail_text.insert(tk.END, highlighted_text)
-            
-            # Apply highlighting based on positions
-            for term_type, positions in risk_result.get("highlight_positions", {}).items():
-                tag_name = f"{term_type}_risk"
-                for start, end in positions:
-                    self.risk_detail_text.tag_add(tag_name, f"1.{start}", f"1.{end}")
+            # Add the risk terms in context, one snippet per paragraph
+            for snippet in risk_result.get("snippets", []):
+                prefix = "… " if snippet["start"] > 0 else ""
+                suffix = " …" if snippet["end"] < len(self.extracted_text) else ""
+                base = self.risk_detail_text.index(f"{tk.END}-1c")
+                self.risk_detail_text.insert(tk.END, prefix + snippet["text"] + suffix + "\n\n")
+                
+                # Apply highlighting at offsets relative to the snippet
+                for start, end, level in snippet["highlights"]:
+                    self.risk_detail_text.tag_add(f"{level}_risk",
+                                                  f"{base}+{len(prefix) + start}c",
+                                                  f"{base}+{len(prefix) + end}c")
             
             self.risk_detail_text.config(state=tk.DISABLED)
         
@@ -10,6 +10,7 @@ import threading
 # Local imports
 from config import COLORS, FONTS, PADDING
 from analysis.question_answering import get_answer_for_question
+from analysis.question_suggester import get_question_trie, suggest_questions
 from data.legal_faq import LEGAL_FAQ_CATEGORIES
 
 class QuestionTab(ttk.Frame):
@@ -22,6 +23,9 @@ class QuestionTab(ttk.Frame):
         # Initialize state variables
         self.is_processing = False
         
+        # Build the autocomplete trie up front so the first keystroke is instant
+        get_question_trie()
+        
         # Create UI components
         self.create_widgets()
         
@@ -42,10 +46,18 @@ class QuestionTab(ttk.Frame):
         self.question_entry = ttk.Entry(input_frame, font=FONTS["body"], width=60)
         self.question_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, PADDING["small"]))
         self.question_entry.bind("<Return>", lambda e: self.submit_question())
+        self.question_entry.bind("<KeyRelease>", self.on_question_typed)
+        self.question_entry.bind("<Down>", self.focus_suggestions)
         
         submit_btn = ttk.Button(input_frame, text="Submit", command=self.submit_question)
         submit_btn.pack(side=tk.LEFT)
         
+        # Autocomplete suggestions, shown only while there are matches
+        self.suggestion_list = tk.Listbox(question_frame, font=FONTS["body"], height=0, activestyle="none")
+        self.suggestion_list.bind("<ButtonRelease-1>", self.on_suggestion_selected)
+        self.suggestion_list.bind("<Return>", self.on_suggestion_selected)
+        self.suggestion_list.bind("<Escape>", lambda e: self.hide_suggestions())
+        
         # Category selector
         category_frame = ttk.Frame(question_frame)
         category_frame.pack(fill=tk.X, pady=(0, PADDING["medium"]))
@@ -124,8 +136,52 @@ class QuestionTab(ttk.Frame):
                     col = 0
                     row += 1
     
+    def on_question_typed(self, event=None):
+        """Refresh autocomplete suggestions as the question is typed"""
+        if event is not None and event.keysym in ("Return", "Down", "Up", "Escape"):
+            if event.keysym == "Escape":
+                self.hide_suggestions()
+            return
+        
+        category = None
+        if self.category_var.get() != "All Categories":
+            category = self.category_var.get()
+        
+        suggestions = suggest_questions(self.question_entry.get(), category)
+        if not suggestions:
+            self.hide_suggestions()
+            return
+        
+        self.suggestion_list.delete(0, tk.END)
+        for suggestion in suggestions:
+            self.suggestion_list.insert(tk.END, suggestion)
+        self.suggestion_list.config(height=len(suggestions))
+        
+        if not self.suggestion_list.winfo_ismapped():
+            self.suggestion_list.pack(fill=tk.X, after=self.question_entry.master)
+    
+    def focus_suggestions(self, event=None):
+        """Move keyboard focus from the entry into the suggestion list"""
+        if self.suggestion_list.winfo_ismapped():
+            self.suggestion_list.focus_set()
+            self.suggestion_list.selection_clear(0, tk.END)
+            self.suggestion_list.selection_set(0)
+            self.suggestion_list.activate(0)
+    
+    def on_suggestion_selected(self, event=None):
+        """Ask the suggestion picked from the list"""
+        selection = self.suggestion_list.curselection()
+        if selection:
+            self.load_question(self.suggestion_list.get(selection[0]))
+    
+    def hide_suggestions(self):
+        """Clear and hide the suggestion list"""
+        self.suggestion_list.delete(0, tk.END)
+        self.suggestion_list.pack_forget()
+    
     def load_question(self, question):
         """Load a question into the entry field"""
+        self.hide_suggestions()
         self.question_entry.delete(0, tk.END)
         self.question_entry.insert(0, question)
         self.submit_question()
@@ -142,6 +198,7 @@ class QuestionTab(ttk.Frame):
             return
         
         self.is_processing = True
+        self.hide_suggestions()
         self.status_var.set("Searching for answer...")
         self.update_answer_text("Searching for the most relevant answer...")
         
@@ -0,0 +1,9 @@
+"""
+Shared pytest configuration for the JusticeAI tests.
+"""
+
+import os
+import sys
+
+# Add the project root to path to ensure imports work
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,45 @@
+"""
+Tests for the JSON API of the web application.
+"""
+
+import io
+
+import pytest
+
+# Local imports
+from app import app
+
+@pytest.fixture
+def client():
+    app.config['TESTING'] = True
+    return app.test_client()
+
+@pytest.mark.parametrize("category", [["Tenant Rights"], {"name": "Tenant Rights"}, 3])
+def test_ask_batch_rejects_non_string_category(client, category):
+    response = client.post('/api/ask_batch', json={'questions': ["Can my landlord evict me?"],
+                                                   'category': category})
+
+    assert response.status_code == 400
+    assert "category" in response.get_json()['error']
+
+def test_ask_batch_answers_every_question(client):
+    response = client.post('/api/ask_batch', json={'questions': ["Can my landlord evict me?", ""],
+                                                   'category': "All Categories"})
+
+    assert response.status_code == 200
+    assert len(response.get_json()['results']) == 2
+
+def test_document_result_page_survives_session_writes(client):
+    document = (io.BytesIO(b"The tenant shall forfeit the deposit. Termination without notice applies."), "lease.txt")
+    response = client.post('/document_analysis', data={'file': document}, content_type='multipart/form-data')
+    assert response.status_code == 302
+
+    # A failed upload leaves a flash message, so the next page rewrites the session
+    document = (io.BytesIO(b"The tenant shall pay rent."), "other.txt")
+    client.post('/document_analysis', data={'file': document, 'lexicon': "no-such-lexicon"},
+                content_type='multipart/form-data')
+
+    response = client.get('/document_analysis_result')
+
+    assert response.status_code == 200
+    assert b"forfeit" in response.data
@@ -0,0 +1,47 @@
+"""
+Tests for the bounded LRU cache.
+"""
+
+# Local imports
+import utils.cache as cache
+from utils.cache import LRUCache
+
+def test_least_recently_used_entry_is_evicted():
+    lru = LRUCache(max_size=2)
+    lru.put("a", 1)
+    lru.put("b", 2)
+    assert lru.get("a") == 1
+    lru.put("c", 3)
+
+    assert lru.get("b") is None
+    assert (lru.get("a"), lru.get("c")) == (1, 3)
+    assert lru.stats()["evictions"] == 1
+
+def test_entries_expire_after_their_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    lru = LRUCache(max_size=10, ttl=5)
+    lru.put("answer", "yes")
+
+    now[0] += 4.9
+    assert lru.get("answer") == "yes"
+    now[0] += 0.2
+    assert lru.get("answer", "expired") == "expired"
+
+    stats = lru.stats()
+    assert (stats["hits"], stats["misses"], stats["expirations"], stats["size"]) == (1, 1, 1, 0)
+
+def test_byte_budget_evicts_until_it_fits():
+    lru = LRUCache(max_size=10, max_bytes=10, sizeof=len)
+    lru.put("a", "aaaa")
+    lru.put("b", "bbbb")
+    lru.put("a", "aa")
+    lru.put("c", "cccccc")
+
+    assert lru.get("b") is None
+    assert (lru.get("a"), lru.get("c")) == ("aa", "cccccc")
+    assert lru.stats()["bytes"] == 8
+
+    lru.put("huge", "x" * 11)
+    assert lru.get("huge") is None
+    assert len(lru) == 2
@@ -0,0 +1,56 @@
+"""
+Tests for category-routed FAQ search.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+# Local imports
+from analysis.category_router import CategoryRouter
+from analysis.faq_index import QuestionIndex
+
+CATEGORY_WORDS = {
+    "Tenancy": ["tenant", "landlord", "deposit", "rent", "lease", "eviction", "notice"],
+    "Employment": ["salary", "employer", "gratuity", "resignation", "overtime", "leave"],
+    "Consumer": ["refund", "consumer", "defective", "warranty", "seller", "complaint"],
+}
+
+def build_qa_pairs(size, seed=0):
+    rng = random.Random(seed)
+    categories = list(CATEGORY_WORDS)
+    qa_pairs = []
+    for number in range(size):
+        category = categories[number % len(categories)]
+        words = rng.sample(CATEGORY_WORDS[category], 4) + [f"case{number % 50}"]
+        qa_pairs.append({"question": " ".join(words), "answer": f"Answer {number}", "category": category})
+    return qa_pairs
+
+@pytest.mark.parametrize("engine", ["brute", "lsa"])
+def test_routed_scores_match_global_scores(engine):
+    qa_pairs = build_qa_pairs(300)
+    index = QuestionIndex(qa_pairs, engine=engine)
+    router = CategoryRouter(index, min_confidence=0.0)
+    queries = [" ".join(qa["question"].split()[:3]) for qa in qa_pairs[:30]]
+
+    routed_indices, routed_scores = router.top_k(queries, 5)
+    global_indices, global_scores = index.top_k(queries, len(qa_pairs))
+
+    for row in range(len(queries)):
+        scores_by_row = dict(zip(global_indices[row], global_scores[row]))
+        expected = [scores_by_row[index_row] for index_row in routed_indices[row]]
+        np.testing.assert_allclose(routed_scores[row], expected, atol=1e-6)
+
+def test_confident_queries_never_search_the_whole_faq(monkeypatch):
+    index = QuestionIndex(build_qa_pairs(300), engine="brute")
+    router = CategoryRouter(index, min_confidence=0.0)
+
+    def global_search(*args, **kwargs):
+        raise AssertionError("routed query fell back to the whole FAQ")
+
+    monkeypatch.setattr(index, "top_k_vectors", global_search)
+    indices, scores = router.top_k(["unrelated words only", "tenant deposit rent"], 3)
+
+    assert len(indices[1]) == 3
+    assert router.qa_pairs[indices[1][0]]["category"] == "Tenancy"
@@ -0,0 +1,82 @@
+"""
+Tests for the document result cache.
+"""
+
+import os
+
+import pytest
+
+# Local imports
+import analysis.document_cache as document_cache
+from analysis.risk_lexicon import get_risk_lexicon
+
+class FakeProcessor:
+    def extract_text(self, file_path):
+        return "The tenant shall forfeit the deposit."
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(document_cache, "DOCUMENT_CACHE_DIR", str(tmp_path))
+    document_cache.clear_document_cache()
+    yield tmp_path
+    document_cache.clear_document_cache()
+
+def test_extracted_text_stays_in_memory(cache_dir):
+    document = cache_dir / "lease.txt"
+    document.write_text("lease")
+
+    text = document_cache.extract_document_text(FakeProcessor(), str(document))
+
+    assert text == "The tenant shall forfeit the deposit."
+    assert not list(cache_dir.glob("*.json"))
+
+def test_text_cache_stays_within_its_byte_budget(cache_dir, monkeypatch):
+    monkeypatch.setattr(document_cache, "_text_cache",
+                        document_cache.LRUCache(100, max_bytes=5000, sizeof=document_cache.sys.getsizeof))
+
+    class LargeTextProcessor:
+        def extract_text(self, file_path):
+            return "deposit " * 250
+
+    for number in range(10):
+        document = cache_dir / f"scan{number}.txt"
+        document.write_text(str(number))
+        document_cache.extract_document_text(LargeTextProcessor(), str(document))
+
+    stats = document_cache.get_document_cache_stats()["text"]
+    assert stats["bytes"] <= 5000
+    assert stats["size"] == 2
+    assert stats["evictions"] == 8
+
+def test_fuzzy_edit_counts_are_cached_apart(cache_dir):
+    text = "The tenant bears 1iabi1ity for the premises."
+    one_edit = document_cache.analyze_document(text, fuzzy=1)[1]["risk_scores"]
+    two_edits = document_cache.analyze_document(text, fuzzy=2)[1]["risk_scores"]
+
+    assert two_edits["high_risk_count"] > one_edit["high_risk_count"]
+    assert document_cache.analyze_document(text, fuzzy=True)[1]["risk_scores"] == two_edits
+
+def test_disk_tier_keeps_the_most_recent_entries(cache_dir, monkeypatch):
+    monkeypatch.setattr(document_cache, "DOCUMENT_CACHE_DISK_ENTRIES", 3)
+
+    for number in range(5):
+        document_cache.analyze_document(f"Agreement {number}. The deposit is non-refundable.")
+        for offset, path in enumerate(sorted(cache_dir.glob("*.json"), key=os.path.getmtime)):
+            os.utime(path, (offset, offset))
+
+    assert len(list(cache_dir.glob("*.json"))) == 3
+    document_cache.clear_document_cache()
+    assert document_cache._get(document_cache.document_cache_key(
+        "Agreement 4. The deposit is non-refundable.", document_cache.SUMMARIZATION_RATIO, get_risk_lexicon(None),
+        fuzzy=0, top_clauses=0, snippet_context=0)) is not None
+
+def test_key_depends_on_matching_settings(monkeypatch):
+    lexicon = get_risk_lexicon(None)
+    key = document_cache.document_cache_key("text", 0.3, lexicon)
+
+    monkeypatch.setattr(document_cache, "RISK_MATCH_INFLECTIONS", not document_cache.RISK_MATCH_INFLECTIONS)
+    assert document_cache.document_cache_key("text", 0.3, lexicon) != key
+
+    monkeypatch.undo()
+    monkeypatch.setattr(document_cache, "RISK_FUZZY_MAX_EDITS", document_cache.RISK_FUZZY_MAX_EDITS + 1)
+    assert document_cache.document_cache_key("text", 0.3, lexicon) != key
@@ -0,0 +1,98 @@
+"""
+Tests for the live-editable FAQ index.
+"""
+
+import numpy as np
+import pytest
+
+# Local imports
+import analysis.faq_index as faq_index_module
+from analysis.faq_index import DeltaQuestionIndex, FAQIndex
+
+TOPICS = {
+    "Tenant Rights": ["landlord", "deposit", "rent", "eviction", "lease", "repairs"],
+    "Employment Law": ["employer", "salary", "overtime", "leave", "dismissal", "contract"]
+}
+
+def build_faq(questions_per_category=20):
+    return {
+        category: {f"What about {words[number % len(words)]} case {number}?": f"Answer {number}."
+                   for number in range(questions_per_category)}
+        for category, words in TOPICS.items()
+    }
+
+def test_router_covers_edited_questions():
+    faq_index = FAQIndex(build_faq())
+    assert faq_index.get_router() is not None
+    faq_index.add_question("Employment Law", "Can I claim unpaid gratuity?", "Yes, within a year.")
+    assert isinstance(faq_index.get(None), DeltaQuestionIndex)
+
+    # Searches use the edited index directly while the router is rebuilt
+    assert faq_index.get_router() is None
+    assert isinstance(faq_index.get_searcher(), DeltaQuestionIndex)
+    faq_index.wait_for_refresh()
+
+    router = faq_index.get_router()
+    assert router is not None
+    assert not isinstance(faq_index.get(None), DeltaQuestionIndex)
+    indices, _ = router.top_k(["can i claim unpaid gratuity"], 1)
+    assert router.qa_pairs[indices[0][0]]["question"] == "Can I claim unpaid gratuity?"
+
+def test_router_drops_removed_questions():
+    faq_index = FAQIndex(build_faq())
+    faq_index.get_router()
+    removed = "What about overtime case 2?"
+    assert faq_index.remove_question("Employment Law", removed)
+
+    faq_index.get_router()
+    faq_index.wait_for_refresh()
+    router = faq_index.get_router()
+
+    assert len(router) == 39
+    assert all(qa["question"] != removed for qa in router.qa_pairs)
+
+def test_edits_during_a_refresh_are_picked_up():
+    faq_index = FAQIndex(build_faq())
+    faq_index.get_router()
+    faq_index.add_question("Tenant Rights", "Who pays for plumbing repairs?", "Usually the landlord.")
+    faq_index.get_router()
+    faq_index.add_question("Tenant Rights", "Can rent be raised mid-lease?", "Not without a clause.")
+    faq_index.get_router()
+    faq_index.wait_for_refresh()
+
+    router = faq_index.get_router()
+    questions = {qa["question"] for qa in router.qa_pairs}
+    assert {"Who pays for plumbing repairs?", "Can rent be raised mid-lease?"} <= questions
+
+def is_mapped(array):
+    while isinstance(array, np.ndarray) and not isinstance(array, np.memmap):
+        array = array.base
+    return isinstance(array, np.memmap)
+
+@pytest.mark.parametrize("engine", ["brute", "inverted"])
+def test_mapped_artifact_answers_like_the_fitted_index(tmp_path, monkeypatch, engine):
+    if engine == "inverted":
+        monkeypatch.setattr(faq_index_module, "FAQ_INVERTED_INDEX_MIN_QUESTIONS", 0)
+    faq = build_faq()
+    fitted = FAQIndex(faq)
+    fitted.save(str(tmp_path))
+
+    loaded = FAQIndex.load(str(tmp_path), faq)
+    queries = ["what about the deposit case 7", "salary overtime", "eviction lease case 12"]
+
+    for category in [None] + list(TOPICS):
+        index = loaded.get(category)
+        assert is_mapped(index.question_matrix.data) and is_mapped(index.question_matrix.indices)
+        assert (index.inverted_index is not None) == (engine == "inverted")
+        assert index.qa_pairs == fitted.get(category).qa_pairs
+
+        expected_indices, expected_scores = fitted.get(category).top_k(queries, 5)
+        indices, scores = index.top_k(queries, 5)
+        for row in range(len(queries)):
+            np.testing.assert_array_equal(indices[row], expected_indices[row])
+            np.testing.assert_allclose(scores[row], expected_scores[row])
+
+def test_artifact_of_other_faq_data_is_rejected(tmp_path):
+    FAQIndex(build_faq()).save(str(tmp_path))
+    with pytest.raises(ValueError):
+        FAQIndex.load(str(tmp_path), build_faq(questions_per_category=21))
@@ -0,0 +1,75 @@
+"""
+Tests for OCR-tolerant risk term matching.
+"""
+
+import pytest
+
+# Local imports
+from analysis.fuzzy_matcher import FuzzyTermIndex, ocr_corrections
+from analysis.risk_analyzer import analyze_risks
+
+SURFACE_FORMS = {form: form for form in ("termination", "liability", "modification", "representation",
+                                         "waiver", "breach", "indemnity", "damages", "notice period")}
+
+@pytest.fixture
+def index():
+    return FuzzyTermIndex(SURFACE_FORMS, max_edits=2)
+
+@pytest.mark.parametrize("token, term", [
+    ("terrnination", "termination"),
+    ("1iability", "liability"),
+    ("iiability", "liability"),
+    ("indernnity", "indemnity"),
+    ("1iabi1ity", "liability"),
+    ("damage5", "damages"),
+    ("wa1ver", "waiver"),
+    ("moclification", "modification"),
+])
+def test_ocr_misreadings_are_matched(index, token, term):
+    assert index.lookup(token) == {term}
+
+@pytest.mark.parametrize("token", [
+    "determination", "germination", "stability", "viability", "reliability",
+    "notification", "representative", "waiter", "breath", "bleach",
+])
+def test_other_words_are_not_matched(index, token):
+    assert index.lookup(token) == frozenset()
+
+# Real words one letter confusion away from a lexicon word of eight letters or fewer
+@pytest.mark.parametrize("term, token", [
+    ("modern", "modem"), ("corner", "comer"), ("cornet", "comet"), ("stern", "stem"),
+    ("horned", "homed"), ("comet", "cornet"), ("clash", "dash"), ("clone", "done"),
+    ("cloth", "doth"), ("clamp", "damp"), ("close", "dose"), ("clear", "dear"),
+])
+def test_real_words_are_not_read_as_other_real_words(term, token):
+    index = FuzzyTermIndex({term: term}, max_edits=2)
+    assert index.lookup(token) == frozenset()
+
+@pytest.mark.parametrize("token", ["darnages", "vvaiver", "breacli"])
+def test_letter_confusions_need_long_words(index, token):
+    assert index.lookup(token) == frozenset()
+
+def test_short_words_are_not_corrected():
+    index = FuzzyTermIndex({"lien": "lien"}, max_edits=2)
+    assert index.lookup("1ien") == frozenset()
+
+def test_corrections_count_confusions():
+    corrections = ocr_corrections("terrnination", 2)
+    assert corrections["termination"] == 2
+    assert "termination" not in ocr_corrections("terrnination", 1)
+    assert ocr_corrections("1iabi1ity", 2)["liability"] == 2
+    assert "termination" not in ocr_corrections("terrn1nation", 2)
+    assert ocr_corrections("terrnlnation", 2, letter_cost=1)["termination"] == 2
+
+def test_clean_text_scores_the_same_with_fuzzy_matching():
+    text = ("The determination of germination stability, viability and reliability was sent by "
+            "notification to the representative; the waiter took a breath near the bleach.")
+    exact = analyze_risks(text, compact=True)["risk_scores"]
+    fuzzy = analyze_risks(text, compact=True, fuzzy=True)["risk_scores"]
+    assert fuzzy == exact
+    assert fuzzy["score"] == 0
+
+def test_fuzzy_hits_in_text():
+    text = "On terrnination the tenant bears 1iability for damage5."
+    matches = analyze_risks(text, compact=True, fuzzy=True)["highlight_positions"]
+    assert [text[start:end] for start, end in matches["high"]] == ["terrnination", "1iability", "damage5"]
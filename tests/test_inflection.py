@@ -0,0 +1,45 @@
+"""
+Tests for inflected risk term forms.
+"""
+
+import pytest
+
+# Local imports
+from analysis.inflection import expand_term, inflect
+from analysis.risk_analyzer import analyze_risks
+from analysis.risk_lexicon import RiskLexicon, get_risk_lexicon, list_risk_lexicons
+from analysis.risk_matcher import get_risk_matcher
+
+JUNK_FORMS = ["paided", "payed", "liabled", "liables", "renewaled", "disclaimered", "waivered",
+              "notice perioded", "suited", "suiting", "terms", "termination without notices"]
+
+def test_nouns_only_get_a_plural():
+    assert inflect("renewal") == {"renewal", "renewals"}
+    assert inflect("liability") == {"liability", "liabilities"}
+
+def test_verbs_get_verb_forms():
+    assert inflect("terminate", verb=True) == {"terminate", "terminates", "terminated", "terminating"}
+    assert inflect("breach", verb=True) == {"breach", "breaches", "breached", "breaching"}
+
+def test_variants_are_taken_as_written():
+    assert expand_term("payment", ["pay", "paid"]) == {"payment", "payments", "pay", "paid"}
+    assert expand_term("liability", ["liable"]) == {"liability", "liabilities", "liable"}
+
+def test_inflections_mark_verbs_and_fixed_terms():
+    inflections = {"terminate": "verb", "term": "none"}
+    assert "terminated" in expand_term("termination", ["terminate"], inflections)
+    assert expand_term("term", (), inflections) == {"term"}
+    assert expand_term("notice period") == {"notice period", "notice periods"}
+
+@pytest.mark.parametrize("name", list_risk_lexicons())
+def test_lexicons_produce_no_junk_forms(name):
+    surface_forms = get_risk_matcher(get_risk_lexicon(name)).surface_forms
+    assert not [form for form in JUNK_FORMS if form in surface_forms]
+
+def test_unrelated_words_are_not_counted():
+    text = "These terms suited both parties, and the suiting was completed."
+    assert analyze_risks(text, compact=True)["risk_scores"]["score"] == 0
+
+def test_unknown_inflection_kind_is_rejected():
+    with pytest.raises(ValueError):
+        RiskLexicon("test", {"high": ["breach"]}, inflections={"breach": "adjective"})
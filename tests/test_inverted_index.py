@@ -0,0 +1,43 @@
+"""
+Tests for pruned inverted-index retrieval.
+"""
+
+import numpy as np
+import pytest
+from scipy.sparse import random as sparse_random
+from sklearn.preprocessing import normalize
+
+# Local imports
+from analysis.faq_index import QuestionIndex
+from analysis.inverted_index import InvertedIndex
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("k, min_score", [(1, 0.0), (5, 0.0), (10, 0.2)])
+def test_search_matches_brute_force(seed, k, min_score):
+    documents = normalize(sparse_random(400, 60, density=0.05, format='csr', random_state=seed))
+    queries = normalize(sparse_random(30, 60, density=0.1, format='csr', random_state=seed + 100))
+
+    indices, scores = InvertedIndex(documents).search_batch(queries, k, min_score)
+
+    all_scores = (queries @ documents.T).toarray()
+    for row, ids, found in zip(all_scores, indices, scores):
+        expected = np.sort(row)[::-1][:k]
+        expected = expected[(expected > 0) & (expected >= min_score - 1e-9)]
+        # Near-ties may come back in either order, so compare the scores and
+        # check every returned question really has its reported score
+        np.testing.assert_allclose(found, expected)
+        np.testing.assert_allclose(row[ids], found)
+
+def test_inverted_engine_ranks_like_brute_engine():
+    qa_pairs = [{"question": f"Can my {subject} {verb} the {thing}?", "answer": "", "category": "Test"}
+                for subject in ("landlord", "employer", "tenant", "neighbour")
+                for verb in ("keep", "withhold", "raise", "cancel")
+                for thing in ("deposit", "salary", "rent", "lease", "bonus")]
+    queries = ["landlord keep deposit", "employer withhold salary bonus", "cancel lease tenant"]
+
+    brute = QuestionIndex(qa_pairs, engine="brute").top_k(queries, 3)
+    inverted = QuestionIndex(qa_pairs, engine="inverted").top_k(queries, 3)
+
+    for brute_ids, brute_scores, inverted_ids, inverted_scores in zip(*brute, *inverted):
+        np.testing.assert_allclose(inverted_scores, brute_scores)
+        assert inverted_ids[0] == brute_ids[0]
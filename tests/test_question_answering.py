@@ -0,0 +1,54 @@
+"""
+Tests for cached FAQ question answering.
+"""
+
+import pytest
+
+# Local imports
+import analysis.question_answering as question_answering
+from analysis.faq_index import FAQIndex
+
+FAQ = {
+    "Tenant Rights": {
+        "Can my landlord keep my security deposit?": "Only to cover unpaid rent or damage.",
+        "How much notice is needed before eviction?": "Usually one month."
+    },
+    "Employment Law": {
+        "Is overtime paid at a higher rate?": "Yes, at twice the ordinary rate."
+    }
+}
+
+@pytest.fixture
+def faq_index(monkeypatch):
+    faq_index = FAQIndex({category: dict(questions) for category, questions in FAQ.items()})
+    monkeypatch.setattr(question_answering, "get_faq_index", lambda: faq_index)
+    question_answering.clear_answer_cache()
+    yield faq_index
+    question_answering.clear_answer_cache()
+
+def test_repeated_questions_are_answered_from_the_cache(faq_index):
+    first = question_answering.get_answer_for_question("Can my landlord keep my security deposit?")
+    hits = question_answering.get_answer_cache_stats()["hits"]
+
+    second = question_answering.get_answer_for_question("can my  landlord, keep my security deposit?")
+
+    assert second == first
+    assert second["found"]
+    assert question_answering.get_answer_cache_stats()["hits"] == hits + 1
+
+def test_cached_results_are_not_shared_with_callers(faq_index):
+    first = question_answering.get_answer_for_question("Can my landlord keep my security deposit?")
+    first["answer"] = "changed"
+    first["similar_questions"].append("changed")
+
+    second = question_answering.get_answer_for_question("Can my landlord keep my security deposit?")
+    assert second["answer"] == FAQ["Tenant Rights"]["Can my landlord keep my security deposit?"]
+    assert "changed" not in second["similar_questions"]
+
+def test_faq_edits_are_not_hidden_by_the_cache(faq_index):
+    question = "Can my landlord keep my security deposit?"
+    question_answering.get_answer_for_question(question)
+
+    faq_index.update_question("Tenant Rights", question, "Never without an itemised list.")
+
+    assert question_answering.get_answer_for_question(question)["answer"] == "Never without an itemised list."
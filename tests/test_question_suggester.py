@@ -0,0 +1,29 @@
+"""
+Tests for FAQ question autocompletion.
+"""
+
+# Local imports
+from analysis.faq_index import FAQIndex
+from analysis.question_suggester import get_question_trie
+
+FAQ = {
+    "Tenant Rights": {
+        "Can my landlord keep the deposit?": "Only for damage.",
+        "How much notice before eviction?": "Usually one month."
+    },
+    "Employment Law": {
+        "Is overtime paid double?": "In most cases."
+    }
+}
+
+def test_suggestions_follow_faq_edits():
+    faq_index = FAQIndex({category: dict(questions) for category, questions in FAQ.items()})
+    assert get_question_trie(faq_index).suggest("can my") == ["Can my landlord keep the deposit?"]
+
+    faq_index.add_question("Employment Law", "Can my employer cut my salary?", "Not without consent.")
+    faq_index.remove_question("Tenant Rights", "Can my landlord keep the deposit?")
+
+    trie = get_question_trie(faq_index)
+    assert trie.suggest("can my") == ["Can my employer cut my salary?"]
+    assert trie.suggest("can my", category="Tenant Rights") == []
+    assert get_question_trie(faq_index) is trie
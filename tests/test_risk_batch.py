@@ -0,0 +1,45 @@
+"""
+Tests for batch risk analysis.
+"""
+
+import threading
+
+import pytest
+
+# Local imports
+from analysis.risk_batch import analyze_risks_batch
+
+def run(items):
+    return sorted(analyze_risks_batch(items, workers=1), key=lambda result: result["index"])
+
+def test_one_line_text_ending_in_extension_is_text():
+    results = run(["See annex.pdf", "The tenant shall forfeit the deposit, see schedule.txt"])
+
+    assert [result["document"] for result in results] == ["text 1", "text 2"]
+    assert all("error" not in result for result in results)
+    assert results[1]["term_counts"]
+
+def test_existing_and_missing_paths_are_documents(tmp_path):
+    lease = tmp_path / "lease.txt"
+    lease.write_text("The tenant shall forfeit the deposit.")
+    missing = tmp_path / "missing.pdf"
+
+    results = run([str(lease), missing])
+
+    assert results[0]["document"] == str(lease)
+    assert results[0]["term_counts"]
+    assert results[1]["document"] == str(missing)
+    assert "error" in results[1]
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_documents_that_fail_are_reported_as_errors(workers):
+    # A lock can be neither analyzed nor sent to a worker process
+    items = ["The tenant shall forfeit the deposit.", threading.Lock(), 123]
+
+    batch = analyze_risks_batch(items, workers=workers)
+    results = sorted(batch, key=lambda result: result["index"])
+
+    assert [result["document"] for result in results] == ["text 1", "text 2", "text 3"]
+    assert "error" not in results[0] and results[0]["term_counts"]
+    assert all(result["error"] for result in results[1:])
+    assert [row[1] for row in batch.table()[1]] == ["Low", "Error", "Error"]
@@ -0,0 +1,87 @@
+"""
+Tests for weighted risk lexicons and the overall risk level.
+"""
+
+import json
+
+import pytest
+
+# Local imports
+import analysis.risk_lexicon as risk_lexicon
+from analysis.risk_analyzer import analyze_risks
+from analysis.risk_lexicon import RiskLexicon, get_risk_lexicon, list_risk_lexicons
+
+# Default level weights (high 1.0, medium 0.4) and thresholds (High 5.0, Medium 1.2)
+LEXICON = RiskLexicon("counts", {"high": ["waiver"], "medium": ["payment"]})
+
+def document(high, medium):
+    return " ".join(["There is a waiver."] * high + ["A payment is due."] * medium)
+
+@pytest.mark.parametrize("high, medium, overall", [
+    (0, 0, "Low"), (1, 0, "Low"), (0, 2, "Low"),
+    (2, 0, "Medium"), (0, 3, "Medium"), (4, 2, "Medium"),
+    (5, 0, "High"), (3, 5, "High"),
+])
+def test_weighted_levels_agree_with_the_count_thresholds(high, medium, overall):
+    # The count rule this replaced gave the same level for these documents
+    scores = analyze_risks(document(high, medium), lexicon=LEXICON)["risk_scores"]
+    assert (scores["high_risk_count"], scores["medium_risk_count"]) == (high, medium)
+    assert scores["overall"] == overall
+
+def test_one_high_and_one_medium_term_is_medium_risk():
+    # Deliberate change: the count rule called this Low, but the weighted
+    # score of 1.0 + 0.4 reaches the Medium threshold of 1.2
+    scores = analyze_risks(document(1, 1), lexicon=LEXICON)["risk_scores"]
+    assert scores["score"] == pytest.approx(1.4)
+    assert scores["overall"] == "Medium"
+
+@pytest.fixture
+def lexicon_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(risk_lexicon, "RISK_LEXICON_DIR", str(tmp_path))
+    return tmp_path
+
+def write_lexicon(directory, name, data):
+    (directory / f"{name}.json").write_text(json.dumps(data), encoding="utf-8")
+
+def test_lexicon_file_weights_and_thresholds_are_applied(lexicon_dir):
+    write_lexicon(lexicon_dir, "lease", {
+        "thresholds": {"High": 3.0},
+        "terms": {"high": {"eviction": 2.5}, "medium": ["repairs"]}
+    })
+
+    scores = analyze_risks("Eviction follows unpaid repairs.", lexicon="lease")["risk_scores"]
+
+    assert scores["lexicon"] == "lease"
+    assert scores["score"] == pytest.approx(2.9)
+    assert scores["overall"] == "Medium"
+    assert get_risk_lexicon("lease").thresholds == {"High": 3.0, "Medium": 1.2}
+
+def test_edited_lexicon_file_is_reloaded(lexicon_dir):
+    write_lexicon(lexicon_dir, "lease", {"terms": {"high": ["eviction"]}})
+    first = get_risk_lexicon("lease")
+    assert get_risk_lexicon("lease") is first
+
+    write_lexicon(lexicon_dir, "lease", {"terms": {"high": {"eviction": 3.0, "forfeiture": 2.0}}})
+
+    assert get_risk_lexicon("lease").terms["high"] == {"eviction": 3.0, "forfeiture": 2.0}
+
+@pytest.mark.parametrize("data", [
+    {"terms": {"critical": ["eviction"]}},
+    {"terms": {"high": {"eviction": -1}}},
+    {"terms": ["eviction"]},
+])
+def test_invalid_lexicon_files_are_rejected(lexicon_dir, data):
+    write_lexicon(lexicon_dir, "broken", data)
+    with pytest.raises(ValueError):
+        get_risk_lexicon("broken")
+
+@pytest.mark.parametrize("name", ["missing", "../config", "lease.json"])
+def test_unknown_or_unsafe_names_are_rejected(lexicon_dir, name):
+    with pytest.raises(ValueError):
+        get_risk_lexicon(name)
+
+def test_bundled_lexicons_are_listed_after_the_default():
+    names = list_risk_lexicons()
+    assert names[0] == "default"
+    assert {"rental", "employment"} <= set(names)
+    assert all(len(get_risk_lexicon(name)) > 0 for name in names)
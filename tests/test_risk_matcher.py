@@ -0,0 +1,64 @@
+"""
+Tests for single-pass risk term matching.
+"""
+
+import random
+import re
+
+import pytest
+
+# Local imports
+from analysis.risk_matcher import RiskMatcher
+
+LEXICON = {
+    "high": ["termination", "indemnity", "non-refundable", "liability", "waiver", "re-entry"],
+    "medium": ["renewal", "payment", "repairs", "stamp duty", "late fee"]
+}
+
+FILLER = ["the", "tenant", "shall", "Termination", "LIABILITY,", "liabilityx", "stamp", "duty",
+          "late", "fee.", "re-entry", "non-refundable", "payments", "repair", "(waiver)", "renewal;"]
+
+def per_term_scan(text, terms):
+    matches = []
+    for term in terms:
+        for match in re.finditer(r'\b' + re.escape(term.lower()) + r'\b', text.lower()):
+            matches.append((term, match.start(), match.end()))
+    return sorted(matches, key=lambda match: match[1])
+
+@pytest.mark.parametrize("seed", range(10))
+def test_single_pass_matches_per_term_scan(seed):
+    rng = random.Random(seed)
+    text = " ".join(rng.choice(FILLER) for _ in range(500))
+
+    matches = RiskMatcher(LEXICON).find_all(text)
+
+    assert matches == {level: per_term_scan(text, terms) for level, terms in LEXICON.items()}
+
+def test_longest_overlapping_term_wins():
+    matcher = RiskMatcher({"high": ["lock-in", "lock-in period"], "medium": ["notice", "notice period"]})
+    text = "A lock-in period, a lock-in and a notice period after notice."
+
+    matches = matcher.find_all(text)
+
+    assert [text[start:end] for _, start, end in matches["high"]] == ["lock-in period", "lock-in"]
+    assert [text[start:end] for _, start, end in matches["medium"]] == ["notice period", "notice"]
+
+def test_repeated_terms_are_counted_once_per_level():
+    matcher = RiskMatcher({"high": ["damages", "damages"], "medium": ["damages"]})
+
+    matches = matcher.find_compact("Damages are capped.")
+
+    assert matches.count("high") == 1
+    assert matches.count("medium") == 1
+
+def test_compact_matches_agree_with_find_all():
+    rng = random.Random(3)
+    text = " ".join(rng.choice(FILLER) for _ in range(500))
+    matcher = RiskMatcher(LEXICON)
+
+    matches = matcher.find_all(text)
+    compact = matcher.find_compact(text)
+
+    for level in LEXICON:
+        assert compact.terms(level) == matches[level]
+        assert compact[level] == [(start, end) for _, start, end in matches[level]]
@@ -0,0 +1,61 @@
+"""
+Tests for risk snippets around the hits of a document.
+"""
+
+import random
+
+import pytest
+
+# Local imports
+from analysis.risk_analyzer import analyze_risks, risk_snippets
+
+WORDS = ["the", "tenant", "agrees", "that", "rent", "is", "due", "monthly", "and", "penalty",
+         "liability", "payment", "renewal", "without", "notice", "termination", "applies"]
+
+def random_text(words, seed):
+    rng = random.Random(seed)
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+@pytest.mark.parametrize("seed", range(5))
+def test_snippets_cover_every_hit_without_cutting_words(seed):
+    text = random_text(2000, seed)
+    result = analyze_risks(text, compact=True)
+    matches = result["highlight_positions"]
+
+    snippets = risk_snippets(text, matches, result["rule_matches"], context=40, max_length=300)
+
+    spans = [(snippet["start"], snippet["end"]) for snippet in snippets]
+    assert spans == sorted(spans)
+    assert all(end <= next_start for (_, end), (next_start, _) in zip(spans, spans[1:]))
+    for snippet in snippets:
+        start, end = snippet["start"], snippet["end"]
+        assert snippet["text"] == text[start:end]
+        assert end - start <= 300
+        assert start == 0 or text[start - 1].isspace()
+        assert end == len(text) or text[end].isspace()
+        for hit_start, hit_end, level in snippet["highlights"]:
+            assert (start + hit_start, start + hit_end) in matches[level]
+
+    for level in matches:
+        for hit_start, hit_end in matches[level]:
+            assert any(start <= hit_start and hit_end <= end for start, end in spans)
+
+def test_nearby_hits_share_a_snippet_and_distant_hits_do_not():
+    filler = " ".join(["clause"] * 100)
+    text = f"A penalty and a payment apply. {filler} Liability is capped."
+    result = analyze_risks(text, compact=True)
+
+    snippets = risk_snippets(text, result["highlight_positions"], context=30)
+
+    assert len(snippets) == 2
+    assert [snippet["text"][start:end] for snippet in snippets
+            for start, end, _ in snippet["highlights"]] == ["penalty", "payment", "Liability"]
+
+def test_snippet_mode_replaces_the_full_text():
+    text = "Termination without notice is allowed. " + "Rent is due monthly. " * 50
+    result = analyze_risks(text, snippet_context=60)
+
+    assert result["highlighted_text"] == ""
+    assert len(result["snippets"]) == 1
+    assert "Termination without notice" in result["snippets"][0]["text"]
+    assert result["snippets"][0]["rules"] == ["Termination without notice"]
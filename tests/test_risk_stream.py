@@ -0,0 +1,79 @@
+"""
+Tests for streaming risk analysis.
+"""
+
+import random
+import tracemalloc
+
+import pytest
+
+# Local imports
+from analysis.proximity import RuleStream, find_rule_matches
+from analysis.risk_analyzer import analyze_risks, analyze_risks_stream
+from analysis.risk_lexicon import get_risk_lexicon
+
+WORDS = ["the", "tenant", "shall", "pay", "rent", "termination", "without", "notice", "deposit",
+         "non-refundable", "waive", "rights", "unlimited", "liability", "indemnity", "renew",
+         "automatically", "amend", "at", "its", "sole", "discretion", "x", "\n", "(payment)"]
+
+def unpunctuated_text(words, seed=0):
+    rng = random.Random(seed)
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+def split_at_random(text, seed=0):
+    rng = random.Random(seed)
+    cuts = sorted(rng.sample(range(1, len(text)), min(len(text) - 1, 60)))
+    return [text[start:end] for start, end in zip([0] + cuts, cuts + [len(text)])]
+
+def collect(updates):
+    matches = {"high": [], "medium": []}
+    rule_matches = []
+    for update in updates:
+        for level in matches:
+            matches[level] += [(start, end) for _, start, end in update["matches"][level]]
+        rule_matches += update["rule_matches"]
+    return matches, rule_matches, update
+
+@pytest.mark.parametrize("seed", range(20))
+def test_unpunctuated_stream_matches_batch_analysis(seed):
+    text = unpunctuated_text(3000, seed)
+    expected = analyze_risks(text)
+
+    matches, rule_matches, final = collect(analyze_risks_stream(split_at_random(text, seed)))
+
+    assert final["done"]
+    assert rule_matches == expected["rule_matches"]
+    assert matches == expected["highlight_positions"]
+    assert final["risk_scores"]["rule_match_count"] == expected["risk_scores"]["rule_match_count"]
+    assert final["risk_scores"] == expected["risk_scores"]
+
+def test_rule_stream_matches_whole_text_with_sentences():
+    rng = random.Random(7)
+    text = " ".join(rng.choice(WORDS + ["rent.", "notice;", "rights!"]) for _ in range(4000))
+    rules = get_risk_lexicon(None).rules
+
+    stream = RuleStream(rules)
+    hits = []
+    for piece in split_at_random(text, 7):
+        hits += stream.feed(piece)
+    hits += stream.feed("", final=True)
+
+    assert hits == find_rule_matches(text, rules)
+
+def test_unpunctuated_stream_keeps_memory_bounded():
+    chunks = [unpunctuated_text(20000, seed=1)[start:start + 4000] for start in range(0, 120000, 4000)]
+
+    def many_chunks():
+        for _ in range(20):
+            yield from chunks
+
+    tracemalloc.start()
+    try:
+        for _ in analyze_risks_stream(many_chunks()):
+            pass
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # About 2.4 MB of text streamed; only a few chunks may be alive at once
+    assert peak < 1_000_000
@@ -0,0 +1,56 @@
+"""
+Tests for scatter-gather FAQ search.
+"""
+
+import random
+import threading
+
+import numpy as np
+import pytest
+
+# Local imports
+from analysis.faq_index import QuestionIndex
+from analysis.sharded_search import ShardedQuestionIndex
+
+WORDS = ["tenant", "landlord", "deposit", "rent", "notice", "eviction", "salary", "employer",
+         "contract", "court", "consumer", "refund", "police", "complaint", "property", "lease"]
+
+def build_qa_pairs(size, seed=0):
+    rng = random.Random(seed)
+    return [{"question": " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 8))) + f" case{number % 40}",
+             "answer": f"Answer {number}", "category": "General"} for number in range(size)]
+
+@pytest.mark.parametrize("engine", ["brute", "lsa"])
+def test_sharded_search_matches_single_process(engine):
+    index = QuestionIndex(build_qa_pairs(400), engine=engine)
+    queries = [qa["question"] for qa in build_qa_pairs(50, seed=1)]
+    expected_indices, expected_scores = index.top_k(queries, 5)
+
+    sharded = ShardedQuestionIndex(index, 3)
+    try:
+        indices, scores = sharded.top_k(queries, 5)
+    finally:
+        sharded.close()
+
+    for row in range(len(queries)):
+        assert np.array_equal(indices[row], expected_indices[row])
+        assert np.array_equal(scores[row], expected_scores[row])
+
+@pytest.mark.parametrize("close_first", [False, True])
+def test_queries_holding_a_closed_searcher_still_complete(close_first):
+    index = QuestionIndex(build_qa_pairs(400))
+    queries = [qa["question"] for qa in build_qa_pairs(20, seed=1)]
+    expected_indices, _ = index.top_k(queries, 3)
+
+    sharded = ShardedQuestionIndex(index, 2)
+    if close_first:
+        sharded.close()
+    results = []
+    worker = threading.Thread(target=lambda: results.append(sharded.top_k(queries, 3)))
+    worker.start()
+    sharded.close()
+    worker.join()
+
+    indices, _ = results[0]
+    for row in range(len(queries)):
+        assert np.array_equal(indices[row], expected_indices[row])
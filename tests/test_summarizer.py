@@ -0,0 +1,144 @@
+"""
+Tests for extractive summarization.
+"""
+
+import heapq
+import random
+import string
+from collections import Counter
+
+import numpy as np
+import pytest
+from scipy.sparse import csr_matrix
+
+# Local imports
+import analysis.summarizer as summarizer
+from analysis.summarizer import summarize_hierarchical, summarize_text, _score_sentences, _select_sentences
+
+WORDS = ["The", "tenant", "shall", "pay", "rent", "monthly", "landlord", "may", "terminate",
+         "the", "lease", "with", "notice", "deposit", "is", "refundable", "repairs", "(clause)",
+         "tenant's", "Rent,", "within", "days"]
+
+def random_sentences(count, seed):
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 15))) for _ in range(count)]
+
+def numbered_document(count, seed=0):
+    rng = random.Random(seed)
+    return " ".join(f"Clause {number} says {' '.join(rng.choice(WORDS) for _ in range(8))}."
+                    for number in range(count))
+
+def clause_numbers(summary):
+    words = summary.split()
+    return [int(words[position + 1]) for position, word in enumerate(words[:-1]) if word == "Clause"]
+
+def frequency_scores(sentences):
+    """Word-frequency scores computed one sentence at a time"""
+    translator = str.maketrans('', '', string.punctuation)
+    word_frequencies = Counter(" ".join(sentences).translate(translator).lower().split())
+    max_frequency = max(word_frequencies.values())
+
+    scores = []
+    for sentence in sentences:
+        if len(sentence.split()) <= 3:
+            scores.append(-np.inf)
+            continue
+        words = sentence.translate(translator).lower().split()
+        score = sum(word_frequencies[word] / max_frequency for word in words)
+        scores.append(score / max(1, len(words)) ** 0.5)
+    return np.array(scores)
+
+@pytest.mark.parametrize("seed", range(20))
+def test_selection_matches_nlargest(seed):
+    rng = np.random.default_rng(seed)
+    size = int(rng.integers(1, 200))
+    # Few distinct values, so many scores tie, and some sentences unscored
+    scores = rng.integers(0, 6, size).astype(np.float64) / 3
+    scores[rng.random(size) < 0.2] = -np.inf
+    summary_size = int(rng.integers(1, size + 3))
+
+    candidates = [index for index in range(size) if np.isfinite(scores[index])]
+    expected = sorted(heapq.nlargest(summary_size, candidates, key=scores.__getitem__))
+
+    assert _select_sentences(scores, summary_size).tolist() == expected
+
+def test_scores_equal_up_to_rounding_are_ties():
+    scores = np.array([0.1 + 0.2, 0.3, 0.5, 0.3 + 1e-12])
+    assert _select_sentences(scores, 2).tolist() == [0, 2]
+
+@pytest.mark.parametrize("seed", range(10))
+def test_sparse_scores_match_sentence_by_sentence_scores(seed):
+    sentences = random_sentences(300, seed)
+    np.testing.assert_allclose(_score_sentences(sentences), frequency_scores(sentences))
+
+@pytest.mark.parametrize("ratio", [0.05, 0.1, 0.3])
+def test_hierarchical_summary_keeps_the_ratio_of_the_whole_document(ratio):
+    text = numbered_document(2000)
+
+    numbers = clause_numbers(summarize_hierarchical(text, ratio, chunk_size=5000, workers=1))
+
+    assert len(numbers) == max(3, int(2000 * ratio))
+    assert numbers == sorted(set(numbers))
+
+def test_hierarchical_summary_of_chunks_keeps_the_ratio():
+    chunks = [numbered_document(100, seed) for seed in range(10)]
+
+    summary = summarize_hierarchical(iter(chunks), 0.2, workers=1)
+
+    assert len(clause_numbers(summary)) == 200
+
+def test_hierarchical_summary_does_not_depend_on_the_workers():
+    text = numbered_document(1000)
+    assert summarize_hierarchical(text, 0.2, chunk_size=4000, workers=2) == \
+        summarize_hierarchical(text, 0.2, chunk_size=4000, workers=1)
+
+def test_short_input_is_summarized_as_a_whole():
+    text = numbered_document(50)
+    assert summarize_hierarchical(text, 0.2, chunk_size=len(text)) == summarize_text(text, 0.2)
+
+    short = "The tenant pays rent. The landlord repairs the roof."
+    assert summarize_hierarchical(short, 0.2) == short
+    assert summarize_text(short, 0.2) == short
+
+def test_textrank_graph_has_no_self_loops(monkeypatch):
+    graphs = []
+    power_iteration = summarizer._power_iteration
+    monkeypatch.setattr(summarizer, "_power_iteration", lambda graph: graphs.append(graph) or power_iteration(graph))
+
+    summarizer._textrank_scores(random_sentences(300, seed=1))
+
+    assert graphs[0].nnz > 0
+    assert not graphs[0].diagonal().any()
+    assert (graphs[0] != graphs[0].T).nnz == 0
+
+def test_textrank_ranks_the_most_connected_sentence_first():
+    sentences = [
+        "Deposit refund rent notice repairs lease terms apply here",
+        "The deposit refund is due within thirty days",
+        "Rent notice must be given before the lease ends",
+        "Repairs under the lease terms fall on the landlord",
+        "Notice of repairs and rent changes apply here",
+        "Parking spaces are allocated by the society office",
+    ]
+
+    scores = summarizer._textrank_scores(sentences)
+
+    assert int(np.argmax(scores)) == 0
+    assert int(np.argmin(scores)) == 5
+
+def test_power_iteration_matches_dense_pagerank():
+    rng = np.random.default_rng(0)
+    weights = np.triu(rng.random((8, 8)) * (rng.random((8, 8)) < 0.4), 1)
+    weights = weights + weights.T
+    weights[7, :] = weights[:, 7] = 0
+
+    ranks = summarizer._power_iteration(csr_matrix(weights))
+
+    # Rows without links jump anywhere, like the random jumps
+    out_weights = weights.sum(axis=1, keepdims=True)
+    transition = np.where(out_weights > 0, weights / np.where(out_weights > 0, out_weights, 1), 1 / 8)
+    damping = summarizer.TEXTRANK_DAMPING
+    expected = np.linalg.solve(np.eye(8) - damping * transition.T, np.full(8, (1 - damping) / 8))
+
+    np.testing.assert_allclose(ranks, expected, atol=1e-7)
+    assert ranks.sum() == pytest.approx(1.0)
@@ -12,6 +12,12 @@ from PIL import Image
 # Local imports
 from utils.ocr import extract_text_from_image
 
+# Characters read at a time when streaming a plain text file
+TEXT_CHUNK_SIZE = 64 * 1024
+
+# Image formats whose text is read by OCR
+OCR_FILE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.tif', '.tiff')
+
 class DocumentProcessor:
     """Processes documents and extracts text content"""
     
@@ -37,7 +43,7 @@ class DocumentProcessor:
         # Extract text based on file type
         if file_extension == '.pdf':
             return self._extract_text_from_pdf(file_path)
-        elif file_extension in ['.png', '.jpg', '.jpeg', '.tif', '.tiff']:
+        elif file_extension in OCR_FILE_EXTENSIONS:
             return extract_text_from_image(file_path)
         else:
             # Try to read as plain text
@@ -52,6 +58,110 @@ class DocumentProcessor:
                 except Exception:
                     raise ValueError(f"Unsupported file format: {file_extension}")
     
+    def is_ocr_document(self, file_path):
+        """
+        Check whether a document's text is read by OCR
+        
+        OCR text often has one-character errors, so callers can enable
+        fuzzy risk term matching for these documents.
+        
+        Args:
+            file_path (str): Path to the document file
+            
+        Returns:
+            bool: True for image files
+        """
+        return Path(file_path).suffix.lower() in OCR_FILE_EXTENSIONS
+    
+    def iter_text_chunks(self, file_path, chunk_size=TEXT_CHUNK_SIZE):
+        """
+        Extract text from a document file one chunk at a time
+        
+        PDFs are read page by page and text files in fixed-size pieces, so a
+        large document is never held in memory as a single string. Joined
+        together, the chunks equal the text returned by extract_text.
+        
+        Args:
+            file_path (str): Path to the document file
+            chunk_size (int): Characters per chunk for plain text files
+            
+        Yields:
+            str: Consecutive pieces of the document text
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+        
+        file_extension = Path(file_path).suffix.lower()
+        
+        if file_extension == '.pdf':
+            yield from self._iter_pdf_pages(file_path)
+        elif file_extension in OCR_FILE_EXTENSIONS:
+            yield extract_text_from_image(file_path)
+        else:
+            encoding = self._detect_text_encoding(file_path, chunk_size)
+            with open(file_path, 'r', encoding=encoding) as file:
+                while True:
+                    chunk = file.read(chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk
+    
+    def _detect_text_encoding(self, file_path, chunk_size=TEXT_CHUNK_SIZE):
+        """
+        Pick the encoding extract_text would read a plain text file with
+        
+        Args:
+            file_path (str): Path to the text file
+            chunk_size (int): Characters decoded at a time while checking
+            
+        Returns:
+            str: "utf-8" if the whole file decodes as UTF-8, else "latin-1"
+        """
+        try:
+            with open(file_path, 'r', encoding='utf-8') as file:
+                while file.read(chunk_size):
+                    pass
+            return 'utf-8'
+        except UnicodeDecodeError:
+            return 'latin-1'
+    
+    def _iter_pdf_pages(self, file_path):
+        """
+        Extract and clean the text of a PDF one page at a time
+        
+        Args:
+            file_path (str): Path to the PDF file
+            
+        Yields:
+            str: Cleaned text of each page that has any, with the separating
+                 space at the start of every page after the first
+        """
+        emitted = False
+        
+        try:
+            with open(file_path, 'rb') as file:
+                pdf_reader = PyPDF2.PdfReader(file)
+                
+                for page in pdf_reader.pages:
+                    page_text = page.extract_text()
+                    if not page_text:
+                        continue
+                    
+                    # Same whitespace folding as _clean_text applies to the whole document
+                    page_text = re.sub(r'\s+', ' ', page_text).strip()
+                    if not page_text:
+                        continue
+                    
+                    yield (' ' + page_text) if emitted else page_text
+                    emitted = True
+        
+        except Exception as e:
+            raise ValueError(f"Error extracting text from PDF: {str(e)}")
+        
+        # If no text was extracted, fall back to OCR like extract_text
+        if not emitted:
+            yield self._ocr_fallback_for_pdf(file_path)
+    
     def _extract_text_from_pdf(self, file_path):
         """
         Extract text from a PDF file